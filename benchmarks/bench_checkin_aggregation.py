@@ -0,0 +1,92 @@
+"""
+Benchmark do gráfico de frequência do dashboard: leitura dos totais por
+hora (get_hourly_checkin_counts, tabela checkin_daily_stats) e agrupamento
+vetorizado por dia, semana e hora do dia (src.data.checkin_aggregation).
+
+Cria um banco temporário com anos de check-ins sintéticos e mede, para cada
+agrupamento, o tempo total de leitura + agregação do período inteiro.
+Termina com código 1 se a mediana de algum agrupamento passar do limite.
+
+Uso:
+    python benchmarks/bench_checkin_aggregation.py [--years 3] [--checkins-per-day 300]
+        [--members 2000] [--repeat 20] [--budget-ms 100]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# Adiciona o diretório raiz do projeto ao sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.checkin_aggregation import GRANULARITIES, aggregate_checkins
+from src.data.database_manager import DatabaseManager
+from src.data.synthetic_data import generate_checkins, generate_members
+
+
+def run_benchmark(years: int, checkins_per_day: int, members: int, repeat: int, seed: int, budget_ms: float) -> bool:
+    """Executa o benchmark. Retorna True se todos os agrupamentos ficaram dentro do limite."""
+    days = years * 365
+    rng = random.Random(seed)
+    member_data = generate_members(members, rng)
+    per_member = max(1, round(checkins_per_day * days / members))
+
+    within_budget = True
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_manager = DatabaseManager(os.path.join(tmp_dir, "bench_aggregation.db"))
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            db_manager.connect()
+            ids = db_manager.bulk_add_members(member_data)
+            member_ids = [ids[member['nome']] for member in member_data]
+            total = db_manager.bulk_add_checkins(generate_checkins(member_ids, per_member, rng, days=days))
+        print(f"{total:,} check-ins em {days} dias, {members:,} membros "
+              f"(preparação: {time.perf_counter() - start:.1f} s)\n")
+
+        end_day = date.today() + timedelta(days=1)
+        start_day = end_day - timedelta(days=days)
+
+        print(f"{'agrupamento':<12} | {'barras':>7} | {'leitura':>10} | {'agregação':>10} | {'total':>10}")
+        print("-" * 62)
+        for granularity in GRANULARITIES:
+            fetch_times, aggregate_times = [], []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                hours, totals = db_manager.get_hourly_checkin_counts(start_day, end_day)
+                fetched = time.perf_counter()
+                labels, counts = aggregate_checkins(hours, totals, granularity, start_day, end_day)
+                fetch_times.append((fetched - start) * 1000)
+                aggregate_times.append((time.perf_counter() - fetched) * 1000)
+
+            fetch_ms = statistics.median(fetch_times)
+            aggregate_ms = statistics.median(aggregate_times)
+            total_ms = statistics.median(f + a for f, a in zip(fetch_times, aggregate_times))
+            marker = "" if total_ms <= budget_ms else "  ❌ acima do limite"
+            within_budget = within_budget and total_ms <= budget_ms
+            print(f"{granularity:<12} | {len(labels):>7} | {fetch_ms:>7.1f} ms | {aggregate_ms:>7.1f} ms | "
+                  f"{total_ms:>7.1f} ms{marker}")
+
+        db_manager.close()
+
+    print(f"\nLimite: {budget_ms:.0f} ms por atualização do gráfico")
+    return within_budget
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=3, help="anos de histórico")
+    parser.add_argument("--checkins-per-day", type=int, default=300)
+    parser.add_argument("--members", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20, help="medições por agrupamento")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--budget-ms", type=float, default=100.0,
+                        help="tempo máximo (mediana) de leitura + agregação")
+    args = parser.parse_args()
+    ok = run_benchmark(args.years, args.checkins_per_day, args.members, args.repeat, args.seed, args.budget_ms)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,100 @@
+"""
+Benchmark da contagem de check-ins do dia.
+Compara a consulta antiga (DATE(checkin_datetime) = ?) com a contagem por
+intervalo semiaberto (count_checkins_between) e com a soma dos totais
+agregados (checkin_daily_stats) usada por get_checkins_today, à medida que
+o histórico cresce.
+
+Uso:
+    python benchmarks/bench_checkins_today.py [--sizes 10000 100000 1000000 5000000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+# Adiciona o diretório raiz do projeto ao sys.path
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from src.data.database_manager import DatabaseManager
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 5_000_000]
+MEMBERS = 2_000
+REPEAT = 50
+
+
+def seed_checkins(db_manager: DatabaseManager, total: int, checkins_per_day: int = 150):
+    """Insere `total` check-ins distribuídos nos dias anteriores até hoje."""
+    cursor = db_manager.connection.cursor()
+    cursor.executemany(
+        "INSERT INTO membros (nome, plano, estado_plano) VALUES (?, 'Mensal', 'ATIVO')",
+        ((f"Membro {i}",) for i in range(MEMBERS))
+    )
+
+    now = datetime.now()
+    rng = random.Random(42)
+
+    def rows():
+        for i in range(total):
+            day = now - timedelta(days=i // checkins_per_day)
+            moment = day.replace(hour=rng.randint(6, 21), minute=rng.randint(0, 59), second=0)
+            yield rng.randint(1, MEMBERS), moment.strftime(DatabaseManager.DATETIME_FORMAT)
+
+    cursor.executemany("INSERT INTO frequencia (member_id, checkin_datetime) VALUES (?, ?)", rows())
+    db_manager.connection.commit()
+    cursor.execute("ANALYZE")
+
+
+def time_query(run, repeat: int = REPEAT) -> float:
+    """Retorna a mediana, em milissegundos, de `repeat` execuções."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def run_benchmark(sizes):
+    """Executa o benchmark para cada tamanho de histórico."""
+    print(f"{'check-ins':>12} | {'DATE(...) = ?':>14} | {'intervalo':>10} | {'rollup':>10} | {'detalhes':>10}")
+    print("-" * 69)
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_manager = DatabaseManager(os.path.join(tmp_dir, "bench.db"))
+            db_manager.connect()
+            seed_checkins(db_manager, size)
+
+            today_str = datetime.now().strftime('%Y-%m-%d')
+            cursor = db_manager.connection.cursor()
+
+            def legacy_count():
+                cursor.execute(
+                    "SELECT COUNT(*) FROM frequencia WHERE DATE(checkin_datetime) = ?",
+                    (today_str,)
+                ).fetchone()
+
+            def range_count():
+                db_manager.count_checkins_between(*DatabaseManager.day_range(date.today()))
+
+            legacy_ms = time_query(legacy_count, repeat=5)
+            range_ms = time_query(range_count)
+            rollup_ms = time_query(db_manager.get_checkins_today)
+            details_ms = time_query(db_manager.get_checkins_today_details)
+
+            print(f"{size:>12,} | {legacy_ms:>11.3f} ms | {range_ms:>7.3f} ms | "
+                  f"{rollup_ms:>7.3f} ms | {details_ms:>7.3f} ms")
+            db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+    run_benchmark(args.sizes)
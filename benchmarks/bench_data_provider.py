@@ -0,0 +1,178 @@
+"""
+Benchmark de todas as funções públicas de src.data.data_provider (a API
+usada pela interface e pelos workers), com dados sintéticos em diferentes
+escalas e backends.
+
+Para cada backend e número de membros, gera os dados (src.data.synthetic_data),
+instala um DataProvider com esse backend como provider global e mede cada
+função várias vezes, com argumentos variados. Funções novas sem cenário de
+medição são listadas no final.
+
+Uso:
+    python benchmarks/bench_data_provider.py [--sizes 1000,10000,100000]
+        [--backends memory,sqlite] [--checkins-per-member 10] [--repeat 20]
+"""
+import argparse
+import contextlib
+import inspect
+import io
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+# Adiciona o diretório raiz do projeto ao sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data import data_provider
+from src.data.backends import InMemoryBackend, SQLiteBackend
+from src.data.database_manager import DatabaseManager
+from src.data.synthetic_data import generate_checkins, generate_members
+
+# Funções do módulo que não fazem parte da API de dados
+NOT_MEASURED = {'get_provider', 'set_provider'}
+
+
+def build_backend(kind: str, members: int, checkins_per_member: int, seed: int, tmp_dir: str):
+    """Cria o backend `kind` com dados sintéticos. Retorna (backend, total de check-ins)."""
+    rng = random.Random(seed)
+    member_data = generate_members(members, rng)
+
+    if kind == 'memory':
+        checkins = list(generate_checkins(range(1, members + 1), checkins_per_member, rng))
+        return InMemoryBackend(member_data, checkins), len(checkins)
+
+    if kind == 'sqlite':
+        db_manager = DatabaseManager(os.path.join(tmp_dir, f"bench_{members}.db"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            db_manager.connect()
+            ids = db_manager.bulk_add_members(member_data)
+            member_ids = [ids[member['nome']] for member in member_data]
+            total = db_manager.bulk_add_checkins(generate_checkins(member_ids, checkins_per_member, rng))
+        return SQLiteBackend(db_manager), total
+
+    raise ValueError(f"Backend desconhecido: {kind}")
+
+
+def make_scenarios(member_ids, names, rng: random.Random):
+    """
+    Cenários de medição: função -> gerador dos argumentos de cada chamada.
+    As escritas ficam por último, para não alterar os dados das leituras.
+    """
+    created_checkins = []
+
+    def add_checkin_args():
+        return (rng.choice(member_ids), datetime.now())
+
+    def delete_checkin_args():
+        return (created_checkins.pop() if created_checkins else -1,)
+
+    scenarios = {
+        'get_all_members': lambda: (),
+        'find_members_by_name': lambda: (rng.choice(names).split()[0][:4].lower(),),
+        'get_member_by_id': lambda: (rng.choice(member_ids),),
+        'get_birthdays_for_month': lambda: (rng.randint(1, 12),),
+        'get_member_checkin_history': lambda: (rng.choice(member_ids),),
+        'get_member_checkin_count': lambda: (rng.choice(member_ids),),
+        'get_checkins_today': lambda: (),
+        'get_checkins_today_details': lambda: (),
+        'get_last_checkins': lambda: (5,),
+        'get_checkin_stats': lambda: (
+            date.today() - timedelta(days=30),
+            date.today() + timedelta(days=1),
+            rng.choice((('dia',), ('hora',), ('dia', 'plano'))),
+        ),
+        'get_hourly_checkin_counts': lambda: (
+            date.today() - timedelta(days=rng.choice((7, 30, 90))),
+            date.today() + timedelta(days=1),
+        ),
+        'add_member': lambda: ({'nome': f"Benchmark {rng.random():.12f}", 'plano': 'Mensal'},),
+        'update_member': lambda: ({'id': rng.choice(member_ids), 'frequencia': rng.choice(("2x", "3x"))},),
+        'add_checkin': add_checkin_args,
+        'delete_checkin': delete_checkin_args,
+    }
+    return scenarios, created_checkins
+
+
+def measure(func, make_args, repeat: int, on_result=None):
+    """Chama a função `repeat` vezes e retorna os tempos, em ms."""
+    timings = []
+    for _ in range(repeat):
+        args = make_args()
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+        if on_result:
+            on_result(result)
+    return timings
+
+
+def run_benchmark(sizes, backends, checkins_per_member: int, repeat: int, seed: int):
+    """Executa o benchmark completo."""
+    public_functions = {
+        name: func for name, func in inspect.getmembers(data_provider, inspect.isfunction)
+        if not name.startswith('_') and func.__module__ == data_provider.__name__
+        and name not in NOT_MEASURED
+    }
+    unmeasured = set(public_functions)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for kind in backends:
+            for members in sizes:
+                start = time.perf_counter()
+                backend, total_checkins = build_backend(kind, members, checkins_per_member, seed, tmp_dir)
+                setup = time.perf_counter() - start
+
+                previous = data_provider.set_provider(data_provider.DataProvider(backend))
+                try:
+                    all_members = backend.get_all_members()
+                    member_ids = [member['id'] for member in all_members]
+                    names = [member['nome'] for member in all_members]
+                    scenarios, created_checkins = make_scenarios(member_ids, names, random.Random(seed))
+
+                    print(f"\n=== {kind}: {members:,} membros, {total_checkins:,} check-ins "
+                          f"(preparação: {setup:.1f} s) ===")
+                    print(f"{'função':<30} | {'mediana':>10} | {'p95':>10} | {'máximo':>10}")
+                    print("-" * 70)
+                    for name, make_args in scenarios.items():
+                        func = public_functions.get(name)
+                        if func is None:
+                            continue
+                        unmeasured.discard(name)
+                        on_result = created_checkins.append if name == 'add_checkin' else None
+                        # Suprime as mensagens impressas pelos backends (ex: "membro adicionado")
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            timings = measure(func, make_args, repeat, on_result)
+                        timings.sort()
+                        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+                        print(f"{name:<30} | {statistics.median(timings):>7.3f} ms | "
+                              f"{p95:>7.3f} ms | {timings[-1]:>7.3f} ms")
+                finally:
+                    data_provider.set_provider(previous)
+                    backend.close()
+
+    if unmeasured:
+        print(f"\n⚠ Funções sem cenário de medição: {', '.join(sorted(unmeasured))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="números de membros, separados por vírgula")
+    parser.add_argument("--backends", default="memory,sqlite",
+                        help="backends medidos, separados por vírgula (memory, sqlite)")
+    parser.add_argument("--checkins-per-member", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="chamadas medidas por função")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    run_benchmark(
+        [int(size) for size in args.sizes.split(",")],
+        [kind.strip() for kind in args.backends.split(",")],
+        args.checkins_per_member,
+        args.repeat,
+        args.seed,
+    )
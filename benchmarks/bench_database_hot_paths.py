@@ -0,0 +1,273 @@
+"""
+Suíte de benchmarks dos caminhos críticos do DatabaseManager, com
+verificação de regressão contra uma linha de base (baseline) em JSON.
+
+Para cada tamanho, cria um banco temporário com dados sintéticos
+(src.data.synthetic_data) e mede latência (mediana, p95, p99) e vazão de:
+find_members_by_name, get_member_checkin_history (inteiro e a primeira
+página, como na tela de histórico), get_checkins_today,
+get_members_by_birthday_month, update_expired_plans e add_checkin.
+Antes de cada chamada de update_expired_plans (fora da medição), uma parte
+dos planos vencidos volta a ATIVO, para que toda chamada tenha o que
+atualizar. Cada caminho é medido em --rounds rodadas e vale a mediana das
+rodadas (de cada métrica).
+
+Com --save-baseline, grava os resultados como a nova linha de base. Sem ele,
+compara com a linha de base existente e termina com código 1 se algum
+caminho ficou mais lento que o limite (--threshold, relativo à linha de base,
+ignorando diferenças absolutas menores que --min-delta-ms). As linhas de
+base dependem da máquina: gere-as na mesma máquina em que a comparação roda.
+
+Uso:
+    python benchmarks/bench_database_hot_paths.py [--sizes 1000,10000,50000] [--repeat 200] [--rounds 5]
+        [--save-baseline] [--baseline benchmarks/baselines/database_hot_paths.json]
+        [--threshold 0.5] [--min-delta-ms 0.1] [--metric p50_ms]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Adiciona o diretório raiz do projeto ao sys.path
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from src.config import HISTORY_PAGE_SIZE
+from src.data.database_manager import DatabaseManager
+from src.data.synthetic_data import generate_checkins, generate_members
+
+DEFAULT_BASELINE = os.path.join(project_dir, 'benchmarks', 'baselines', 'database_hot_paths.json')
+METRICS = ('p50_ms', 'p95_ms', 'p99_ms')
+
+# Parte dos membros cujo plano vencido volta a ATIVO antes de cada
+# chamada de update_expired_plans (como os vencimentos de um dia)
+EXPIRED_RESET_FRACTION = 0.01
+
+
+def seed_database(path: str, members: int, checkins_per_member: int, seed: int):
+    """Cria o banco com dados sintéticos. Retorna (db_manager, ids dos membros, nomes)."""
+    rng = random.Random(seed)
+    member_data = generate_members(members, rng)
+
+    db_manager = DatabaseManager(path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        db_manager.connect()
+        ids = db_manager.bulk_add_members(member_data)
+        member_ids = [ids[member['nome']] for member in member_data]
+        db_manager.bulk_add_checkins(generate_checkins(member_ids, checkins_per_member, rng))
+    return db_manager, member_ids, [member['nome'] for member in member_data]
+
+
+def hot_paths(db_manager: DatabaseManager, member_ids: List[int], names: List[str], rng: random.Random):
+    """Caminho crítico -> função sem argumentos que executa uma chamada com argumentos variados."""
+    def search_term():
+        # Mistura termos de uma palavra (prefixo) e de duas palavras
+        words = rng.choice(names).split()
+        if rng.random() < 0.5:
+            return words[0][:rng.randint(2, len(words[0]))]
+        return f"{words[0]} {words[-1][:3]}"
+
+    return {
+        'find_members_by_name': lambda: db_manager.find_members_by_name(search_term()),
+        'get_member_checkin_history': lambda: db_manager.get_member_checkin_history(rng.choice(member_ids)),
+        'get_member_checkin_history_page': lambda: db_manager.get_member_checkin_history(
+            rng.choice(member_ids), limit=HISTORY_PAGE_SIZE
+        ),
+        'get_checkins_today': lambda: db_manager.get_checkins_today(),
+        'get_members_by_birthday_month': lambda: db_manager.get_members_by_birthday_month(rng.randint(1, 12)),
+        'update_expired_plans': lambda: db_manager.update_expired_plans(),
+        'add_checkin': lambda: db_manager.add_checkin(rng.choice(member_ids), datetime.now()),
+    }
+
+
+def hot_path_setups(db_manager: DatabaseManager, members: int) -> Dict[str, Callable[[], Any]]:
+    """Caminho crítico -> preparação executada (sem medir) antes de cada chamada."""
+    # Depois da primeira chamada, update_expired_plans não teria mais nada a
+    # atualizar: os mesmos planos vencidos voltam a ATIVO antes de cada uma
+    cursor = db_manager.connection.execute(
+        "SELECT id FROM membros WHERE vencimento_plano > '' AND vencimento_plano < ? ORDER BY id LIMIT ?",
+        (date.today().isoformat(), max(1, int(members * EXPIRED_RESET_FRACTION)))
+    )
+    expired_ids = [(row[0],) for row in cursor.fetchall()]
+
+    def reactivate_expired():
+        db_manager.connection.executemany("UPDATE membros SET estado_plano = 'ATIVO' WHERE id = ?", expired_ids)
+        db_manager.connection.commit()
+
+    return {'update_expired_plans': reactivate_expired}
+
+
+def measure(call: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    """
+    Executa a chamada `repeat` vezes (após uma de aquecimento) e resume os
+    tempos. A preparação (`setup`), se houver, roda antes de cada chamada,
+    fora da medição.
+    """
+    if setup:
+        setup()
+    call()
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+
+    def percentile(fraction: float) -> float:
+        return timings[min(len(timings) - 1, int(len(timings) * fraction))]
+
+    return {
+        'p50_ms': round(statistics.median(timings), 4),
+        'p95_ms': round(percentile(0.95), 4),
+        'p99_ms': round(percentile(0.99), 4),
+        'ops_per_sec': round(1000 * len(timings) / sum(timings), 1) if sum(timings) else 0.0,
+    }
+
+
+def run_suite(sizes: List[int], checkins_per_member: int, repeat: int, rounds: int, seed: int) -> Dict[str, Any]:
+    """
+    Executa a suíte e retorna os resultados no formato da linha de base.
+
+    Cada caminho é medido em `rounds` rodadas, com os mesmos argumentos, e
+    cada métrica fica com a mediana das rodadas: uma rodada atrapalhada
+    pelo ruído da máquina (ou excepcionalmente rápida) não decide o resultado.
+    """
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for members in sizes:
+            start = time.perf_counter()
+            db_manager, member_ids, names = seed_database(
+                os.path.join(tmp_dir, f"bench_{members}.db"), members, checkins_per_member, seed
+            )
+            print(f"\n=== {members:,} membros, ~{members * checkins_per_member:,} check-ins "
+                  f"(preparação: {time.perf_counter() - start:.1f} s) ===")
+            print(f"{'caminho':<32} | {'p50':>9} | {'p95':>9} | {'p99':>9} | {'ops/s':>9}")
+            print("-" * 80)
+
+            setups = hot_path_setups(db_manager, members)
+            round_stats: Dict[str, List[Dict[str, float]]] = {}
+            for _ in range(rounds):
+                for name, call in hot_paths(db_manager, member_ids, names, random.Random(seed)).items():
+                    # Suprime as mensagens impressas pelo DatabaseManager
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        round_stats.setdefault(name, []).append(measure(call, repeat, setups.get(name)))
+
+            size_results = results[str(members)] = {
+                name: {
+                    key: round(statistics.median(stats[key] for stats in all_stats), 4)
+                    for key in all_stats[0]
+                }
+                for name, all_stats in round_stats.items()
+            }
+
+            for name, stats in size_results.items():
+                print(f"{name:<32} | {stats['p50_ms']:>6.3f} ms | {stats['p95_ms']:>6.3f} ms | "
+                      f"{stats['p99_ms']:>6.3f} ms | {stats['ops_per_sec']:>9,.0f}")
+            db_manager.close()
+
+    return {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'machine': platform.platform(),
+            'checkins_per_member': checkins_per_member,
+            'repeat': repeat,
+            'rounds': rounds,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], metric: str,
+            threshold: float, min_delta_ms: float) -> List[str]:
+    """
+    Compara os resultados com a linha de base.
+
+    Returns:
+        Descrição das regressões encontradas (lista vazia se não houver)
+    """
+    regressions = []
+    print(f"\nComparação com a linha de base ({metric}, limite +{threshold:.0%}):")
+    for size, paths in current['results'].items():
+        base_paths = baseline.get('results', {}).get(size)
+        if base_paths is None:
+            print(f"  {size} membros: sem linha de base")
+            continue
+        for name, stats in paths.items():
+            base = base_paths.get(name)
+            if base is None or metric not in base:
+                print(f"  {size} membros, {name}: sem linha de base")
+                continue
+            value, reference = stats[metric], base[metric]
+            change = (value - reference) / reference if reference else 0.0
+            regressed = change > threshold and value - reference > min_delta_ms
+            marker = "❌" if regressed else "✓"
+            print(f"  {marker} {size:>7} membros | {name:<32} | {reference:>8.3f} → {value:>8.3f} ms ({change:+.0%})")
+            if regressed:
+                regressions.append(f"{name} com {size} membros: {reference:.3f} → {value:.3f} ms ({change:+.0%})")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,50000",
+                        help="números de membros, separados por vírgula")
+    parser.add_argument("--checkins-per-member", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=200, help="chamadas medidas por caminho")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="rodadas por caminho (vale a mediana das rodadas)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="arquivo JSON da linha de base")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="grava os resultados como nova linha de base em vez de comparar")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="regressão máxima tolerada, relativa à linha de base (0.5 = +50%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.1,
+                        help="diferenças absolutas menores que isto não contam como regressão")
+    parser.add_argument("--metric", choices=METRICS, default='p50_ms')
+    args = parser.parse_args()
+
+    current = run_suite(
+        [int(size) for size in args.sizes.split(",")],
+        args.checkins_per_member,
+        args.repeat,
+        args.rounds,
+        args.seed,
+    )
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"\n✓ Linha de base gravada em {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠ Linha de base não encontrada ({args.baseline}); use --save-baseline para criá-la.")
+        sys.exit(0)
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, args.metric, args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressão(ões) acima do limite:")
+        for regression in regressions:
+            print(f"  • {regression}")
+        sys.exit(1)
+    print("\n✓ Nenhuma regressão acima do limite")
@@ -0,0 +1,115 @@
+"""
+Benchmark do tempo de importação do ponto de entrada (run.py), medido com
+`python -X importtime`. Falha (código de saída 1) se o tempo total passar
+do orçamento ou se algum módulo proibido for carregado — por padrão, as
+bibliotecas do Google, que não devem ser importadas no modo SQLite.
+
+Cada medição roda em um processo novo; o resultado é a mediana das execuções.
+
+Uso:
+    python benchmarks/bench_import_time.py [--module run] [--budget-ms 1500] [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Prefixos de módulos que não devem ser carregados na inicialização
+DEFAULT_FORBIDDEN = ("google", "googleapiclient", "google_auth_httplib2", "httplib2")
+
+
+def measure_import(module: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Importa o módulo em um processo novo com -X importtime.
+
+    Args:
+        module: Nome do módulo a importar (ex: 'run')
+
+    Returns:
+        Lista de (módulo, tempo próprio em µs, tempo acumulado em µs,
+        nível de aninhamento), na ordem em que as importações terminaram
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f"falha ao importar {module}:\n{tail}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        # "import time:       123 |        456 |     package.module"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def run_benchmark(module: str, budget_ms: float, runs: int, top: int, forbidden: Tuple[str, ...]) -> bool:
+    """Executa o benchmark e retorna True se o orçamento foi respeitado."""
+    totals = []
+    cumulative: Dict[str, List[int]] = {}
+    loaded = set()
+    for _ in range(runs):
+        entries = measure_import(module)
+        loaded.update(name for name, _, _, _ in entries)
+        totals.append(sum(self_us for _, self_us, _, _ in entries) / 1000)
+        for name, _, cumulative_us, depth in entries:
+            if depth == 0:
+                cumulative.setdefault(name, []).append(cumulative_us)
+
+    total_ms = statistics.median(totals)
+    print(f"import {module}: {total_ms:.1f} ms (mediana de {runs} execução(ões); orçamento {budget_ms:.0f} ms)\n")
+
+    print(f"{'módulo (nível superior)':<40} | {'acumulado':>10}")
+    print("-" * 55)
+    slowest = sorted(cumulative.items(), key=lambda item: -statistics.median(item[1]))[:top]
+    for name, values in slowest:
+        print(f"{name:<40} | {statistics.median(values) / 1000:>7.1f} ms")
+
+    loaded_forbidden = sorted(
+        name for name in loaded
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in forbidden)
+    )
+
+    ok = True
+    if loaded_forbidden:
+        print(f"\n❌ Módulos proibidos carregados: {', '.join(loaded_forbidden[:10])}"
+              f"{' ...' if len(loaded_forbidden) > 10 else ''}")
+        ok = False
+    if total_ms > budget_ms:
+        print(f"\n❌ Tempo de importação acima do orçamento: {total_ms:.1f} ms > {budget_ms:.0f} ms")
+        ok = False
+    if ok:
+        print("\n✓ Dentro do orçamento")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="run",
+                        help="módulo importado (padrão: run, o ponto de entrada da GUI)")
+    parser.add_argument("--budget-ms", type=float, default=1500)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10,
+                        help="número de módulos mais lentos exibidos")
+    parser.add_argument("--forbid", default=",".join(DEFAULT_FORBIDDEN),
+                        help="prefixos de módulos proibidos, separados por vírgula ('' para nenhum)")
+    args = parser.parse_args()
+
+    forbidden = tuple(prefix for prefix in args.forbid.split(",") if prefix)
+    try:
+        ok = run_benchmark(args.module, args.budget_ms, max(1, args.runs), args.top, forbidden)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    sys.exit(0 if ok else 1)
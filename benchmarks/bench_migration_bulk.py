@@ -0,0 +1,171 @@
+"""
+Benchmark da gravação da migração Google Sheets → SQLite.
+Gera uma planilha sintética de 12 meses (no mesmo layout das abas reais) e
+compara a gravação linha a linha (add_member/add_checkin, um commit por
+linha) com a gravação em lote (bulk_add_members/bulk_add_checkins).
+Também compara o processamento das abas em um processo e em paralelo
+(parse_workbook) e, por fim, executa migrate_data() completo com um substituto local do
+GoogleSheetsService, contando as requisições feitas à API.
+
+Uso:
+    python benchmarks/bench_migration_bulk.py [--members 1000] [--attendance 0.4]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Adiciona o diretório raiz do projeto e o de scripts ao sys.path
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+sys.path.insert(0, os.path.join(project_dir, 'scripts'))
+
+from src.data.database_manager import DatabaseManager
+from src.config import (
+    COL_NOME, COL_PLANO, COL_VENCIMENTO_PLANO, COL_ESTADO_PLANO,
+    COL_DATA_NASCIMENTO, COL_WHATSAPP, COL_GENERO, COL_FREQUENCIA, COL_CALCADO
+)
+from migrate_data import (
+    SHEET_NAMES, CHECKIN_DATA_START_COL, DAY_HEADER_ROW_INDEX,
+    parse_workbook, build_member_record, migrate_data
+)
+
+ROW_WIDTH = COL_CALCADO + 1
+
+
+def generate_workbook(members: int, attendance: float, rng: random.Random):
+    """
+    Gera {aba: linhas} com 3 linhas de cabeçalho e uma linha por membro.
+    Cada dia do mês ocupa duas colunas: marcação do check-in e período (M/T/N).
+    """
+    workbook = {}
+    for sheet_name in SHEET_NAMES:
+        day_header = [''] * ROW_WIDTH
+        for day in range(1, 32):
+            day_header[CHECKIN_DATA_START_COL + 2 * (day - 1)] = str(day)
+        rows = [[''] * ROW_WIDTH for _ in range(3)]
+        rows[DAY_HEADER_ROW_INDEX] = day_header
+
+        for i in range(members):
+            row = [''] * ROW_WIDTH
+            row[COL_NOME] = f"Membro {i:05d}"
+            row[COL_PLANO] = rng.choice(["Mensal", "Trimestral", "Gympass"])
+            row[COL_VENCIMENTO_PLANO] = f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/2025"
+            row[COL_ESTADO_PLANO] = rng.choice(["ATIVO", "INATIVO"])
+            row[COL_DATA_NASCIMENTO] = f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1960, 2010)}"
+            row[COL_WHATSAPP] = f"119{rng.randint(10000000, 99999999)}"
+            row[COL_GENERO] = rng.choice(["M", "F"])
+            row[COL_FREQUENCIA] = "3x"
+            row[COL_CALCADO] = str(rng.randint(34, 45))
+            for day in range(31):
+                if rng.random() < attendance:
+                    col = CHECKIN_DATA_START_COL + 2 * day
+                    row[col] = "TRUE"
+                    row[col + 1] = rng.choice("MTN")
+            rows.append(row)
+        workbook[sheet_name] = rows
+    return workbook
+
+
+class FakeSheetsService:
+    """Substituto local do GoogleSheetsService que serve a planilha sintética."""
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self.requests = 0
+
+    def read_spreadsheet(self, spreadsheet_id, range_name='A:BT', sheet_name=None):
+        self.requests += 1
+        return self.workbook.get(sheet_name, [])
+
+    def read_sheets(self, spreadsheet_id, sheet_names, range_name='A:BT'):
+        self.requests += 1
+        return {name: self.workbook[name] for name in sheet_names if name in self.workbook}
+
+
+def write_row_by_row(db_manager: DatabaseManager, records, checkins) -> int:
+    """Gravação anterior: um add_member/add_checkin (e um commit) por linha."""
+    membros_migrados = {}
+    for record in records:
+        member_id = db_manager.add_member(dict(record))
+        if member_id:
+            membros_migrados[record['nome']] = member_id
+
+    total = 0
+    for nome, checkin_datetime in checkins:
+        if nome in membros_migrados:
+            db_manager.add_checkin(membros_migrados[nome], checkin_datetime)
+            total += 1
+    return total
+
+
+def write_bulk(db_manager: DatabaseManager, records, checkins) -> int:
+    """Gravação em lote, como no script de migração atual."""
+    membros_migrados = db_manager.bulk_add_members(records)
+    return db_manager.bulk_add_checkins(
+        (membros_migrados[nome], checkin_datetime)
+        for nome, checkin_datetime in checkins
+        if nome in membros_migrados
+    )
+
+
+def run_benchmark(members: int, attendance: float):
+    """Executa o benchmark completo."""
+    workbook = generate_workbook(members, attendance, random.Random(42))
+
+    print(f"{'processamento das abas':>26} | {'tempo':>9}")
+    print("-" * 40)
+    for label, workers in (("1 processo", 1), (f"{os.cpu_count()} processo(s)", None)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            consolidated, checkins = parse_workbook(workbook, workers)
+            elapsed = time.perf_counter() - start
+        print(f"{label:>26} | {elapsed:>7.2f} s")
+    records = [build_member_record(nome, data) for nome, data in consolidated.items()]
+
+    print()
+
+    print(f"{'modo':>14} | {'membros':>8} | {'check-ins':>10} | {'tempo':>9}")
+    print("-" * 52)
+    for label, write in (("linha a linha", write_row_by_row), ("em lote", write_bulk)):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_manager = DatabaseManager(os.path.join(tmp_dir, "bench.db"))
+            # Suprime as mensagens de migração e de "membro adicionado"
+            with contextlib.redirect_stdout(io.StringIO()):
+                db_manager.connect()
+                start = time.perf_counter()
+                total = write(db_manager, records, checkins)
+                elapsed = time.perf_counter() - start
+            db_manager.close()
+        print(f"{label:>14} | {len(records):>8,} | {total:>10,} | {elapsed:>7.2f} s")
+
+    # Migração completa (leitura + processamento + gravação)
+    sheets_service = FakeSheetsService(workbook)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_manager = DatabaseManager(os.path.join(tmp_dir, "bench.db"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            success = migrate_data(sheets_service, db_manager)
+            elapsed = time.perf_counter() - start
+
+            # migrate_data() fecha o banco ao terminar
+            db_manager.connect()
+            migrated_checkins = db_manager.count_checkins_between(datetime(2025, 1, 1), datetime(2026, 1, 1))
+        db_manager.close()
+    print(f"\nmigrate_data(): {'ok' if success else 'FALHOU'} em {elapsed:.2f} s, "
+          f"{sheets_service.requests} requisição(ões) à API, "
+          f"{migrated_checkins:,} check-ins gravados")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, default=1_000)
+    parser.add_argument("--attendance", type=float, default=0.4,
+                        help="probabilidade de check-in de um membro em cada dia")
+    args = parser.parse_args()
+    run_benchmark(args.members, args.attendance)
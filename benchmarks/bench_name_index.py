@@ -0,0 +1,187 @@
+"""
+Benchmark do índice de nomes em memória (NameIndex).
+Indexa nomes sintéticos (com nomes comuns como Silva e Maria muito
+frequentes, como na vida real) e mede a latência das buscas por prefixo (digitação)
+e das buscas aproximadas (erros de digitação), com o coletor de lixo
+ligado, como no aplicativo. Cada tipo de busca roda --rounds vezes e vale
+a mediana dos p99 das rodadas; termina com código 1 se ela passar do
+limite (--budget-ms) ou se a verificação de ordenação falhar (o melhor
+resultado não pode ficar de fora por causa do limite de resultados).
+
+Uso:
+    python benchmarks/bench_name_index.py [--members 100000] [--queries 5000]
+        [--rounds 5] [--budget-ms 1.0]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+# Adiciona o diretório raiz do projeto ao sys.path
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from src.core.name_index import NameIndex
+
+FIRST_NAMES = [
+    "Ana", "João", "Maria", "José", "Antônio", "Francisco", "Carlos", "Paulo",
+    "Pedro", "Lucas", "Luiz", "Marcos", "Luís", "Gabriel", "Rafael", "Daniel",
+    "Marcelo", "Bruno", "Eduardo", "Felipe", "Raimundo", "Rodrigo", "Juliana",
+    "Márcia", "Fernanda", "Patrícia", "Aline", "Adriana", "Sandra", "Camila",
+    "Amanda", "Bruna", "Jéssica", "Letícia", "Júlia", "Luciana", "Vanessa",
+    "Mariana", "Gabriela", "Vitória", "Beatriz", "Larissa", "Thiago", "Mateus",
+]
+LAST_NAMES = [
+    "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves",
+    "Pereira", "Lima", "Gomes", "Costa", "Ribeiro", "Martins", "Carvalho",
+    "Almeida", "Lopes", "Soares", "Fernandes", "Vieira", "Barbosa", "Rocha",
+    "Dias", "Nascimento", "Andrade", "Moreira", "Nunes", "Marques", "Machado",
+    "Mendes", "Freitas", "Cardoso", "Ramos", "Gonçalves", "Santana", "Teixeira",
+]
+
+
+SYLLABLES = [
+    "ba", "be", "bo", "ca", "ce", "co", "da", "de", "di", "fa", "fe", "ga",
+    "go", "la", "le", "li", "lo", "ma", "me", "mi", "mo", "na", "ne", "no",
+    "pa", "pe", "ra", "re", "ri", "ro", "sa", "se", "so", "ta", "te", "to",
+    "va", "ve", "vi", "za", "ar", "el", "an", "or", "in", "us",
+]
+
+
+def build_vocabulary(common, size: int, rng: random.Random):
+    """
+    Completa uma lista de nomes comuns com nomes sintéticos até `size` palavras.
+    Retorna (palavras, pesos acumulados) com distribuição de Zipf: os nomes
+    comuns ficam nas primeiras posições e são os mais frequentes.
+    """
+    words = list(common)
+    seen = {word.lower() for word in words}
+    while len(words) < size:
+        word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        if word.lower() not in seen:
+            seen.add(word.lower())
+            words.append(word)
+
+    cumulative, total = [], 0.0
+    for rank in range(1, len(words) + 1):
+        total += 1.0 / rank
+        cumulative.append(total)
+    return words, cumulative
+
+
+def generate_names(count: int, rng: random.Random):
+    """Gera nomes completos sintéticos com 2 a 4 palavras e frequências realistas."""
+    first_names, first_weights = build_vocabulary(FIRST_NAMES, 1_500, rng)
+    last_names, last_weights = build_vocabulary(LAST_NAMES, 5_000, rng)
+    for member_id in range(1, count + 1):
+        parts = rng.choices(first_names, cum_weights=first_weights)
+        parts += rng.choices(last_names, cum_weights=last_weights, k=rng.randint(1, 3))
+        yield {'id': member_id, 'nome': ' '.join(parts)}
+
+
+def make_prefix_query(nome: str, rng: random.Random) -> str:
+    """Simula o que a recepção digita: começos de uma ou duas palavras do nome."""
+    words = nome.split()
+    chosen = rng.sample(words, min(len(words), rng.randint(1, 2)))
+    return ' '.join(word[:rng.randint(2, len(word))] for word in chosen)
+
+
+def make_typo_query(nome: str, rng: random.Random) -> str:
+    """Troca uma letra do sobrenome para simular um erro de digitação."""
+    word = nome.split()[-1]
+    position = rng.randrange(1, len(word))
+    return word[:position] + 'x' + word[position + 1:]
+
+
+def percentiles(samples):
+    """Retorna (p50, p99, máximo) em milissegundos."""
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2]
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return p50 * 1000, p99 * 1000, samples[-1] * 1000
+
+
+def time_queries(index: NameIndex, queries):
+    """
+    Executa as buscas e retorna os tempos individuais em segundos. O coletor
+    de lixo continua ligado: as suas pausas também atrasam a busca no aplicativo.
+    """
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def check_ranking() -> bool:
+    """
+    Verifica que o melhor resultado aparece mesmo quando há mais de `limit`
+    membros com palavras que vêm antes dele na ordem alfabética.
+    """
+    index = NameIndex()
+    index.build(
+        [{'id': member_id, 'nome': f"Anabela Silva {member_id}"} for member_id in range(1, 61)]
+        + [{'id': 100, 'nome': "Ana Simoes"}]
+    )
+    ok = True
+    for query in ("ana si", "si ana"):
+        results = index.search(query)
+        if not results or results[0][0] != 100:
+            print(f"❌ '{query}': 'Ana Simoes' deveria ser o primeiro resultado")
+            ok = False
+    if ok:
+        print("✓ Ordenação por relevância verificada")
+    return ok
+
+
+def run_benchmark(members: int, queries: int, rounds: int, budget_ms: float) -> bool:
+    """Executa o benchmark completo. Retorna True se o p99 ficou dentro do limite."""
+    rng = random.Random(42)
+    names = list(generate_names(members, rng))
+
+    index = NameIndex()
+    start = time.perf_counter()
+    index.build(names)
+    print(f"Índice construído com {len(index):,} nomes em {time.perf_counter() - start:.2f} s")
+
+    sample = rng.sample(names, queries)
+    prefix_queries = [make_prefix_query(member['nome'], rng) for member in sample]
+    typo_queries = [make_typo_query(member['nome'], rng) for member in sample]
+
+    start = time.perf_counter()
+    for member_id in range(1, 1001):
+        index.update(member_id, f"Atualizado {member_id}")
+    print(f"1.000 atualizações incrementais em {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    within_budget = True
+    print(f"\n{'busca':>12} | {'p50':>9} | {'p99':>9} | {'máx':>9}")
+    print("-" * 48)
+    for label, batch in (("prefixo", prefix_queries), ("aproximada", typo_queries)):
+        # Mediana de cada percentil entre as rodadas
+        p50, p99, worst = (
+            statistics.median(values)
+            for values in zip(*(percentiles(time_queries(index, batch)) for _ in range(max(rounds, 1))))
+        )
+        marker = "" if p99 <= budget_ms else "  ❌ acima do limite"
+        within_budget = within_budget and p99 <= budget_ms
+        print(f"{label:>12} | {p50:>6.3f} ms | {p99:>6.3f} ms | {worst:>6.3f} ms{marker}")
+
+    print(f"\nLimite: p99 de {budget_ms:.1f} ms por busca")
+    return within_budget
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=5_000)
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="rodadas por tipo de busca (vale a mediana dos p99)")
+    parser.add_argument("--budget-ms", type=float, default=1.0,
+                        help="p99 máximo de cada tipo de busca (mediana das rodadas)")
+    args = parser.parse_args()
+    ok = check_ranking()
+    ok = run_benchmark(args.members, args.queries, args.rounds, args.budget_ms) and ok
+    sys.exit(0 if ok else 1)
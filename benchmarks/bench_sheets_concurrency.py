@@ -0,0 +1,136 @@
+"""
+Benchmark da leitura de várias abas pelo GoogleSheetsService contra um
+servidor HTTP local que imita a API do Google Sheets (values.get e
+values.batchGet), com latência artificial por requisição.
+
+Compara a leitura aba a aba (read_spreadsheet em sequência), a leitura em
+paralelo (read_sheets_concurrently) e o batchGet (read_sheets). Uma das
+abas pedidas não existe, como acontece com os meses futuros: o servidor
+responde 400 para ela, e o batchGet inteiro é recusado.
+
+Uso:
+    python benchmarks/bench_sheets_concurrency.py [--tabs 12] [--rows 500] [--latency 0.2]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+# Adiciona o diretório raiz do projeto ao sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from google.auth.credentials import AnonymousCredentials
+
+from src.data.google_sheets_service import GoogleSheetsService
+
+SPREADSHEET_ID = "planilha-local"
+MISSING_TAB = "Aba Inexistente"
+
+
+def make_handler(workbook, latency: float):
+    """Cria o handler HTTP que serve as abas de `workbook` ({aba: linhas})."""
+
+    def sheet_of(range_name: str) -> str:
+        # "'Janeiro 2025'!A:BT" -> "Janeiro 2025"
+        return range_name.split('!')[0].strip("'")
+
+    class SheetsStubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            url = urlparse(self.path)
+            prefix = f"/v4/spreadsheets/{SPREADSHEET_ID}/values"
+
+            if url.path == prefix + ":batchGet":
+                ranges = parse_qs(url.query).get('ranges', [])
+                missing = [r for r in ranges if sheet_of(r) not in workbook]
+                if missing:
+                    return self._send(400, {'error': {'code': 400, 'message': f"Unable to parse range: {missing[0]}"}})
+                return self._send(200, {
+                    'spreadsheetId': SPREADSHEET_ID,
+                    'valueRanges': [{'range': r, 'values': workbook[sheet_of(r)]} for r in ranges],
+                })
+
+            if url.path.startswith(prefix + "/"):
+                range_name = unquote(url.path[len(prefix) + 1:])
+                if sheet_of(range_name) not in workbook:
+                    return self._send(400, {'error': {'code': 400, 'message': f"Unable to parse range: {range_name}"}})
+                return self._send(200, {'range': range_name, 'values': workbook[sheet_of(range_name)]})
+
+            self._send(404, {'error': {'code': 404, 'message': 'Not found'}})
+
+        def _send(self, status: int, body):
+            payload = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=UTF-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return SheetsStubHandler
+
+
+def run_benchmark(tabs: int, rows: int, latency: float):
+    """Executa o benchmark completo."""
+    workbook = {
+        f"Aba {i:02d}": [[f"Membro {r}", "Mensal", "01/01/2025", "ATIVO"] for r in range(rows)]
+        for i in range(tabs)
+    }
+    sheet_names = list(workbook) + [MISSING_TAB]
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(workbook, latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        service = GoogleSheetsService(
+            None,
+            requests_per_minute=1_000_000,
+            api_endpoint=f"http://127.0.0.1:{server.server_port}/"
+        )
+        service.authenticate(AnonymousCredentials())
+
+        def serial():
+            return {name: service.read_spreadsheet(SPREADSHEET_ID, 'A:BT', name) for name in sheet_names}
+
+        scenarios = [("aba a aba", serial)]
+        for workers in (2, 4, 8):
+            scenarios.append((
+                f"paralelo ({workers})",
+                lambda workers=workers: service.read_sheets_concurrently(SPREADSHEET_ID, sheet_names, 'A:BT', workers)
+            ))
+        scenarios.append(("batchGet", lambda: service.read_sheets(SPREADSHEET_ID, sheet_names, 'A:BT')))
+
+        print(f"{tabs} abas + 1 inexistente, {rows} linhas por aba, latência de {latency * 1000:.0f} ms\n")
+        print(f"{'modo':>14} | {'abas lidas':>10} | {'requisições':>11} | {'tempo':>9}")
+        print("-" * 55)
+        for label, read in scenarios:
+            requests_before = service.metrics.as_dict()['requests']
+            # Suprime as mensagens de erro da aba inexistente
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                data = read()
+                elapsed = time.perf_counter() - start
+            requests = service.metrics.as_dict()['requests'] - requests_before
+            loaded = sum(1 for values in data.values() if values)
+            print(f"{label:>14} | {loaded:>10} | {requests:>11} | {elapsed:>7.2f} s")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tabs", type=int, default=12)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.2,
+                        help="latência artificial de cada requisição, em segundos")
+    args = parser.parse_args()
+    run_benchmark(args.tabs, args.rows, args.latency)
@@ -3,8 +3,13 @@ Script de migração de dados do Google Sheets para SQLite. (VERSÃO FINAL E COR
 Executa a migração de todos os membros e seus check-ins de frequência,
 validando corretamente as linhas de membros e consolidando os dados.
 """
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, time, date
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+import argparse
+import hashlib
+import json
+import sqlite3
 import sys
 import os
 
@@ -14,6 +19,7 @@ sys.path.insert(0, project_dir)
 
 from src.data.google_sheets_service import GoogleSheetsService
 from src.data.database_manager import DatabaseManager
+from src.data.sheets_requests import SheetsRequestError
 from src.core.models import Pessoa
 from src.utils.utils import parse_date
 from src.config import (
@@ -72,52 +78,45 @@ def get_time_from_period(period: str) -> time:
         return time(19, 0)
     return time(9, 0)
 
-def migrate_data():
-    """Executa a migração completa de dados."""
-    
-    print("=" * 60)
-    print("MIGRAÇÃO DE DADOS: Google Sheets → SQLite (VERSÃO FINAL)")
-    print("=" * 60)
-    
-    # --- ETAPAS 1, 2 e 3: CONEXÕES E SETUP ---
-    print("\n[1/6] Conectando ao Google Sheets...")
-    sheets_service = GoogleSheetsService(CREDENTIALS_PATH)
-    if not sheets_service.authenticate():
-        print("❌ Erro ao autenticar no Google Sheets")
-        return False
-    print("✓ Conectado ao Google Sheets")
-    
-    print("\n[2/6] Conectando ao banco de dados SQLite...")
-    db_manager = DatabaseManager()
-    if not db_manager.connect():
-        print("❌ Erro ao conectar ao banco de dados")
-        return False
-    print("✓ Conectado ao SQLite")
-    
-    print("\n[3/6] Limpando e recriando tabelas...")
-    if not db_manager.recreate_tables():
-        print("❌ Erro ao recriar tabelas")
-        return False
-    print("✓ Tabelas recriadas com sucesso")
-    
-    # --- PASSO 4: CONSOLIDAR DADOS DE MEMBROS EM MEMÓRIA ---
-    print("\n[4/6] Lendo e consolidando dados dos membros de todas as abas...")
+def build_date_map(sheet_name: str, day_header_row: List) -> Dict[int, date]:
+    """Mapeia as colunas de check-in da aba para as datas correspondentes."""
+    date_map: Dict[int, date] = {}
+    month, year = parse_sheet_month_year(sheet_name)
+
+    for col_index in range(CHECKIN_DATA_START_COL, len(day_header_row)):
+        day_str = get_safe_value(day_header_row, col_index)
+        if day_str.isdigit():
+            try:
+                date_obj = datetime(year, month, int(day_str)).date()
+                date_map[col_index] = date_obj
+            except ValueError:
+                pass
+    return date_map
+
+def parse_sheet(
+    sheet_name: str,
+    data: List[List]
+) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[str, datetime]]]:
+    """
+    Processa uma aba em uma única passada pelas linhas, extraindo os dados
+    dos membros e os check-ins marcados. Não depende de estado externo,
+    então pode rodar em outro processo.
+
+    Returns:
+        Tupla (dados dos membros da aba por nome, lista de check-ins
+        (nome do membro, data e hora))
+    """
     consolidated_members: Dict[str, Dict[str, Any]] = {}
-    
-    for sheet_name in SHEET_NAMES:
-        print(f"  → Lendo aba: {sheet_name}")
-        data = sheets_service.read_spreadsheet(SPREADSHEET_ID, 'A:CZ', sheet_name)
-        if not data or len(data) <= 3:
-            print(f"    ⚠ Dados insuficientes na aba {sheet_name}, pulando.")
+    checkins: List[Tuple[str, datetime]] = []
+    date_map = build_date_map(sheet_name, data[DAY_HEADER_ROW_INDEX])
+
+    for row in data[3:]:
+        nome = get_safe_value(row, COL_NOME)
+        if not nome:
             continue
-        
-        for row in data[3:]:
-            nome = get_safe_value(row, COL_NOME)
-            plano = get_safe_value(row, COL_PLANO)
 
-            if not nome or not plano:
-                continue
-            
+        plano = get_safe_value(row, COL_PLANO)
+        if plano:
             if nome not in consolidated_members:
                 consolidated_members[nome] = {'nome': nome}
 
@@ -136,97 +135,286 @@ def migrate_data():
                 if value:
                     consolidated_members[nome][key] = value
 
-    print(f"✓ {len(consolidated_members)} membros únicos consolidados.")
-
-    # --- PASSO 5: INSERIR MEMBROS CONSOLIDADOS NO BANCO DE DADOS ---
-    print("\n[5/6] Inserindo membros consolidados no banco de dados...")
-    membros_migrados: Dict[str, int] = {}
-    for nome, data_dict in consolidated_members.items():
-        # Prepara o dicionário de dados para inserção
-        member_data_to_insert = {
-            'nome': nome,
-            'plano': data_dict.get('plano', 'N/A'),
-            'vencimento_plano': data_dict.get('vencimento_plano', ''),
-            'estado_plano': data_dict.get('estado_plano', ''),
-            'data_nascimento': data_dict.get('data_nascimento', ''),
-            'whatsapp': data_dict.get('whatsapp', ''),
-            'genero': data_dict.get('genero', ''),
-            'frequencia': data_dict.get('frequencia', ''),
-            'calcado': data_dict.get('calcado', '')
-        }
-        
-        # Remove chaves com valores vazios, exceto para campos que podem ser vazios
-        final_member_data = {k: v for k, v in member_data_to_insert.items() if v}
-        final_member_data['nome'] = nome # Garante que o nome esteja sempre presente
+        # Check-ins de linhas sem plano também contam, desde que o membro
+        # tenha sido consolidado em alguma aba (filtrado na inserção)
+        for check_col, check_date in date_map.items():
+            check_value = get_safe_value(row, check_col)
+            
+            if check_value and check_value.upper() not in ['FALSE', 'F']:
+                period_col = check_col + 1
+                period_value = get_safe_value(row, period_col)
+                check_time = get_time_from_period(period_value)
+                checkins.append((nome, datetime.combine(check_date, check_time)))
 
-        member_id = db_manager.add_member(final_member_data)
-        if member_id:
-            membros_migrados[nome] = member_id
-    
-    print(f"✓ {len(membros_migrados)} membros inseridos no banco de dados.")
-
-    # --- PASSO 6: MIGRAR CHECK-INS ---
-    print("\n[6/6] Migrando registros de check-in...")
-    total_checkins = 0
-    for sheet_name in SHEET_NAMES:
-        print(f"  → Processando check-ins da aba: {sheet_name}")
-        data = sheets_service.read_spreadsheet(SPREADSHEET_ID, 'A:CZ', sheet_name)
-        
-        if not data or len(data) <= DAY_HEADER_ROW_INDEX:
-            print(f"    ⚠ Dados insuficientes para check-ins na aba {sheet_name}")
+    return consolidated_members, checkins
+
+def sheet_fingerprint(data: List[List]) -> str:
+    """Hash do conteúdo de uma aba, usado para detectar abas alteradas."""
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def parse_sheets(
+    sheets_data: Dict[str, List[List]],
+    workers: Optional[int] = None
+) -> Dict[str, Tuple[Dict[str, Dict[str, Any]], List[Tuple[str, datetime]]]]:
+    """
+    Processa as abas com parse_sheet, em paralelo quando há mais de um
+    processo disponível. Abas sem dados suficientes são ignoradas.
+
+    Args:
+        sheets_data: Dicionário aba -> linhas, na ordem cronológica
+        workers: Número de processos (padrão: número de CPUs; 1 processa
+            tudo no processo atual)
+
+    Returns:
+        Dicionário aba -> resultado de parse_sheet, na ordem das abas
+    """
+    sheet_names = []
+    for sheet_name, data in sheets_data.items():
+        print(f"  → Processando aba: {sheet_name}")
+        if not data or len(data) <= 3:
+            print(f"    ⚠ Dados insuficientes na aba {sheet_name}, pulando.")
             continue
+        sheet_names.append(sheet_name)
+
+    workers = min(workers or os.cpu_count() or 1, len(sheet_names))
+    sheet_rows = [sheets_data[sheet_name] for sheet_name in sheet_names]
+    if workers > 1:
+        # Cada processo recebe uma aba inteira e devolve tuplas compactas;
+        # map() mantém a ordem das abas
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(parse_sheet, sheet_names, sheet_rows))
+    else:
+        results = [parse_sheet(name, rows) for name, rows in zip(sheet_names, sheet_rows)]
+    return dict(zip(sheet_names, results))
+
+def merge_sheet_members(parsed_sheets) -> Dict[str, Dict[str, Any]]:
+    """
+    Consolida os membros na ordem das abas: valores não vazios de abas
+    posteriores sobrescrevem os anteriores.
+    """
+    consolidated_members: Dict[str, Dict[str, Any]] = {}
+    for sheet_members, _ in parsed_sheets.values():
+        for nome, member_data in sheet_members.items():
+            consolidated_members.setdefault(nome, {}).update(member_data)
+    return consolidated_members
+
+def parse_workbook(
+    sheets_data: Dict[str, List[List]],
+    workers: Optional[int] = None
+) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[str, datetime]]]:
+    """
+    Processa todas as abas e consolida os membros.
+
+    Returns:
+        Tupla (membros consolidados por nome, check-ins de todas as abas)
+    """
+    parsed_sheets = parse_sheets(sheets_data, workers)
+    checkins: List[Tuple[str, datetime]] = []
+    for _, sheet_checkins in parsed_sheets.values():
+        checkins.extend(sheet_checkins)
+    return merge_sheet_members(parsed_sheets), checkins
+
+def build_member_record(nome: str, data_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Prepara o dicionário de um membro consolidado para inserção."""
+    member_data_to_insert = {
+        'nome': nome,
+        'plano': data_dict.get('plano', 'N/A'),
+        'vencimento_plano': data_dict.get('vencimento_plano', ''),
+        'estado_plano': data_dict.get('estado_plano', ''),
+        'data_nascimento': data_dict.get('data_nascimento', ''),
+        'whatsapp': data_dict.get('whatsapp', ''),
+        'genero': data_dict.get('genero', ''),
+        'frequencia': data_dict.get('frequencia', ''),
+        'calcado': data_dict.get('calcado', '')
+    }
+    
+    # Remove chaves com valores vazios, exceto para campos que podem ser vazios
+    final_member_data = {k: v for k, v in member_data_to_insert.items() if v}
+    final_member_data['nome'] = nome # Garante que o nome esteja sempre presente
+    return final_member_data
+
+def migrate_data(
+    sheets_service=None,
+    db_manager=None,
+    parse_workers: Optional[int] = None,
+    incremental: bool = False
+) -> bool:
+    """
+    Executa a migração de dados.
+
+    Args:
+        sheets_service: Serviço de leitura das abas (qualquer objeto com
+            read_sheets(), como GoogleSheetsService ou um substituto local).
+            Se None, autentica no Google Sheets.
+        db_manager: DatabaseManager de destino. Se None, conecta ao banco padrão.
+        parse_workers: Processos usados para processar as abas (padrão:
+            número de CPUs). Apenas o processo principal grava no banco.
+        incremental: Se True, não apaga as tabelas: processa apenas as abas
+            cujo conteúdo mudou desde a última sincronização, atualiza os
+            membros alterados e insere apenas check-ins novos (por membro e
+            horário). Check-ins registrados localmente são preservados.
+
+    Returns:
+        True se a migração foi concluída, False caso contrário
+    """
+    
+    print("=" * 60)
+    if incremental:
+        print("SINCRONIZAÇÃO INCREMENTAL: Google Sheets → SQLite")
+    else:
+        print("MIGRAÇÃO DE DADOS: Google Sheets → SQLite (VERSÃO FINAL)")
+    print("=" * 60)
+    
+    # --- ETAPAS 1 e 2: CONEXÕES ---
+    print("\n[1/6] Conectando ao Google Sheets...")
+    if sheets_service is None:
+        sheets_service = GoogleSheetsService(CREDENTIALS_PATH)
+        if not sheets_service.authenticate():
+            print("❌ Erro ao autenticar no Google Sheets")
+            return False
+    print("✓ Conectado ao Google Sheets")
+    
+    print("\n[2/6] Conectando ao banco de dados SQLite...")
+    if db_manager is None:
+        db_manager = DatabaseManager()
+    if not db_manager.connect():
+        print("❌ Erro ao conectar ao banco de dados")
+        return False
+    print("✓ Conectado ao SQLite")
+    
+    # --- PASSO 3: LER TODAS AS ABAS ---
+    print("\n[3/6] Lendo todas as abas...")
+    # Uma única requisição batchGet (por grupo de abas) em vez de duas
+    # leituras completas de cada aba
+    try:
+        fetched = sheets_service.read_sheets(SPREADSHEET_ID, SHEET_NAMES, 'A:CZ')
+    except SheetsRequestError as e:
+        # Uma aba indisponível não pode ser tratada como vazia: aborta sem
+        # alterar o banco
+        print(f"❌ Google Sheets indisponível após novas tentativas: {e}")
+        db_manager.close()
+        return False
+    sheets_data = {sheet_name: fetched.get(sheet_name) for sheet_name in SHEET_NAMES}
+    fingerprints = {
+        sheet_name: sheet_fingerprint(data)
+        for sheet_name, data in sheets_data.items() if data
+    }
+    if not fingerprints:
+        # Não apaga nem altera o banco se a leitura falhou
+        print("❌ Nenhuma aba pôde ser lida")
+        db_manager.close()
+        return False
+    print(f"✓ {len(fingerprints)} aba(s) lida(s)")
+    
+    # --- PASSO 4: PREPARAR O BANCO ---
+    if incremental:
+        print("\n[4/6] Comparando com a última sincronização...")
+        previous_fingerprints = db_manager.get_sync_state()
+        changed_sheets = [
+            sheet_name for sheet_name, fingerprint in fingerprints.items()
+            if previous_fingerprints.get(sheet_name) != fingerprint
+        ]
+        if not changed_sheets:
+            print("✓ Nenhuma aba foi alterada. Nada a sincronizar.")
+            db_manager.close()
+            return True
+        print(f"✓ Aba(s) alterada(s): {', '.join(changed_sheets)}")
+    else:
+        print("\n[4/6] Limpando e recriando tabelas...")
+        if not db_manager.recreate_tables():
+            print("❌ Erro ao recriar tabelas")
+            return False
+        changed_sheets = list(fingerprints)
+        print("✓ Tabelas recriadas com sucesso")
+    
+    # --- PASSO 5: PROCESSAR AS ABAS E GRAVAR OS MEMBROS ---
+    print("\n[5/6] Processando as abas e gravando os membros...")
+    # Todas as abas entram na consolidação (as posteriores prevalecem), mas
+    # só são gravados os membros que aparecem em abas alteradas
+    parsed_sheets = parse_sheets(sheets_data, parse_workers)
+    consolidated_members = merge_sheet_members(parsed_sheets)
+    changed_parsed = [parsed_sheets[name] for name in changed_sheets if name in parsed_sheets]
+    changed_names = {nome for sheet_members, _ in changed_parsed for nome in sheet_members}
+    
+    member_records = (
+        build_member_record(nome, data_dict)
+        for nome, data_dict in consolidated_members.items()
+        if nome in changed_names
+    )
+    # Os erros de gravação são repassados (raise_errors): com um resultado
+    # parcial, as abas não podem ser registradas como sincronizadas
+    try:
+        if incremental:
+            membros_migrados = db_manager.upsert_members(member_records, raise_errors=True)
+            # Check-ins podem ser de membros gravados em sincronizações anteriores
+            member_ids = db_manager.get_member_ids_by_name()
+        else:
+            # Inserção em lote: um commit a cada BULK_CHUNK_SIZE membros
+            membros_migrados = db_manager.bulk_add_members(member_records, raise_errors=True)
+            member_ids = membros_migrados
         
-        date_map: Dict[int, date] = {}
-        month, year = parse_sheet_month_year(sheet_name)
-        day_header_row = data[DAY_HEADER_ROW_INDEX]
-
-        for col_index in range(CHECKIN_DATA_START_COL, len(day_header_row)):
-            day_str = get_safe_value(day_header_row, col_index)
-            if day_str.isdigit():
-                try:
-                    date_obj = datetime(year, month, int(day_str)).date()
-                    date_map[col_index] = date_obj
-                except ValueError:
-                    pass
+        print(f"✓ {len(membros_migrados)} membros processados no banco de dados.")
         
-        for row in data[3:]:
-            nome = get_safe_value(row, COL_NOME)
-            member_id = membros_migrados.get(nome)
-            
-            if member_id:
-                for check_col, check_date in date_map.items():
-                    check_value = get_safe_value(row, check_col)
-                    
-                    if check_value and check_value.upper() not in ['FALSE', 'F']:
-                        period_col = check_col + 1
-                        period_value = get_safe_value(row, period_col)
-                        check_time = get_time_from_period(period_value)
-                        full_checkin_datetime = datetime.combine(check_date, check_time)
-                        
-                        db_manager.add_checkin(member_id, full_checkin_datetime)
-                        total_checkins += 1
+        # --- PASSO 6: MIGRAR CHECK-INS ---
+        print("\n[6/6] Migrando registros de check-in...")
+        total_checkins = db_manager.bulk_add_checkins(
+            (
+                (member_ids[nome], checkin_datetime)
+                for _, sheet_checkins in changed_parsed
+                for nome, checkin_datetime in sheet_checkins
+                if nome in member_ids
+            ),
+            # Na sincronização, check-ins já importados (mesmo membro e horário) são ignorados
+            skip_existing=incremental,
+            raise_errors=True
+        )
+    except sqlite3.Error as e:
+        print(f"❌ Erro ao gravar no banco de dados: {e}")
+        print("   As abas não foram registradas como sincronizadas; execute a migração novamente.")
+        db_manager.close()
+        return False
                         
     print(f"✓ {total_checkins} registros de check-in migrados.")
     
+    # Registra as abas processadas para a próxima sincronização incremental
+    if not db_manager.save_sync_state({name: fingerprints[name] for name in changed_sheets}):
+        print("❌ Erro ao registrar as abas sincronizadas")
+        db_manager.close()
+        return False
+    
     # --- RESUMO FINAL ---
     db_manager.close()
     print("\n" + "=" * 60)
     print("MIGRAÇÃO CONCLUÍDA COM SUCESSO!")
     print("=" * 60)
     print(f"\n📊 Resumo:")
-    print(f"  • Membros únicos migrados: {len(membros_migrados)}")
-    print(f"  • Total de Check-ins: {total_checkins}")
+    print(f"  • Abas processadas: {len(changed_sheets)}")
+    print(f"  • Membros processados: {len(membros_migrados)}")
+    print(f"  • Check-ins novos: {total_checkins}")
     print(f"  • Banco de dados: gym_database.db")
+    metrics = getattr(sheets_service, 'metrics', None)
+    if metrics is not None:
+        api = metrics.as_dict()
+        print(f"  • Requisições à API: {api['requests']} "
+              f"({api['retries']} nova(s) tentativa(s), {api['rate_limited']} limitada(s) por cota, "
+              f"{api['throttle_seconds']:.1f} s aguardando o limite de taxa)")
     print("\n")
     
     return True
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migra os dados do Google Sheets para o SQLite.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="sincroniza apenas as abas alteradas, sem apagar o banco")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processos usados para processar as abas (padrão: número de CPUs)")
+    args = parser.parse_args()
     try:
-        success = migrate_data()
+        success = migrate_data(parse_workers=args.workers, incremental=args.incremental)
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"\n❌ Erro fatal durante a migração: {e}")
         import traceback
         traceback.print_exc()
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -0,0 +1,57 @@
+"""
+Recalcula a tabela de totais diários de check-ins (checkin_daily_stats) a
+partir de toda a tabela de frequência.
+
+Os totais são mantidos automaticamente a cada check-in; use este script
+após alterar a frequência por fora do aplicativo (ex: edição manual do
+banco) ou para conferir se os totais estão consistentes.
+
+Uso:
+    python scripts/rebuild_checkin_stats.py [--db gym_database.db]
+"""
+import argparse
+import sys
+import os
+import time
+
+# Adiciona o diretório raiz do projeto ao sys.path
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+from src.data.database_manager import DatabaseManager
+
+
+def rebuild_checkin_stats(db_path: str = "gym_database.db") -> bool:
+    """
+    Recalcula os totais diários de check-ins.
+
+    Args:
+        db_path: Caminho do banco, relativo à raiz do projeto
+
+    Returns:
+        True se os totais foram recalculados, False caso contrário
+    """
+    db_manager = DatabaseManager(db_path)
+    # connect() também aplica as migrações pendentes, que criam a tabela
+    if not db_manager.connect():
+        print("❌ Não foi possível conectar ao banco de dados.")
+        return False
+
+    try:
+        start = time.perf_counter()
+        rows = db_manager.rebuild_checkin_stats()
+        if rows < 0:
+            return False
+        print(f"✓ Totais diários recalculados: {rows} linha(s) (dia, hora e plano) "
+              f"em {time.perf_counter() - start:.2f} s")
+        return True
+    finally:
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default="gym_database.db",
+                        help="arquivo do banco, relativo à raiz do projeto")
+    args = parser.parse_args()
+    sys.exit(0 if rebuild_checkin_stats(args.db) else 1)
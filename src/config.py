@@ -47,3 +47,37 @@ PLANOS_COM_VENCIMENTO = [
     "Semestral",
     "Anual"
 ]
+
+# Busca enquanto o usuário digita: espera (ms) após a última tecla antes de
+# buscar e número mínimo de caracteres para disparar a busca
+SEARCH_DEBOUNCE_MS = 250
+MIN_LIVE_SEARCH_LENGTH = 2
+
+# Validade (segundos) dos dados do Google Sheets em cache no DataProvider;
+# após esse tempo, a versão da planilha é conferida antes de baixar de novo
+SHEETS_CACHE_TTL_SECONDS = 60
+
+# Cota de leituras da API do Google Sheets por minuto (por usuário) e número
+# máximo de novas tentativas em falhas temporárias (429, 5xx, rede)
+SHEETS_READ_REQUESTS_PER_MINUTE = 60
+SHEETS_MAX_RETRIES = 5
+
+# Arquivo com as cópias locais (snapshots) das abas do Google Sheets, usadas
+# para abrir o aplicativo sem esperar o download e para consultar sem rede
+SHEETS_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sheets_snapshot.db')
+
+# Máximo de requisições simultâneas ao ler várias abas em paralelo
+SHEETS_MAX_CONCURRENT_REQUESTS = 4
+
+# Período (dias, incluindo hoje) dos totais de check-ins exibidos no dashboard
+DASHBOARD_STATS_DAYS = 30
+
+# Check-ins recentes listados no dashboard e intervalo (segundos) entre as
+# reconciliações com o banco; entre elas, o dashboard é atualizado pelos
+# eventos de check-in (src.core.events)
+DASHBOARD_LAST_CHECKINS = 5
+DASHBOARD_RECONCILE_SECONDS = 300
+
+# Check-ins carregados por vez no histórico de um membro (a lista busca a
+# próxima página ao chegar ao fim da rolagem)
+HISTORY_PAGE_SIZE = 100
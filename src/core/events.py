@@ -0,0 +1,87 @@
+"""
+Barramento de eventos em processo.
+
+O DataProvider publica um evento a cada escrita (check-in registrado ou
+removido, membro adicionado) e quando a fonte relê os membros (ex:
+planilha atualizada), e as telas aplicam a mudança ao que já exibem,
+sem consultar a fonte de dados de novo. Não depende do Qt: a entrega na
+thread da interface fica a cargo de src.ui.event_bridge.
+"""
+import threading
+from typing import Any, Callable, Dict, List
+
+# Tipos de evento e dados enviados em cada um
+CHECKIN_ADDED = 'checkin_added'        # id, member_id, nome, plano, checkin_datetime
+CHECKIN_DELETED = 'checkin_deleted'    # id, checkin_datetime (None se desconhecido)
+MEMBER_ADDED = 'member_added'          # id e os campos do membro
+MEMBERS_RELOADED = 'members_reloaded'  # vazio; membros relidos da fonte (os IDs podem ter mudado)
+
+EventHandler = Callable[[str, Dict[str, Any]], None]
+
+
+class EventBus:
+    """
+    Publicação/assinatura síncrona: publish() chama os assinantes na
+    própria thread de quem publica. Um assinante com erro não impede a
+    entrega aos demais nem a escrita que gerou o evento.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handlers: Dict[str, List[EventHandler]] = {}
+
+    def subscribe(self, event_type: str, handler: EventHandler) -> Callable[[], None]:
+        """
+        Assina um tipo de evento.
+
+        Args:
+            event_type: Tipo do evento (ex: CHECKIN_ADDED)
+            handler: Função chamada com (tipo do evento, dados)
+
+        Returns:
+            Função que cancela a assinatura
+        """
+        with self._lock:
+            # Copia a lista: publish() itera sobre a versão anterior sem o lock
+            self._handlers[event_type] = self._handlers.get(event_type, []) + [handler]
+        return lambda: self.unsubscribe(event_type, handler)
+
+    def unsubscribe(self, event_type: str, handler: EventHandler):
+        """Cancela a assinatura (sem efeito se o handler não estiver inscrito)."""
+        with self._lock:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                self._handlers[event_type] = [h for h in handlers if h is not handler]
+
+    def has_subscribers(self, event_type: str) -> bool:
+        """True se alguém assina o evento (para evitar montar dados que ninguém vai ler)."""
+        return bool(self._handlers.get(event_type))
+
+    def publish(self, event_type: str, payload: Dict[str, Any]) -> int:
+        """
+        Entrega o evento a todos os assinantes.
+
+        Args:
+            event_type: Tipo do evento
+            payload: Dados do evento
+
+        Returns:
+            Número de assinantes que receberam o evento sem erro
+        """
+        delivered = 0
+        for handler in self._handlers.get(event_type, []):
+            try:
+                handler(event_type, payload)
+                delivered += 1
+            except Exception as e:
+                print(f"Erro ao entregar o evento '{event_type}': {e}")
+        return delivered
+
+
+# Instância global, compartilhada pelo DataProvider e pelas telas
+_event_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Retorna o barramento de eventos global."""
+    return _event_bus
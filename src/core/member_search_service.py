@@ -1,9 +1,13 @@
 """
 Serviço para busca de membros.
-Usa o data_provider para abstrair a fonte de dados.
+Usa o data_provider para abstrair a fonte de dados e mantém um índice
+de nomes em memória para a busca enquanto o usuário digita.
 """
+import threading
 from typing import Optional, Dict, List, Any
 from src.data.data_provider import get_provider
+from src.core.events import MEMBER_ADDED, MEMBERS_RELOADED
+from src.core.name_index import NameIndex
 
 
 class MemberSearchService:
@@ -12,20 +16,57 @@ class MemberSearchService:
     def __init__(self):
         """Inicializa o serviço de busca."""
         self.data_provider = get_provider()
+        self.name_index = NameIndex()
+        self.index_ready = False
+        # Reconstruções simultâneas (conexão e planilha relida) acontecem uma
+        # de cada vez, para que a última a terminar seja a que leu por último.
+        # Reentrante: ler os membros pode reler a planilha e disparar o evento
+        self._build_lock = threading.RLock()
+        # Membros adicionados por qualquer tela entram no índice pelo evento
+        self.data_provider.event_bus.subscribe(MEMBER_ADDED, self._on_member_added)
+        # Na planilha o ID é o índice da linha: quando ela é relida, os IDs
+        # do índice podem apontar para outras pessoas, então ele é refeito
+        self.data_provider.event_bus.subscribe(MEMBERS_RELOADED, self._on_members_reloaded)
+    
+    def build_index(self) -> int:
+        """
+        Carrega os nomes de todos os membros no índice em memória.
+        Deve ser chamado após a conexão com a fonte de dados; depois disso o
+        índice é refeito sozinho quando a fonte relê os membros.
+            
+        Returns:
+            Número de membros indexados
+        """
+        with self._build_lock:
+            self.name_index.build(self.data_provider.get_all_members())
+            self.index_ready = True
+            return len(self.name_index)
     
     def search_by_name(self, name: str) -> List[Dict[str, Any]]:
         """
-        Busca membros por nome (busca por similaridade, case-insensitive).
+        Busca membros por nome (prefixos de palavras, sem diferenciar
+        maiúsculas/minúsculas nem acentos).
+        Usa o índice em memória quando disponível; caso contrário, consulta
+        o data_provider.
         
         Args:
             name: Nome ou parte do nome para buscar
             
         Returns:
-            Lista de dicionários com dados dos membros encontrados
+            Lista de dicionários com dados dos membros encontrados,
+            ordenados por relevância
         """
         if not name or not name.strip():
             return []
         
+        if self.index_ready:
+            # O índice guarda apenas id e nome; os dados completos são
+            # carregados quando o membro é selecionado (get_member_by_id)
+            return [
+                {'id': member_id, 'nome': nome, 'member_data': {'id': member_id, 'nome': nome}}
+                for member_id, nome in self.name_index.search(name.strip())
+            ]
+        
         # Usa o data_provider para buscar
         members = self.data_provider.find_members_by_name(name.strip())
         
@@ -51,3 +92,52 @@ class MemberSearchService:
             Dicionário com os dados completos do membro
         """
         return self.data_provider.get_member_by_id(member_id)
+    
+    def add_member(self, member_data: Dict[str, Any]) -> Optional[int]:
+        """
+        Adiciona um novo membro (o evento MEMBER_ADDED o inclui no índice de nomes).
+        
+        Args:
+            member_data: Dicionário com os dados do membro
+            
+        Returns:
+            ID do novo membro ou None em caso de erro
+        """
+        return self.data_provider.add_member(member_data)
+    
+    def _on_member_added(self, event_type: str, member: Dict[str, Any]):
+        """Inclui no índice de nomes um membro recém-adicionado."""
+        if self.index_ready:
+            self.name_index.add(member['id'], member.get('nome', ''))
+    
+    def _on_members_reloaded(self, event_type: str, payload: Dict[str, Any]):
+        """Refaz o índice de nomes com os membros relidos da fonte."""
+        with self._build_lock:
+            if self.index_ready:
+                self.build_index()
+    
+    def update_member(self, member_data: Dict[str, Any]) -> bool:
+        """
+        Atualiza os dados de um membro e o seu nome no índice.
+        
+        Args:
+            member_data: Dicionário com os dados atualizados (deve incluir 'id')
+            
+        Returns:
+            True se a atualização foi bem-sucedida, False caso contrário
+        """
+        success = self.data_provider.update_member(member_data)
+        if success:
+            self.update_index(member_data)
+        return success
+    
+    def update_index(self, member_data: Dict[str, Any]):
+        """
+        Atualiza o nome de um membro no índice, após a gravação ter sido
+        feita (ex: em segundo plano, com o índice atualizado na thread da GUI).
+        
+        Args:
+            member_data: Dicionário com os dados gravados (deve incluir 'id')
+        """
+        if self.index_ready and 'nome' in member_data:
+            self.name_index.update(member_data['id'], member_data['nome'])
@@ -0,0 +1,402 @@
+"""
+Índice de nomes em memória para a busca enquanto o usuário digita.
+Indexa o vocabulário de palavras dos nomes (normalizadas, sem acentos):
+prefixos são encontrados por bisect na lista ordenada de palavras e erros
+de digitação por similaridade de trigramas, sem acessar o banco de dados.
+"""
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import compress, product, repeat, tee
+from operator import not_
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Any
+
+from src.utils.utils import normalize_text
+
+
+def _trigrams(word: str) -> Set[str]:
+    """Gera os trigramas de uma palavra, com preenchimento nas bordas (ex: '  jo', ' jo', 'joa')."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    Índice invertido de nomes de membros.
+
+    Cada palavra distinta aparece uma única vez no vocabulário, associada ao
+    conjunto de membros que a possuem. Como nomes se repetem muito (Silva,
+    Santos, Maria...), o vocabulário é bem menor que o número de membros.
+
+    Seguro entre threads: a busca roda na thread do MemberSearchWorker e as
+    inclusões/alterações chegam de outras threads, então todas as operações
+    acontecem sob um mesmo lock.
+
+    Relevância de uma palavra para um termo digitado:
+        1.0  palavra igual ao termo
+        0.9  palavra que começa com o termo
+        <0.8 palavra parecida (similaridade de trigramas), usada apenas quando
+             nenhuma palavra começa com o termo
+    """
+
+    EXACT_SCORE = 1.0
+    PREFIX_SCORE = 0.9
+    FUZZY_WEIGHT = 0.8
+
+    # Similaridade mínima (Jaccard de trigramas) para a busca aproximada
+    MIN_SIMILARITY = 0.3
+
+    # Tolerância nas comparações de pontuação (somas de floats em outra ordem)
+    SCORE_EPSILON = 1e-9
+
+    # Termos com até (fator x membros do termo condutor) membros filtram
+    # pela união dos seus membros; acima disso, montar a união custa mais
+    # que conferir as palavras dos membros do condutor
+    SET_FILTER_RATIO = 8
+
+    # Prefixos curtos (até 3 letras) casam com dezenas ou centenas de
+    # palavras; a união dos seus membros fica em cache até a próxima
+    # alteração do índice. Os prefixos de um mesmo tamanho dividem as
+    # palavras entre si, então o cache não passa de 3 cópias dos membros
+    SHORT_TOKEN_LENGTH = 3
+
+    def __init__(self):
+        """Inicializa um índice vazio."""
+        self._lock = threading.Lock()
+        self._names: Dict[int, str] = {}
+        self._member_words: Dict[int, Tuple[str, ...]] = {}
+
+        self._vocabulary: List[str] = []
+        self._word_members: Dict[str, Set[int]] = {}
+        self._trigram_words: Dict[str, Set[str]] = {}
+        self._word_trigram_counts: Dict[str, int] = {}
+        self._short_token_members: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._names)
+
+    def __contains__(self, member_id: int) -> bool:
+        with self._lock:
+            return member_id in self._names
+
+    def build(self, members: Iterable[Dict[str, Any]]):
+        """
+        Reconstrói o índice a partir de uma lista de membros.
+
+        Args:
+            members: Dicionários com pelo menos 'id' e 'nome'
+        """
+        # Monta um índice novo fora do lock e troca de uma vez: buscas
+        # feitas enquanto isso usam o índice anterior
+        fresh = NameIndex()
+        for member in members:
+            member_id = member.get('id')
+            nome = member.get('nome')
+            if member_id is None or not nome:
+                continue
+            words = tuple(normalize_text(nome).split())
+            fresh._names[member_id] = nome
+            fresh._member_words[member_id] = words
+            for word in words:
+                fresh._word_members.setdefault(word, set()).add(member_id)
+
+        # Ordenar uma única vez é bem mais rápido que inserir em ordem
+        fresh._vocabulary = sorted(fresh._word_members)
+        for word in fresh._vocabulary:
+            fresh._index_trigrams(word)
+
+        with self._lock:
+            self._names = fresh._names
+            self._member_words = fresh._member_words
+            self._vocabulary = fresh._vocabulary
+            self._word_members = fresh._word_members
+            self._trigram_words = fresh._trigram_words
+            self._word_trigram_counts = fresh._word_trigram_counts
+            self._short_token_members = {}
+
+    def add(self, member_id: int, nome: str):
+        """
+        Adiciona (ou substitui) um membro no índice.
+
+        Args:
+            member_id: ID do membro
+            nome: Nome do membro
+        """
+        with self._lock:
+            self._add(member_id, nome)
+
+    def update(self, member_id: int, nome: str):
+        """Atualiza o nome de um membro no índice."""
+        self.add(member_id, nome)
+
+    def remove(self, member_id: int):
+        """
+        Remove um membro do índice.
+
+        Args:
+            member_id: ID do membro
+        """
+        with self._lock:
+            self._remove(member_id)
+
+    def _add(self, member_id: int, nome: str):
+        """Adiciona (ou substitui) um membro (chamado com o lock)."""
+        self._short_token_members.clear()
+        if member_id in self._names:
+            self._remove(member_id)
+        if not nome:
+            return
+
+        words = tuple(normalize_text(nome).split())
+        self._names[member_id] = nome
+        self._member_words[member_id] = words
+        for word in words:
+            members = self._word_members.get(word)
+            if members is None:
+                members = self._word_members[word] = set()
+                insort(self._vocabulary, word)
+                self._index_trigrams(word)
+            members.add(member_id)
+
+    def _remove(self, member_id: int):
+        """Remove um membro (chamado com o lock)."""
+        self._short_token_members.clear()
+        if member_id not in self._names:
+            return
+
+        del self._names[member_id]
+        for word in self._member_words.pop(member_id):
+            members = self._word_members.get(word)
+            if members is None:
+                continue
+            members.discard(member_id)
+            if members:
+                continue
+
+            # Palavra não é mais usada por nenhum membro: sai do vocabulário
+            del self._word_members[word]
+            position = bisect_left(self._vocabulary, word)
+            if position < len(self._vocabulary) and self._vocabulary[position] == word:
+                del self._vocabulary[position]
+            del self._word_trigram_counts[word]
+            for gram in _trigrams(word):
+                words = self._trigram_words.get(gram)
+                if words is not None:
+                    words.discard(word)
+                    if not words:
+                        del self._trigram_words[gram]
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[int, str]]:
+        """
+        Busca membros pelo nome. Todas as palavras digitadas precisam casar
+        com alguma palavra do nome, por prefixo ou, na falta dele, por
+        similaridade (erros de digitação).
+
+        Args:
+            query: Texto digitado
+            limit: Número máximo de resultados
+
+        Returns:
+            Lista de (id, nome) ordenada por relevância
+        """
+        tokens = normalize_text(query).split()
+        if not tokens:
+            return []
+
+        with self._lock:
+            return self._search(tokens, limit)
+
+    def _search(self, tokens: List[str], limit: int) -> List[Tuple[int, str]]:
+        """Busca pelos termos já normalizados (chamado com o lock)."""
+        # Palavras do vocabulário que casam com cada termo, com sua relevância
+        token_words = []
+        for token in tokens:
+            words = self._match_words(token)
+            if not words:
+                return []
+            token_words.append(words)
+
+        # O termo mais seletivo (menos membros) conduz a busca
+        totals = [
+            len(self._members_for(words, token)) if self._is_cacheable(token, words)
+            else sum(len(self._word_members[w]) for w in words)
+            for token, words in zip(tokens, token_words)
+        ]
+        driver_index = min(range(len(token_words)), key=totals.__getitem__)
+        driver = token_words[driver_index]
+
+        # Os demais termos filtram os membros do condutor, sob demanda e em C
+        # (filter/compress): a parada antecipada evita percorrer o resto dos
+        # membros. O filtro é o conjunto de membros do termo quando ele já
+        # existe (uma só palavra ou prefixo curto, com a união em cache) ou
+        # é barato de montar (número comparável de membros); para um termo
+        # muito comum, são conferidas as palavras de cada membro.
+        # Cada termo tem até duas faixas (relevância máxima, conjunto,
+        # palavras): os membros com a sua melhor palavra e todos os membros
+        other_tiers = []
+        for i, words in enumerate(token_words):
+            if i == driver_index:
+                continue
+            if (
+                len(words) == 1
+                or self._is_cacheable(tokens[i], words)
+                or totals[i] <= totals[driver_index] * self.SET_FILTER_RATIO
+            ):
+                every_member = (self._members_for(words, tokens[i]), None)
+            else:
+                every_member = (None, words.keys())
+            ranked = heapq.nlargest(2, words.values())
+            if len(ranked) > 1 and ranked[0] > ranked[1]:
+                best_word = max(words, key=words.__getitem__)
+                other_tiers.append((
+                    (ranked[0], self._word_members[best_word], None),
+                    (ranked[1],) + every_member,
+                ))
+            else:
+                other_tiers.append(((ranked[0],) + every_member,))
+
+        # Combinações de grupos de palavras do condutor e faixas dos outros
+        # termos, da maior pontuação possível para a menor; a busca para
+        # quando os `limit` melhores já pontuam o máximo da combinação
+        # seguinte (ninguém ainda não visto os supera)
+        combinations = sorted(
+            (
+                (relevance + sum(tier[0] for tier in tiers), group_members, tiers)
+                for group_members, relevance in self._driver_groups(tokens[driver_index], driver)
+                for tiers in product(*other_tiers)
+            ),
+            key=lambda combination: -combination[0]
+        )
+        scored = {}
+        top_scores: List[float] = []  # heap com as `limit` maiores pontuações
+        for ceiling, group_members, tiers in combinations:
+            ceiling -= self.SCORE_EPSILON
+            if len(top_scores) >= limit and top_scores[0] >= ceiling:
+                break
+
+            members = group_members
+            filter_sets = sorted((tier[1] for tier in tiers if tier[1] is not None), key=len)
+            if filter_sets and len(filter_sets[0]) < len(members):
+                # Interseção percorrendo o filtro, menor que o grupo
+                members = members.intersection(*filter_sets)
+            else:
+                for other in filter_sets:
+                    members = filter(other.__contains__, members)
+            for tier in tiers:
+                if tier[2] is not None:
+                    members, candidates = tee(members)
+                    members = compress(
+                        members,
+                        map(not_, map(tier[2].isdisjoint, map(self._member_words.__getitem__, candidates)))
+                    )
+
+            for member_id in members:
+                if member_id in scored:
+                    continue
+                score = self._score(self._member_words[member_id], token_words)
+                scored[member_id] = score
+                if len(top_scores) < limit:
+                    heapq.heappush(top_scores, score)
+                elif score > top_scores[0]:
+                    heapq.heapreplace(top_scores, score)
+                if len(top_scores) >= limit and top_scores[0] >= ceiling:
+                    break
+
+        best = sorted(
+            scored.items(),
+            key=lambda item: (-item[1], self._member_words[item[0]])
+        )[:limit]
+        return [(member_id, self._names[member_id]) for member_id, _ in best]
+
+    def _driver_groups(self, token: str, words: Dict[str, float]) -> Iterator[Tuple[Set[int], float]]:
+        """
+        Membros das palavras do termo condutor, em grupos (membros, relevância)
+        em ordem decrescente de relevância. Num prefixo curto, todas as
+        palavras menos a igual ao termo valem o mesmo: viram um único grupo,
+        a união em cache (os membros da palavra igual, já vistos, são pulados).
+        """
+        if self._is_cacheable(token, words):
+            if token in words:
+                yield self._word_members[token], self.EXACT_SCORE
+            yield self._members_for(words, token), self.PREFIX_SCORE
+            return
+
+        items = words.items()
+        if not self._is_prefix_match(token, words):
+            items = sorted(items, key=lambda item: (-item[1], item[0]))
+        for word, relevance in items:
+            yield self._word_members[word], relevance
+
+    def _match_words(self, token: str) -> Dict[str, float]:
+        """
+        Retorna as palavras do vocabulário que casam com o termo e sua
+        relevância. Os casamentos por prefixo vêm em ordem de relevância: a
+        palavra igual ao termo, se houver, é a primeira do vocabulário com
+        esse prefixo, e as demais seguem em ordem alfabética.
+        """
+        start = bisect_left(self._vocabulary, token)
+        # '\uffff' é maior que qualquer caractere de um nome normalizado
+        end = bisect_left(self._vocabulary, token + '\uffff', start)
+        if start < end:
+            return {
+                word: self.EXACT_SCORE if word == token else self.PREFIX_SCORE
+                for word in self._vocabulary[start:end]
+            }
+        return self._similar_words(token)
+
+    def _index_trigrams(self, word: str):
+        """Registra os trigramas de uma palavra nova do vocabulário."""
+        grams = _trigrams(word)
+        self._word_trigram_counts[word] = len(grams)
+        for gram in grams:
+            self._trigram_words.setdefault(gram, set()).add(word)
+
+    def _similar_words(self, token: str) -> Dict[str, float]:
+        """Retorna palavras parecidas com o termo, pela similaridade de Jaccard dos trigramas."""
+        query_grams = _trigrams(token)
+        counts = Counter()
+        for gram in query_grams:
+            words = self._trigram_words.get(gram)
+            if words:
+                counts.update(words)
+
+        similar = {}
+        for word, shared in counts.items():
+            similarity = shared / (len(query_grams) + self._word_trigram_counts[word] - shared)
+            if similarity >= self.MIN_SIMILARITY:
+                similar[word] = similarity * self.FUZZY_WEIGHT
+        return similar
+
+    def _members_for(self, words: Dict[str, float], token: str) -> Set[int]:
+        """União dos membros que possuem alguma das palavras que casam com o termo."""
+        if len(words) == 1:
+            return self._word_members[next(iter(words))]
+        if not self._is_cacheable(token, words):
+            return set().union(*(self._word_members[word] for word in words))
+        members = self._short_token_members.get(token)
+        if members is None:
+            members = set().union(*(self._word_members[word] for word in words))
+            self._short_token_members[token] = members
+        return members
+
+    def _is_cacheable(self, token: str, words: Dict[str, float]) -> bool:
+        """True para prefixos curtos (os casamentos aproximados não entram no cache)."""
+        return (
+            len(token) <= self.SHORT_TOKEN_LENGTH
+            and len(words) > 1
+            and self._is_prefix_match(token, words)
+        )
+
+    @staticmethod
+    def _is_prefix_match(token: str, words: Dict[str, float]) -> bool:
+        """True se as palavras casaram por prefixo (só há busca aproximada quando nenhuma casa)."""
+        return next(iter(words)).startswith(token)
+
+    @staticmethod
+    def _score(member_words: Tuple[str, ...], token_words: List[Dict[str, float]]) -> float:
+        """Soma, para cada termo, a melhor relevância entre as palavras do nome do membro."""
+        # Infinito: o mesmo iterador é consumido pelo map de cada termo
+        zeros = repeat(0.0)
+        return sum(max(map(words.get, member_words, zeros), default=0.0) for words in token_words)
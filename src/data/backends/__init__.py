@@ -0,0 +1,45 @@
+"""
+Backends de armazenamento do DataProvider.
+
+O backend é escolhido uma única vez, na criação do DataProvider; todas as
+consultas passam pela interface DataBackend.
+"""
+from .base import DataBackend
+from .memory_backend import InMemoryBackend
+from .sqlite_backend import SQLiteBackend
+
+# Nomes aceitos por create_backend()
+BACKEND_NAMES = ('sqlite', 'sheets', 'memory')
+
+
+def create_backend(name: str) -> DataBackend:
+    """
+    Cria um backend pelo nome.
+
+    Args:
+        name: 'sqlite', 'sheets' ou 'memory'
+
+    Returns:
+        Backend conectado à sua fonte de dados
+
+    Raises:
+        ValueError: Nome de backend desconhecido
+    """
+    if name == 'sqlite':
+        return SQLiteBackend()
+    if name == 'sheets':
+        # Importado só aqui, para não carregar o cliente do Google no modo SQLite
+        from .sheets_backend import SheetsBackend
+        return SheetsBackend()
+    if name == 'memory':
+        return InMemoryBackend()
+    raise ValueError(f"Backend desconhecido: {name!r} (opções: {', '.join(BACKEND_NAMES)})")
+
+
+__all__ = [
+    'DataBackend',
+    'InMemoryBackend',
+    'SQLiteBackend',
+    'BACKEND_NAMES',
+    'create_backend'
+]
@@ -0,0 +1,155 @@
+"""
+Interface comum dos backends de armazenamento do DataProvider.
+"""
+from abc import ABC, abstractmethod
+from array import array
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class DataBackend(ABC):
+    """
+    Fonte de dados usada pelo DataProvider.
+
+    As consultas de membros são obrigatórias. As demais operações têm uma
+    implementação padrão para backends que não as suportam (ex: Google
+    Sheets, que é somente leitura): as escritas avisam e retornam
+    None/False e as consultas de check-in retornam vazio.
+
+    Os membros são dicionários com 'id', 'nome', 'plano', 'vencimento_plano',
+    'estado_plano', 'data_nascimento', 'whatsapp', 'genero', 'frequencia' e
+    'calcado', com as datas em DD/MM/AAAA.
+    """
+
+    # Identificador do backend (ex: 'sqlite') e nome exibido nas mensagens
+    name = ''
+    label = ''
+
+    # True se o backend grava membros e check-ins
+    supports_writes = False
+
+    # Chamado (sem argumentos) quando o backend relê os membros da fonte
+    # fora das escritas do DataProvider (ex: planilha atualizada); o
+    # DataProvider o liga ao evento MEMBERS_RELOADED
+    on_members_reloaded: Optional[Callable[[], None]] = None
+
+    # --- Membros -----------------------------------------------------------
+
+    @abstractmethod
+    def get_all_members(self) -> List[Dict[str, Any]]:
+        """Retorna todos os membros."""
+
+    @abstractmethod
+    def find_members_by_name(self, name: str) -> List[Dict[str, Any]]:
+        """Busca membros por nome (busca parcial, sem diferenciar acentos)."""
+
+    @abstractmethod
+    def get_member_by_id(self, member_id: int) -> Optional[Dict[str, Any]]:
+        """Busca um membro por ID (ou None se não existir)."""
+
+    @abstractmethod
+    def get_birthdays_for_month(self, month: int) -> List[Dict[str, Any]]:
+        """Retorna os aniversariantes do mês, ordenados pelo dia."""
+
+    def add_member(self, member_data: Dict[str, Any]) -> Optional[int]:
+        """Adiciona um membro e retorna o seu ID (ou None)."""
+        self._unsupported("adição de membros")
+        return None
+
+    def update_member(self, member_data: Dict[str, Any]) -> bool:
+        """Atualiza um membro existente ('id' obrigatório em member_data)."""
+        self._unsupported("atualização")
+        return False
+
+    def update_expired_plans(self) -> int:
+        """Marca como INATIVO os planos vencidos e retorna quantos mudaram."""
+        return 0
+
+    # --- Check-ins ---------------------------------------------------------
+
+    def get_member_checkin_history(
+        self,
+        member_id: int,
+        before: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Histórico de check-ins do membro, do mais recente ao mais antigo.
+        Com before=(checkin_datetime, id), só os check-ins anteriores a ele;
+        com limit, no máximo limit check-ins (paginação por chave).
+        """
+        return []
+
+    def get_member_checkin_count(self, member_id: int) -> int:
+        """Número de check-ins do membro."""
+        return len(self.get_member_checkin_history(member_id))
+
+    def add_checkin(self, member_id: int, checkin_datetime: datetime) -> Optional[int]:
+        """Registra um check-in e retorna o seu ID (ou None)."""
+        self._unsupported("check-in")
+        return None
+
+    def delete_checkin(self, checkin_id: int) -> bool:
+        """Remove um check-in."""
+        self._unsupported("exclusão de check-in")
+        return False
+
+    def get_checkin(self, checkin_id: int) -> Optional[Dict[str, Any]]:
+        """Check-in pelo ID (id, member_id, checkin_datetime), ou None."""
+        return None
+
+    def get_checkins_today(self) -> int:
+        """Número de check-ins de hoje."""
+        return 0
+
+    def get_checkins_today_details(self) -> List[Dict[str, Any]]:
+        """Check-ins de hoje (id, member_id, nome, plano, checkin_datetime), do mais recente ao mais antigo."""
+        return []
+
+    def get_last_checkins(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Últimos check-ins (id, nome, checkin_datetime), do mais recente ao mais antigo."""
+        return []
+
+    def get_checkin_stats(
+        self,
+        start_day: date,
+        end_day: date,
+        group_by: Tuple[str, ...] = ('dia',)
+    ) -> List[Dict[str, Any]]:
+        """
+        Totais de check-ins em [start_day, end_day), agrupados por 'dia'
+        (AAAA-MM-DD), 'hora' (0-23) e/ou 'plano' (plano atual do membro).
+        Cada item tem as colunas de group_by e 'total'.
+        """
+        return []
+
+    def get_hourly_checkin_counts(self, start_day: date, end_day: date) -> Tuple[array, array]:
+        """
+        Totais de check-ins por hora em [start_day, end_day), como colunas
+        (horas desde 1970-01-01 00:00, totais) em ordem cronológica.
+        """
+        hours, totals = array('q'), array('q')
+        for row in self.get_checkin_stats(start_day, end_day, ('dia', 'hora')):
+            hours.append((date.fromisoformat(row['dia']) - date(1970, 1, 1)).days * 24 + row['hora'])
+            totals.append(row['total'])
+        return hours, totals
+
+    # --- Ciclo de vida -----------------------------------------------------
+
+    def refresh(self) -> bool:
+        """
+        Atualiza dados mantidos em cache a partir da fonte.
+
+        Returns:
+            True se os dados estão atualizados, False se a fonte não pôde ser lida
+        """
+        return True
+
+    def invalidate_cache(self):
+        """Descarta dados mantidos em cache (a próxima consulta lê da fonte)."""
+
+    def close(self):
+        """Fecha conexões abertas."""
+
+    def _unsupported(self, feature: str):
+        print(f"Aviso: A funcionalidade de {feature} não é suportada para {self.label}.")
@@ -0,0 +1,329 @@
+"""
+Backend em memória: mesmo comportamento do SQLite, sem arquivo nem rede.
+Útil para benchmarks, testes de carga e para exercitar a interface sem
+um gym_database.db ou uma planilha.
+"""
+import threading
+from bisect import bisect_left, insort
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.data.backends.base import DataBackend
+from src.utils.utils import normalize_text, parse_date
+
+# Mesmo formato de data/hora gravado pelo DatabaseManager
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Agrupamentos aceitos por get_checkin_stats (como em checkin_daily_stats)
+CHECKIN_STATS_COLUMNS = ('dia', 'hora', 'plano')
+
+MEMBER_FIELDS = (
+    'nome', 'plano', 'vencimento_plano', 'estado_plano', 'data_nascimento',
+    'whatsapp', 'genero', 'frequencia', 'calcado'
+)
+
+
+class InMemoryBackend(DataBackend):
+    """
+    Membros e check-ins mantidos em dicionários, com as mesmas regras do
+    SQLite: IDs crescentes, datas de membros em DD/MM/AAAA, novos membros
+    ATIVOS e busca por prefixo das palavras do nome (com recurso à busca
+    por trecho). Os check-ins ficam também em uma linha do tempo ordenada,
+    para que as consultas por período sejam buscas binárias. Seguro entre
+    threads.
+    """
+
+    name = 'memory'
+    label = 'memória'
+    supports_writes = True
+
+    def __init__(
+        self,
+        members: Iterable[Dict[str, Any]] = (),
+        checkins: Iterable[Tuple[int, datetime]] = ()
+    ):
+        """
+        Inicializa o backend, opcionalmente já com dados.
+
+        Args:
+            members: Membros iniciais (dicionários como os de add_member)
+            checkins: Check-ins iniciais (id do membro, data e hora)
+        """
+        self._lock = threading.RLock()
+        self._members: Dict[int, Dict[str, Any]] = {}
+        # Índices derivados dos membros (ver _index_member)
+        self._normalized_names: Dict[int, str] = {}
+        self._name_words: Dict[int, Tuple[str, ...]] = {}
+        self._birthdays_by_month: Dict[int, Dict[int, int]] = {}
+        self._birth_months: Dict[int, int] = {}
+        self._checkins: Dict[int, Dict[str, Any]] = {}
+        self._member_checkins: Dict[int, List[Tuple[str, int]]] = {}
+        # (checkin_datetime, id) em ordem cronológica
+        self._timeline: List[Tuple[str, int]] = []
+        self._next_member_id = 1
+        self._next_checkin_id = 1
+
+        for member in members:
+            self.add_member(member)
+        self._load_checkins(checkins)
+
+    # --- Membros -----------------------------------------------------------
+
+    def get_all_members(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            members = [dict(member) for member in self._members.values()]
+        members.sort(key=lambda member: (member['nome'] or '').casefold())
+        return members
+
+    def find_members_by_name(self, name: str) -> List[Dict[str, Any]]:
+        words = normalize_text(name).split()
+        if not words:
+            return []
+
+        with self._lock:
+            # Como o FTS5: cada palavra digitada é prefixo de alguma palavra do nome
+            matches = [
+                member_id for member_id, parts in self._name_words.items()
+                if all(any(part.startswith(word) for part in parts) for word in words)
+            ]
+            if not matches:
+                # Recurso: trecho do nome
+                query = normalize_text(name)
+                matches = [
+                    member_id for member_id, normalized in self._normalized_names.items()
+                    if query in normalized
+                ]
+            results = [dict(self._members[member_id]) for member_id in matches]
+
+        results.sort(key=lambda member: (member['nome'] or '').casefold())
+        return results
+
+    def get_member_by_id(self, member_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            member = self._members.get(member_id)
+            return dict(member) if member else None
+
+    def get_birthdays_for_month(self, month: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            days = self._birthdays_by_month.get(month, {})
+            return [
+                dict(self._members[member_id])
+                for member_id, _ in sorted(days.items(), key=lambda item: item[1])
+            ]
+
+    def add_member(self, member_data: Dict[str, Any]) -> Optional[int]:
+        if not member_data.get('nome'):
+            print("Erro ao adicionar membro: nome é obrigatório.")
+            return None
+
+        now = datetime.now().strftime(DATETIME_FORMAT)
+        with self._lock:
+            member_id = self._next_member_id
+            self._next_member_id += 1
+
+            member = {'id': member_id}
+            for field in MEMBER_FIELDS:
+                member[field] = member_data.get(field) or None
+            # Como no SQLite, novos membros são ativos por padrão
+            member['estado_plano'] = member['estado_plano'] or 'ATIVO'
+            member['created_at'] = now
+            member['updated_at'] = now
+
+            self._members[member_id] = member
+            self._index_member(member_id)
+        return member_id
+
+    def update_member(self, member_data: Dict[str, Any]) -> bool:
+        member_id = member_data.get('id')
+        with self._lock:
+            member = self._members.get(member_id)
+            if member is None:
+                return False
+            for field in MEMBER_FIELDS:
+                if field in member_data:
+                    member[field] = member_data[field] or None
+            member['updated_at'] = datetime.now().strftime(DATETIME_FORMAT)
+            self._index_member(member_id)
+        return True
+
+    def update_expired_plans(self) -> int:
+        today = date.today()
+        updated = 0
+        with self._lock:
+            for member in self._members.values():
+                if member.get('estado_plano') != 'ATIVO':
+                    continue
+                expires = parse_date(member.get('vencimento_plano'))
+                if expires and expires.date() < today:
+                    member['estado_plano'] = 'INATIVO'
+                    updated += 1
+        if updated > 0:
+            print(f"Planos de {updated} membro(s) foram atualizados para 'INATIVO'.")
+        return updated
+
+    def _index_member(self, member_id: int):
+        """Atualiza os índices de nome e de aniversário de um membro (chamado com o lock)."""
+        member = self._members[member_id]
+        normalized = normalize_text(member['nome'] or '')
+        self._normalized_names[member_id] = normalized
+        self._name_words[member_id] = tuple(normalized.split())
+
+        previous_month = self._birth_months.pop(member_id, None)
+        if previous_month is not None:
+            del self._birthdays_by_month[previous_month][member_id]
+        birth_date = parse_date(member.get('data_nascimento'))
+        if birth_date:
+            self._birth_months[member_id] = birth_date.month
+            self._birthdays_by_month.setdefault(birth_date.month, {})[member_id] = birth_date.day
+
+    # --- Check-ins ---------------------------------------------------------
+
+    def get_member_checkin_history(
+        self,
+        member_id: int,
+        before: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            entries = self._member_checkins.get(member_id, [])
+            # Entradas (checkin_datetime, id) em ordem crescente: a página
+            # termina logo antes de `before`
+            end = bisect_left(entries, tuple(before)) if before is not None else len(entries)
+            start = max(end - limit, 0) if limit is not None else 0
+            return [dict(self._checkins[checkin_id]) for _, checkin_id in reversed(entries[start:end])]
+
+    def get_member_checkin_count(self, member_id: int) -> int:
+        with self._lock:
+            return len(self._member_checkins.get(member_id, []))
+
+    def add_checkin(self, member_id: int, checkin_datetime: datetime) -> Optional[int]:
+        with self._lock:
+            if member_id not in self._members:
+                print(f"Erro ao adicionar check-in: membro {member_id} não existe.")
+                return None
+
+            checkin_id = self._next_checkin_id
+            self._next_checkin_id += 1
+
+            timestamp = checkin_datetime.strftime(DATETIME_FORMAT)
+            self._checkins[checkin_id] = {
+                'id': checkin_id,
+                'member_id': member_id,
+                'checkin_datetime': timestamp,
+                'created_at': datetime.now().strftime(DATETIME_FORMAT),
+            }
+            key = (timestamp, checkin_id)
+            insort(self._timeline, key)
+            insort(self._member_checkins.setdefault(member_id, []), key)
+        return checkin_id
+
+    def delete_checkin(self, checkin_id: int) -> bool:
+        with self._lock:
+            checkin = self._checkins.pop(checkin_id, None)
+            if checkin is None:
+                return False
+            key = (checkin['checkin_datetime'], checkin_id)
+            for entries in (self._timeline, self._member_checkins[checkin['member_id']]):
+                position = bisect_left(entries, key)
+                if position < len(entries) and entries[position] == key:
+                    del entries[position]
+        return True
+
+    def get_checkin(self, checkin_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            checkin = self._checkins.get(checkin_id)
+            return dict(checkin) if checkin is not None else None
+
+    def get_checkins_today(self) -> int:
+        start, end = self._today_bounds()
+        with self._lock:
+            return bisect_left(self._timeline, end) - bisect_left(self._timeline, start)
+
+    def get_checkins_today_details(self) -> List[Dict[str, Any]]:
+        start, end = self._today_bounds()
+        with self._lock:
+            keys = self._timeline[bisect_left(self._timeline, start):bisect_left(self._timeline, end)]
+            return [self._checkin_details(checkin_id) for _, checkin_id in reversed(keys)]
+
+    def get_last_checkins(self, limit: int = 5) -> List[Dict[str, Any]]:
+        with self._lock:
+            keys = self._timeline[-limit:] if limit > 0 else []
+            return [
+                {
+                    'id': checkin_id,
+                    'nome': self._members[self._checkins[checkin_id]['member_id']]['nome'],
+                    'checkin_datetime': timestamp,
+                }
+                for timestamp, checkin_id in reversed(keys)
+            ]
+
+    def get_checkin_stats(
+        self,
+        start_day: date,
+        end_day: date,
+        group_by: Tuple[str, ...] = ('dia',)
+    ) -> List[Dict[str, Any]]:
+        if not group_by or any(column not in CHECKIN_STATS_COLUMNS for column in group_by):
+            print(f"Erro ao buscar estatísticas de check-ins: agrupamento inválido {group_by!r}.")
+            return []
+
+        totals: Dict[Tuple[Any, ...], int] = {}
+        with self._lock:
+            start = bisect_left(self._timeline, (start_day.isoformat(),))
+            end = bisect_left(self._timeline, (end_day.isoformat(),))
+            for timestamp, checkin_id in self._timeline[start:end]:
+                values = {
+                    'dia': timestamp[:10],
+                    'hora': int(timestamp[11:13]),
+                    'plano': self._members[self._checkins[checkin_id]['member_id']]['plano'] or '',
+                }
+                key = tuple(values[column] for column in group_by)
+                totals[key] = totals.get(key, 0) + 1
+
+        return [
+            dict(zip(group_by, key), total=total)
+            for key, total in sorted(totals.items())
+        ]
+
+    def _load_checkins(self, checkins: Iterable[Tuple[int, datetime]]):
+        """Carga inicial de check-ins: ordena a linha do tempo uma única vez, em vez de inserir em ordem."""
+        created_at = datetime.now().strftime(DATETIME_FORMAT)
+        with self._lock:
+            for member_id, checkin_datetime in checkins:
+                if member_id not in self._members:
+                    continue
+                checkin_id = self._next_checkin_id
+                self._next_checkin_id += 1
+
+                timestamp = checkin_datetime.strftime(DATETIME_FORMAT)
+                self._checkins[checkin_id] = {
+                    'id': checkin_id,
+                    'member_id': member_id,
+                    'checkin_datetime': timestamp,
+                    'created_at': created_at,
+                }
+                self._timeline.append((timestamp, checkin_id))
+                self._member_checkins.setdefault(member_id, []).append((timestamp, checkin_id))
+
+            self._timeline.sort()
+            for entries in self._member_checkins.values():
+                entries.sort()
+
+    def _checkin_details(self, checkin_id: int) -> Dict[str, Any]:
+        checkin = self._checkins[checkin_id]
+        member = self._members[checkin['member_id']]
+        return {
+            'id': checkin_id,
+            'member_id': checkin['member_id'],
+            'nome': member['nome'],
+            'plano': member['plano'],
+            'checkin_datetime': checkin['checkin_datetime'],
+        }
+
+    @staticmethod
+    def _today_bounds() -> Tuple[Tuple[str], Tuple[str]]:
+        """Limites da linha do tempo para o dia de hoje, no intervalo [início, fim)."""
+        today = date.today().isoformat()
+        # (hoje,) vem antes de qualquer 'AAAA-MM-DD HH:MM:SS' do dia e
+        # (hoje + '~',) depois de todos eles, pois '~' > ' '
+        return (today,), (today + '~',)
@@ -0,0 +1,241 @@
+"""
+Backend Google Sheets (somente leitura): membros da aba do mês atual.
+"""
+import threading
+from typing import Any, Dict, List, Optional
+
+from src import config
+from src.data.backends.base import DataBackend
+from src.data.google_sheets_service import GoogleSheetsService
+from src.data.sheet_cache import SheetCache
+from src.data.sheet_snapshots import SheetSnapshotStore
+from src.data.sheets_requests import SheetsRequestError
+from src.utils.utils import parse_date, get_current_sheet_name, normalize_text
+
+
+# Colunas da planilha lidas para montar os dados de um membro (_row_to_dict)
+MEMBER_SHEET_COLUMNS = (
+    config.COL_NOME,
+    config.COL_PLANO,
+    config.COL_VENCIMENTO_PLANO,
+    config.COL_ESTADO_PLANO,
+    config.COL_DATA_NASCIMENTO,
+    config.COL_WHATSAPP,
+    config.COL_GENERO,
+    config.COL_FREQUENCIA,
+    config.COL_CALCADO,
+)
+
+
+class SheetsBackend(DataBackend):
+    """
+    Dados lidos da aba do mês atual no Google Sheets. O ID de cada membro
+    é o índice da sua linha na aba. O histórico de check-ins só existe no
+    SQLite, então as consultas de check-in retornam vazio.
+    """
+
+    name = 'sheets'
+    label = 'Google Sheets'
+
+    def __init__(self, sheets_service: Optional[GoogleSheetsService] = None):
+        """
+        Inicializa o backend.
+
+        Args:
+            sheets_service: Serviço a usar (padrão: autentica com
+                config.CREDENTIALS_PATH e guarda snapshots em
+                config.SHEETS_SNAPSHOT_PATH)
+        """
+        if sheets_service is None:
+            sheets_service = GoogleSheetsService(
+                config.CREDENTIALS_PATH,
+                snapshot_store=SheetSnapshotStore(config.SHEETS_SNAPSHOT_PATH)
+            )
+            sheets_service.authenticate()
+        self.sheets_service = sheets_service
+        # Aba do mês já processada, reaproveitada entre as consultas
+        self.sheet_cache = SheetCache(
+            config.SHEETS_CACHE_TTL_SECONDS,
+            on_change=self._on_sheet_changed
+        )
+
+        # Começa com o snapshot local (sem esperar a rede) e atualiza a
+        # aba em segundo plano
+        if self._load_snapshot():
+            self.refresh_thread = threading.Thread(target=self.refresh, daemon=True)
+            self.refresh_thread.start()
+
+    def get_all_members(self) -> List[Dict[str, Any]]:
+        sheet = self._get_sheet()
+        if not sheet:
+            return []
+
+        # Cópias, para que alterações feitas pelo chamador não afetem o cache
+        return [dict(member) for member in sheet['members']]
+
+    def find_members_by_name(self, name: str) -> List[Dict[str, Any]]:
+        sheet = self._get_sheet()
+        if not sheet:
+            return []
+
+        name_normalized = normalize_text(name)
+
+        results = []
+        for member, member_name in zip(sheet['members'], sheet['normalized_names']):
+            if name_normalized in member_name:
+                results.append(dict(member))
+
+        return results
+
+    def get_member_by_id(self, member_id: int) -> Optional[Dict[str, Any]]:
+        sheet = self._get_sheet()
+
+        if not sheet or member_id >= len(sheet['rows']):
+            return None
+
+        return self._row_to_dict(sheet['rows'][member_id], member_id)
+
+    def get_birthdays_for_month(self, month: int) -> List[Dict[str, Any]]:
+        birthdays = []
+        for member in self.get_all_members():
+            birth_date = parse_date(member.get('data_nascimento'))
+            if birth_date and birth_date.month == month:
+                birthdays.append((birth_date.day, member))
+
+        # Ordenar por dia
+        birthdays.sort(key=lambda item: item[0])
+        return [member for _, member in birthdays]
+
+    def refresh(self) -> bool:
+        """
+        Atualiza a aba do mês em cache a partir do Google Sheets, sem
+        bloquear as consultas feitas enquanto isso (que recebem os dados
+        atuais do cache). Só baixa a aba se a versão da planilha mudou.
+
+        Returns:
+            True se os dados estão atualizados, False se a planilha não pôde
+            ser lida (ex: sem rede)
+        """
+        sheet_name = get_current_sheet_name()
+        return self.sheet_cache.refresh(
+            sheet_name,
+            lambda: self._load_sheet(sheet_name),
+            lambda: self.sheets_service.get_spreadsheet_revision(config.SPREADSHEET_ID)
+        )
+
+    def invalidate_cache(self):
+        self.sheet_cache.invalidate()
+
+    def _on_sheet_changed(self, sheet_name: str, sheet: Dict[str, Any]):
+        """
+        Aba relida da planilha (atualização em segundo plano, fim da
+        validade do cache ou virada do mês). Os IDs são índices de linha,
+        então quem guarda IDs (ex: o índice de nomes) precisa recarregá-los.
+        """
+        if self.on_members_reloaded is not None:
+            self.on_members_reloaded()
+
+    def _get_sheet(self) -> Optional[Dict[str, Any]]:
+        """
+        Retorna a aba do mês atual já processada, usando o cache.
+        Após a validade do cache, só baixa a aba de novo se a versão da
+        planilha mudou.
+
+        Returns:
+            Dicionário com 'rows' (linhas), 'members' (membros com nome) e
+            'normalized_names' (nomes normalizados, na ordem de 'members'),
+            ou None se a aba não pôde ser lida
+        """
+        sheet_name = get_current_sheet_name()
+        return self.sheet_cache.get(
+            sheet_name,
+            lambda: self._load_sheet(sheet_name),
+            lambda: self.sheets_service.get_spreadsheet_revision(config.SPREADSHEET_ID)
+        )
+
+    def _load_snapshot(self) -> bool:
+        """
+        Coloca em cache o snapshot local da aba do mês, se houver.
+
+        Returns:
+            True se o cache foi preenchido com o snapshot
+        """
+        sheet_name = get_current_sheet_name()
+        snapshot = self.sheets_service.load_snapshot(
+            config.SPREADSHEET_ID,
+            sheet_name,
+            columns=MEMBER_SHEET_COLUMNS
+        )
+        if not snapshot:
+            return False
+
+        sheet = self._build_sheet(snapshot['values'])
+        self.sheet_cache.put(sheet_name, sheet, snapshot['revision'])
+        return sheet is not None
+
+    def _load_sheet(self, sheet_name: str) -> Optional[Dict[str, Any]]:
+        """Baixa uma aba do Google Sheets e processa as linhas de membros."""
+        # Apenas as colunas usadas por _row_to_dict; as colunas de check-in
+        # diário (a maior parte da aba) não são baixadas
+        try:
+            data = self.sheets_service.read_columns(
+                config.SPREADSHEET_ID,
+                MEMBER_SHEET_COLUMNS,
+                sheet_name=sheet_name
+            )
+        except SheetsRequestError as e:
+            # Falha temporária persistente: não entra no cache
+            print(f"Google Sheets indisponível: {e}")
+            return None
+
+        return self._build_sheet(data)
+
+    def _build_sheet(self, data: List[list]) -> Optional[Dict[str, Any]]:
+        """Processa as linhas de uma aba no formato guardado em cache (ver _get_sheet)."""
+        if not data:
+            return None
+
+        members = []
+        for row_index, row in enumerate(data):
+            if row_index == 0:  # Pular cabeçalho
+                continue
+
+            member_dict = self._row_to_dict(row, row_index)
+            if member_dict and member_dict.get('nome'):
+                members.append(member_dict)
+
+        return {
+            'rows': data,
+            'members': members,
+            'normalized_names': [normalize_text(member['nome']) for member in members],
+        }
+
+    @staticmethod
+    def _row_to_dict(row: list, row_index: int) -> Dict[str, Any]:
+        """
+        Converte uma linha da planilha em dicionário.
+
+        Args:
+            row: Lista com os valores da linha
+            row_index: Índice da linha (para usar como ID)
+
+        Returns:
+            Dicionário com os dados do membro
+        """
+        def get_value(col_index: int) -> str:
+            if col_index < len(row) and row[col_index]:
+                return str(row[col_index]).strip()
+            return ""
+
+        return {
+            'id': row_index,  # Usar índice da linha como ID
+            'nome': get_value(config.COL_NOME),
+            'plano': get_value(config.COL_PLANO),
+            'vencimento_plano': get_value(config.COL_VENCIMENTO_PLANO),
+            'estado_plano': get_value(config.COL_ESTADO_PLANO),
+            'data_nascimento': get_value(config.COL_DATA_NASCIMENTO),
+            'whatsapp': get_value(config.COL_WHATSAPP),
+            'genero': get_value(config.COL_GENERO),
+            'frequencia': get_value(config.COL_FREQUENCIA),
+            'calcado': get_value(config.COL_CALCADO),
+        }
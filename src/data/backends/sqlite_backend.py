@@ -0,0 +1,92 @@
+"""
+Backend SQLite: delega as operações ao DatabaseManager.
+"""
+from array import array
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.data.backends.base import DataBackend
+from src.data.database_manager import DatabaseManager
+
+
+class SQLiteBackend(DataBackend):
+    """Dados no banco SQLite local (gym_database.db)."""
+
+    name = 'sqlite'
+    label = 'SQLite'
+    supports_writes = True
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        """
+        Inicializa o backend e conecta ao banco.
+
+        Args:
+            db_manager: DatabaseManager a usar (padrão: banco padrão do aplicativo)
+        """
+        self.db_manager = db_manager or DatabaseManager()
+        self.db_manager.connect()
+
+    def get_all_members(self) -> List[Dict[str, Any]]:
+        return self.db_manager.get_all_members()
+
+    def find_members_by_name(self, name: str) -> List[Dict[str, Any]]:
+        return self.db_manager.find_members_by_name(name)
+
+    def get_member_by_id(self, member_id: int) -> Optional[Dict[str, Any]]:
+        return self.db_manager.get_member_by_id(member_id)
+
+    def get_birthdays_for_month(self, month: int) -> List[Dict[str, Any]]:
+        # Filtragem feita pelo banco, pelas colunas geradas e indexadas
+        return self.db_manager.get_members_by_birthday_month(month)
+
+    def add_member(self, member_data: Dict[str, Any]) -> Optional[int]:
+        return self.db_manager.add_member(member_data)
+
+    def update_member(self, member_data: Dict[str, Any]) -> bool:
+        return self.db_manager.update_member_from_dict(member_data)
+
+    def update_expired_plans(self) -> int:
+        return self.db_manager.update_expired_plans()
+
+    def get_member_checkin_history(
+        self,
+        member_id: int,
+        before: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        return self.db_manager.get_member_checkin_history(member_id, before, limit)
+
+    def get_member_checkin_count(self, member_id: int) -> int:
+        return self.db_manager.get_member_checkin_count(member_id)
+
+    def add_checkin(self, member_id: int, checkin_datetime: datetime) -> Optional[int]:
+        return self.db_manager.add_checkin(member_id, checkin_datetime)
+
+    def delete_checkin(self, checkin_id: int) -> bool:
+        return self.db_manager.delete_checkin(checkin_id)
+
+    def get_checkin(self, checkin_id: int) -> Optional[Dict[str, Any]]:
+        return self.db_manager.get_checkin_by_id(checkin_id)
+
+    def get_checkins_today(self) -> int:
+        return self.db_manager.get_checkins_today()
+
+    def get_checkins_today_details(self) -> List[Dict[str, Any]]:
+        return self.db_manager.get_checkins_today_details()
+
+    def get_last_checkins(self, limit: int = 5) -> List[Dict[str, Any]]:
+        return self.db_manager.get_last_checkins(limit)
+
+    def get_checkin_stats(
+        self,
+        start_day: date,
+        end_day: date,
+        group_by: Tuple[str, ...] = ('dia',)
+    ) -> List[Dict[str, Any]]:
+        return self.db_manager.get_checkin_stats(start_day, end_day, group_by)
+
+    def get_hourly_checkin_counts(self, start_day: date, end_day: date) -> Tuple[array, array]:
+        return self.db_manager.get_hourly_checkin_counts(start_day, end_day)
+
+    def close(self):
+        self.db_manager.close()
@@ -0,0 +1,93 @@
+"""
+Agregação vetorizada (NumPy) das séries de check-ins para o gráfico de
+frequência do dashboard.
+
+A entrada são duas colunas: a hora de cada contagem, em horas desde
+1970-01-01 00:00 (no horário local em que os check-ins foram gravados), e
+o total de check-ins naquela hora. Essas colunas vêm de
+get_hourly_checkin_counts (tabela checkin_daily_stats), então anos de
+histórico chegam aqui em no máximo 24 linhas por dia, e o agrupamento por
+dia, semana ou hora do dia é um único np.bincount.
+"""
+from datetime import date, timedelta
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+# Agrupamentos aceitos por aggregate_checkins
+GRANULARITIES = ('dia', 'semana', 'hora')
+
+EPOCH = date(1970, 1, 1)
+
+# 1970-01-01 foi uma quinta-feira: somando 3 dias, as semanas começam na segunda
+WEEK_OFFSET_DAYS = 3
+
+
+def _epoch_day(day: date) -> int:
+    """Dias desde 1970-01-01."""
+    return (day - EPOCH).days
+
+
+def _epoch_week(epoch_day):
+    """Semana (iniciada na segunda-feira) de um dia ou de um array de dias."""
+    return (epoch_day + WEEK_OFFSET_DAYS) // 7
+
+
+def aggregate_checkins(
+    hours: Sequence[int],
+    totals: Sequence[int],
+    granularity: str,
+    start_day: date,
+    end_day: date
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Agrupa as contagens por hora em barras do gráfico.
+
+    Args:
+        hours: Hora de cada contagem, em horas desde 1970-01-01 00:00
+        totals: Check-ins em cada hora
+        granularity: 'dia', 'semana' (iniciada na segunda) ou 'hora' (do dia)
+        start_day: Primeiro dia do período (inclusivo)
+        end_day: Último dia do período (exclusivo)
+
+    Returns:
+        Tupla (rótulos das barras, totais de cada barra), incluindo as barras
+        sem check-ins
+
+    Raises:
+        ValueError: Agrupamento desconhecido
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Agrupamento desconhecido: {granularity!r} (opções: {', '.join(GRANULARITIES)})")
+
+    hours = np.asarray(hours, dtype=np.int64)
+    totals = np.asarray(totals, dtype=np.int64)
+
+    first_day, last_day = _epoch_day(start_day), _epoch_day(end_day)
+    # Descarta contagens fora do período
+    days = hours // 24
+    inside = (days >= first_day) & (days < last_day)
+    hours, totals, days = hours[inside], totals[inside], days[inside]
+
+    if granularity == 'hora':
+        bins = hours % 24
+        first_bin, bin_count = 0, 24
+        labels = [f"{hour:02d}h" for hour in range(24)]
+    elif granularity == 'dia':
+        first_bin, bin_count = first_day, max(last_day - first_day, 0)
+        bins = days
+        labels = [(start_day + timedelta(days=offset)).strftime('%d/%m') for offset in range(bin_count)]
+    else:
+        first_bin = _epoch_week(first_day)
+        bin_count = max(_epoch_week(last_day - 1) - first_bin + 1, 0) if last_day > first_day else 0
+        bins = _epoch_week(days)
+        # Rótulo: segunda-feira de cada semana
+        first_monday = EPOCH + timedelta(days=first_bin * 7 - WEEK_OFFSET_DAYS)
+        labels = [(first_monday + timedelta(weeks=offset)).strftime('%d/%m') for offset in range(bin_count)]
+
+    if bin_count == 0:
+        return [], np.zeros(0, dtype=np.int64)
+
+    # bincount com pesos devolve float64; os totais são inteiros
+    counts = np.bincount(bins - first_bin, weights=totals, minlength=bin_count)
+    return labels, counts[:bin_count].astype(np.int64)
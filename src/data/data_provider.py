@@ -1,14 +1,16 @@
 """
 Camada de abstração de dados.
-Decide automaticamente se busca dados do SQLite ou Google Sheets.
+Decide automaticamente se busca dados do SQLite ou Google Sheets
+(ver src.data.backends).
 """
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-
-from src import config
-from src.data.google_sheets_service import GoogleSheetsService
-from src.data.database_manager import DatabaseManager
-from src.utils.utils import parse_date, get_current_sheet_name
+from array import array
+from typing import List, Dict, Any, Optional, Tuple, Union
+from datetime import date, datetime
+
+from src.data.backends import DataBackend, create_backend
+from src.core.events import (
+    CHECKIN_ADDED, CHECKIN_DELETED, MEMBER_ADDED, MEMBERS_RELOADED, EventBus, get_event_bus
+)
 from src.core.models import Pessoa
 
 
@@ -22,20 +24,32 @@ USE_SQLITE = True  # Comece com False. Mude para True para ativar SQLite.
 class DataProvider:
     """
     Provedor de dados unificado.
-    Abstrai a fonte de dados (SQLite ou Google Sheets).
+    Abstrai a fonte de dados: todas as operações são delegadas a um backend
+    (SQLite, Google Sheets ou memória), escolhido uma única vez na criação.
     """
     
-    def __init__(self):
-        """Inicializa o provedor de dados."""
-        self.use_sqlite = USE_SQLITE
+    def __init__(
+        self,
+        backend: Union[DataBackend, str, None] = None,
+        event_bus: Optional[EventBus] = None
+    ):
+        """
+        Inicializa o provedor de dados.
         
-        # Inicializar conexões
-        if self.use_sqlite:
-            self.db_manager = DatabaseManager()
-            self.db_manager.connect()
-        else:
-            self.sheets_service = GoogleSheetsService(config.CREDENTIALS_PATH)
-            self.sheets_service.authenticate()
+        Args:
+            backend: Backend a usar, ou o seu nome ('sqlite', 'sheets',
+                'memory'). Se None, usa SQLite ou Google Sheets conforme
+                USE_SQLITE.
+            event_bus: Barramento onde as escritas são publicadas
+                (padrão: o barramento global de src.core.events)
+        """
+        if backend is None:
+            backend = 'sqlite' if USE_SQLITE else 'sheets'
+        if isinstance(backend, str):
+            backend = create_backend(backend)
+        self.backend = backend
+        self.event_bus = event_bus or get_event_bus()
+        self.backend.on_members_reloaded = self._on_members_reloaded
     
     def get_all_members(self) -> List[Dict[str, Any]]:
         """
@@ -44,10 +58,7 @@ class DataProvider:
         Returns:
             Lista de dicionários com dados dos membros
         """
-        if self.use_sqlite:
-            return self._get_all_members_from_sqlite()
-        else:
-            return self._get_all_members_from_sheets()
+        return self.backend.get_all_members()
     
     def find_members_by_name(self, name: str) -> List[Dict[str, Any]]:
         """
@@ -59,10 +70,7 @@ class DataProvider:
         Returns:
             Lista de dicionários com dados dos membros encontrados
         """
-        if self.use_sqlite:
-            return self._find_members_by_name_from_sqlite(name)
-        else:
-            return self._find_members_by_name_from_sheets(name)
+        return self.backend.find_members_by_name(name)
     
     def get_member_by_id(self, member_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -74,10 +82,7 @@ class DataProvider:
         Returns:
             Dicionário com dados do membro ou None
         """
-        if self.use_sqlite:
-            return self._get_member_by_id_from_sqlite(member_id)
-        else:
-            return self._get_member_by_index_from_sheets(member_id)
+        return self.backend.get_member_by_id(member_id)
     
     def get_birthdays_for_month(self, month: int) -> List[Dict[str, Any]]:
         """
@@ -89,22 +94,38 @@ class DataProvider:
         Returns:
             Lista de dicionários com dados dos aniversariantes
         """
-        if self.use_sqlite:
-            return self._get_birthdays_from_sqlite(month)
-        else:
-            return self._get_birthdays_from_sheets(month)
+        return self.backend.get_birthdays_for_month(month)
     
-    def get_member_checkin_history(self, member_id: int) -> List[Dict[str, Any]]:
-        """Busca o histórico de check-ins de um membro."""
-        if self.db_manager:
-            return self.db_manager.get_member_checkin_history(member_id)
-        return []
+    def get_member_checkin_history(
+        self,
+        member_id: int,
+        before: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca o histórico de check-ins de um membro, do mais recente ao mais antigo.
+        
+        Args:
+            member_id: ID do membro
+            before: (checkin_datetime, id) do último check-in já carregado;
+                retorna apenas os anteriores a ele (próxima página)
+            limit: Tamanho da página (None: histórico inteiro)
+            
+        Returns:
+            Lista de dicionários com id, member_id, checkin_datetime e created_at
+        """
+        return self.backend.get_member_checkin_history(member_id, before, limit)
+
+    def get_member_checkin_count(self, member_id: int) -> int:
+        """Retorna o número de check-ins de um membro."""
+        return self.backend.get_member_checkin_count(member_id)
 
     def add_member(self, member_data: Dict[str, Any]) -> Optional[int]:
-        """Delega a adição de um novo membro para o db_manager."""
-        if self.db_manager:
-            return self.db_manager.add_member(member_data)
-        return None
+        """Adiciona um novo membro e retorna o seu ID (ou None). Publica MEMBER_ADDED."""
+        member_id = self.backend.add_member(member_data)
+        if member_id:
+            self.event_bus.publish(MEMBER_ADDED, dict(member_data, id=member_id))
+        return member_id
 
     def update_member(self, member_data: Dict[str, Any]) -> bool:
         """
@@ -116,16 +137,11 @@ class DataProvider:
         Returns:
             True se a atualização foi bem-sucedida, False caso contrário
         """
-        if self.use_sqlite:
-            return self.db_manager.update_member_from_dict(member_data)
-        else:
-            # Funcionalidade não suportada para Google Sheets
-            print("Aviso: A funcionalidade de atualização não é suportada para Google Sheets.")
-            return False
+        return self.backend.update_member(member_data)
 
     def add_checkin(self, member_id: int, checkin_datetime: datetime) -> Optional[int]:
         """
-        Registra um check-in para um membro.
+        Registra um check-in para um membro e publica CHECKIN_ADDED.
         
         Args:
             member_id: ID do membro
@@ -134,16 +150,23 @@ class DataProvider:
         Returns:
             ID do novo registro de check-in ou None
         """
-        if self.use_sqlite:
-            return self.db_manager.add_checkin(member_id, checkin_datetime)
-        else:
-            # Funcionalidade não suportada para Google Sheets
-            print("Aviso: A funcionalidade de check-in não é suportada para Google Sheets.")
-            return None
+        checkin_id = self.backend.add_checkin(member_id, checkin_datetime)
+        # Nome e plano só são buscados se alguém assina o evento
+        if checkin_id and self.event_bus.has_subscribers(CHECKIN_ADDED):
+            member = self.backend.get_member_by_id(member_id) or {}
+            self.event_bus.publish(CHECKIN_ADDED, {
+                'id': checkin_id,
+                'member_id': member_id,
+                'nome': member.get('nome'),
+                'plano': member.get('plano'),
+                # Mesmo formato de get_last_checkins
+                'checkin_datetime': checkin_datetime.isoformat(sep=' ', timespec='seconds'),
+            })
+        return checkin_id
     
     def delete_checkin(self, checkin_id: int) -> bool:
         """
-        Remove um registro de check-in.
+        Remove um registro de check-in e publica CHECKIN_DELETED.
         
         Args:
             checkin_id: ID do check-in a ser removido
@@ -151,182 +174,88 @@ class DataProvider:
         Returns:
             True se a exclusão foi bem-sucedida, False caso contrário
         """
-        if self.use_sqlite:
-            return self.db_manager.delete_checkin(checkin_id)
-        else:
-            # Funcionalidade não suportada para Google Sheets
-            print("Aviso: A funcionalidade de exclusão de check-in não é suportada para Google Sheets.")
-            return False
+        # A data do check-in (para os contadores de quem assina o evento)
+        # só pode ser lida antes da exclusão
+        checkin = None
+        if self.event_bus.has_subscribers(CHECKIN_DELETED):
+            checkin = self.backend.get_checkin(checkin_id)
+        success = self.backend.delete_checkin(checkin_id)
+        if success:
+            self.event_bus.publish(CHECKIN_DELETED, {
+                'id': checkin_id,
+                'checkin_datetime': checkin['checkin_datetime'] if checkin else None,
+            })
+        return success
 
     def get_checkins_today(self) -> int:
         """Retorna o número de check-ins de hoje."""
-        if self.use_sqlite:
-            return self.db_manager.get_checkins_today()
-        return 0
+        return self.backend.get_checkins_today()
 
     def get_checkins_today_details(self) -> List[Dict[str, Any]]:
         """Retorna os detalhes dos check-ins de hoje."""
-        if self.use_sqlite:
-            return self.db_manager.get_checkins_today_details()
-        return []
+        return self.backend.get_checkins_today_details()
 
     def get_last_checkins(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Retorna os últimos check-ins."""
-        if self.use_sqlite:
-            return self.db_manager.get_last_checkins(limit)
-        return []
-
-    def update_expired_plans(self):
-        """Delega a atualização de planos expirados para o db_manager."""
-        if self.db_manager:
-            return self.db_manager.update_expired_plans()
-        return 0
-
-    # ========================================================================
-    # MÉTODOS PRIVADOS - SQLite
-    # ========================================================================
-    
-    def _get_all_members_from_sqlite(self) -> List[Dict[str, Any]]:
-        """Busca todos os membros do SQLite."""
-        return self.db_manager.get_all_members()
-    
-    def _find_members_by_name_from_sqlite(self, name: str) -> List[Dict[str, Any]]:
-        """Busca membros por nome no SQLite."""
-        return self.db_manager.find_members_by_name(name)
-    
-    def _get_member_by_id_from_sqlite(self, member_id: int) -> Optional[Dict[str, Any]]:
-        """Busca membro por ID no SQLite."""
-        return self.db_manager.get_member_by_id(member_id)
-    
-    def _get_birthdays_from_sqlite(self, month: int) -> List[Dict[str, Any]]:
+        return self.backend.get_last_checkins(limit)
+
+    def get_checkin_stats(
+        self,
+        start_day: date,
+        end_day: date,
+        group_by: Tuple[str, ...] = ('dia',)
+    ) -> List[Dict[str, Any]]:
         """
-        Busca aniversariantes do mês no SQLite.
-        Delega a filtragem para o banco de dados para melhor performance.
-        """
-        return self.db_manager.get_members_by_birthday_month(month)
-    
-    def _get_member_checkin_history_from_sqlite(self, member_id: int) -> List[Dict[str, Any]]:
-        """Busca histórico de check-ins do membro no SQLite."""
-        return self.db_manager.get_member_checkin_history(member_id)
-    
-    # ========================================================================
-    # MÉTODOS PRIVADOS - Google Sheets
-    # ========================================================================
-    
-    def _get_all_members_from_sheets(self) -> List[Dict[str, Any]]:
-        """Busca todos os membros do Google Sheets."""
-        sheet_name = get_current_sheet_name()
-        data = self.sheets_service.read_spreadsheet(
-            config.SPREADSHEET_ID,
-            range_name='A:BT',
-            sheet_name=sheet_name
-        )
-        
-        if not data:
-            return []
+        Retorna os totais de check-ins de um período.
         
-        members = []
-        for row_index, row in enumerate(data):
-            if row_index == 0:  # Pular cabeçalho
-                continue
+        Args:
+            start_day: Primeiro dia (inclusivo)
+            end_day: Último dia (exclusivo)
+            group_by: Agrupamento, entre 'dia', 'hora' e 'plano'
             
-            member_dict = self._row_to_dict(row, row_index)
-            if member_dict and member_dict.get('nome'):
-                members.append(member_dict)
-        
-        return members
-    
-    def _find_members_by_name_from_sheets(self, name: str) -> List[Dict[str, Any]]:
-        """Busca membros por nome no Google Sheets."""
-        all_members = self._get_all_members_from_sheets()
-        name_lower = name.lower()
-        
-        results = []
-        for member in all_members:
-            if name_lower in member.get('nome', '').lower():
-                results.append(member)
-        
-        return results
-    
-    def _get_member_by_index_from_sheets(self, row_index: int) -> Optional[Dict[str, Any]]:
-        """Busca membro por índice da linha no Google Sheets."""
-        sheet_name = get_current_sheet_name()
-        data = self.sheets_service.read_spreadsheet(
-            config.SPREADSHEET_ID,
-            range_name='A:BT',
-            sheet_name=sheet_name
-        )
-        
-        if not data or row_index >= len(data):
-            return None
-        
-        return self._row_to_dict(data[row_index], row_index)
-    
-    def _get_birthdays_from_sheets(self, month: int) -> List[Dict[str, Any]]:
-        """Busca aniversariantes do mês no Google Sheets."""
-        all_members = self._get_all_members_from_sheets()
-        birthdays = []
-        
-        for member in all_members:
-            birth_date_str = member.get('data_nascimento')
-            if birth_date_str:
-                birth_date = parse_date(birth_date_str)
-                if birth_date and birth_date.month == month:
-                    birthdays.append(member)
-        
-        # Função auxiliar para ordenação segura
-        def get_day(member_dict: Dict[str, Any]) -> int:
-            date_str = member_dict.get('data_nascimento')
-            if not date_str:
-                return 0
-            date_obj = parse_date(date_str)
-            return date_obj.day if date_obj else 0
-
-        # Ordenar por dia
-        birthdays.sort(key=get_day)
-        return birthdays
-    
-    def _get_member_checkin_history_from_sheets(self, member_id: int) -> List[Dict[str, Any]]:
-        """
-        Busca histórico de check-ins do membro no Google Sheets.
-        Nota: Esta funcionalidade não está disponível para Google Sheets,
-        pois o histórico de check-ins só é armazenado no SQLite.
+        Returns:
+            Lista de dicionários com as colunas de group_by e 'total'
         """
-        return []
-    
-    def _row_to_dict(self, row: list, row_index: int) -> Dict[str, Any]:
+        return self.backend.get_checkin_stats(start_day, end_day, group_by)
+
+    def get_hourly_checkin_counts(self, start_day: date, end_day: date) -> Tuple[array, array]:
         """
-        Converte uma linha da planilha em dicionário.
+        Retorna os totais de check-ins por hora de um período, como colunas.
         
         Args:
-            row: Lista com os valores da linha
-            row_index: Índice da linha (para usar como ID)
+            start_day: Primeiro dia (inclusivo)
+            end_day: Último dia (exclusivo)
             
         Returns:
-            Dicionário com os dados do membro
+            Tupla (horas desde 1970-01-01 00:00, totais), em ordem cronológica
         """
-        def get_value(col_index: int) -> str:
-            if col_index < len(row) and row[col_index]:
-                return str(row[col_index]).strip()
-            return ""
+        return self.backend.get_hourly_checkin_counts(start_day, end_day)
+
+    def update_expired_plans(self) -> int:
+        """Marca como INATIVO os planos vencidos e retorna quantos mudaram."""
+        return self.backend.update_expired_plans()
+
+    def refresh(self) -> bool:
+        """
+        Atualiza os dados em cache a partir da fonte (Google Sheets), sem
+        bloquear as consultas feitas enquanto isso.
         
-        return {
-            'id': row_index,  # Usar índice da linha como ID
-            'nome': get_value(config.COL_NOME),
-            'plano': get_value(config.COL_PLANO),
-            'vencimento_plano': get_value(config.COL_VENCIMENTO_PLANO),
-            'estado_plano': get_value(config.COL_ESTADO_PLANO),
-            'data_nascimento': get_value(config.COL_DATA_NASCIMENTO),
-            'whatsapp': get_value(config.COL_WHATSAPP),
-            'genero': get_value(config.COL_GENERO),
-            'frequencia': get_value(config.COL_FREQUENCIA),
-            'calcado': get_value(config.COL_CALCADO),
-        }
+        Returns:
+            True se os dados estão atualizados, False se a fonte não pôde ser lida
+        """
+        return self.backend.refresh()
+
+    def invalidate_cache(self):
+        """Descarta os dados em cache (a próxima consulta lê da fonte de novo)."""
+        self.backend.invalidate_cache()
     
     def close(self):
         """Fecha conexões abertas."""
-        if self.use_sqlite and hasattr(self, 'db_manager'):
-            self.db_manager.close()
+        self.backend.close()
+
+    def _on_members_reloaded(self):
+        """Publica MEMBERS_RELOADED quando o backend relê os membros da fonte."""
+        self.event_bus.publish(MEMBERS_RELOADED, {})
 
 
 # ============================================================================
@@ -345,6 +274,22 @@ def get_provider() -> DataProvider:
     return _provider
 
 
+def set_provider(provider: Optional[DataProvider]) -> Optional[DataProvider]:
+    """
+    Substitui a instância global do DataProvider (ex: por um com backend
+    em memória, em benchmarks e testes de carga).
+    
+    Args:
+        provider: Novo provider; se None, o próximo get_provider() cria o padrão
+        
+    Returns:
+        O provider anterior (ou None)
+    """
+    global _provider
+    previous, _provider = _provider, provider
+    return previous
+
+
 def get_all_members() -> List[Dict[str, Any]]:
     """Retorna todos os membros."""
     return get_provider().get_all_members()
@@ -365,9 +310,18 @@ def get_birthdays_for_month(month: int) -> List[Dict[str, Any]]:
     return get_provider().get_birthdays_for_month(month)
 
 
-def get_member_checkin_history(member_id: int) -> List[Dict[str, Any]]:
-    """Retorna histórico completo de check-ins de um membro."""
-    return get_provider().get_member_checkin_history(member_id)
+def get_member_checkin_history(
+    member_id: int,
+    before: Optional[Tuple[str, int]] = None,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Retorna o histórico de check-ins de um membro (inteiro ou uma página)."""
+    return get_provider().get_member_checkin_history(member_id, before, limit)
+
+
+def get_member_checkin_count(member_id: int) -> int:
+    """Retorna o número de check-ins de um membro."""
+    return get_provider().get_member_checkin_count(member_id)
 
 
 def add_member(member_data: Dict[str, Any]) -> Optional[int]:
@@ -391,6 +345,18 @@ def get_last_checkins(limit: int = 5) -> List[Dict[str, Any]]:
     """Retorna os últimos check-ins."""
     return get_provider().get_last_checkins(limit)
 
+def get_checkin_stats(
+    start_day: date,
+    end_day: date,
+    group_by: Tuple[str, ...] = ('dia',)
+) -> List[Dict[str, Any]]:
+    """Retorna os totais de check-ins de um período, por dia, hora e/ou plano."""
+    return get_provider().get_checkin_stats(start_day, end_day, group_by)
+
+def get_hourly_checkin_counts(start_day: date, end_day: date) -> Tuple[array, array]:
+    """Retorna os totais de check-ins por hora de um período, como colunas."""
+    return get_provider().get_hourly_checkin_counts(start_day, end_day)
+
 
 def update_member(member_data: Dict[str, Any]) -> bool:
     """
@@ -4,13 +4,75 @@ Responsável por toda a comunicação com o banco de dados.
 """
 import sqlite3
 import os
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import threading
+import weakref
+from array import array
+from itertools import islice
+from typing import Optional, List, Dict, Any, Tuple, Iterable
+from datetime import datetime, date, time, timedelta
 from src.core.models import Pessoa
+from src.data.migrations import MIGRATIONS, REBUILD_CHECKIN_STATS_SQL
+from src.utils.utils import to_iso_date, format_date_br
+
+
+class _ThreadConnection:
+    """
+    Conexão SQLite usada por uma única thread.
+    Fica guardada em um threading.local, então é fechada automaticamente
+    quando a thread termina e a referência é descartada.
+    """
+    
+    def __init__(self, connection: sqlite3.Connection, generation: int):
+        self.connection = connection
+        self.generation = generation
+    
+    def close(self):
+        """Fecha a conexão, ignorando erros de uma conexão já fechada."""
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except sqlite3.Error:
+                pass
+            self.connection = None
+    
+    def __del__(self):
+        self.close()
 
 
 class DatabaseManager:
-    """Gerencia todas as operações com o banco de dados SQLite."""
+    """
+    Gerencia todas as operações com o banco de dados SQLite.
+    
+    Cada thread (GUI e workers) usa a sua própria conexão, aberta sob
+    demanda na primeira vez que acessa `self.connection`. O banco opera em
+    modo WAL: leituras (dashboard, histórico) não bloqueiam a escrita dos
+    check-ins, e escritas concorrentes esperam até busy_timeout.
+    """
+    
+    # Ajustes aplicados a cada nova conexão
+    BUSY_TIMEOUT_MS = 5000
+    CACHE_SIZE_KIB = 16 * 1024
+    MMAP_SIZE_BYTES = 64 * 1024 * 1024
+    
+    # Formato em que checkin_datetime é armazenado; a ordem lexicográfica
+    # das strings coincide com a ordem cronológica
+    DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+    
+    # Colunas de data de membros, armazenadas em ISO (AAAA-MM-DD) e
+    # expostas para o restante da aplicação como DD/MM/AAAA
+    MEMBER_DATE_COLUMNS = ('data_nascimento', 'vencimento_plano')
+    
+    # Colunas gravadas pelas inserções em lote de membros
+    MEMBER_COLUMNS = (
+        'nome', 'plano', 'vencimento_plano', 'estado_plano', 'data_nascimento',
+        'whatsapp', 'genero', 'frequencia', 'calcado'
+    )
+    
+    # Linhas por transação nas inserções em lote
+    BULK_CHUNK_SIZE = 5000
+    
+    # Colunas pelas quais os totais de checkin_daily_stats podem ser agrupados
+    CHECKIN_STATS_COLUMNS = ('dia', 'hora', 'plano')
     
     def __init__(self, db_path: str = "gym_database.db"):
         """
@@ -23,27 +85,76 @@ class DatabaseManager:
         project_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.db_path = os.path.join(project_dir, db_path)
         
-        self.connection = None
+        # Conexões por thread; a geração muda a cada connect()/close() para
+        # que threads não reaproveitem conexões de uma sessão anterior
+        self._local = threading.local()
+        self._thread_connections = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._is_connected = False
+    
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Conexão da thread atual, aberta sob demanda.
+        
+        Returns:
+            Conexão SQLite ou None se o banco não estiver conectado
+        """
+        if not self._is_connected:
+            return None
+        
+        holder = getattr(self._local, 'holder', None)
+        if holder is None or holder.connection is None or holder.generation != self._generation:
+            try:
+                holder = _ThreadConnection(self._open_connection(), self._generation)
+            except Exception as e:
+                print(f"Erro ao abrir conexão com o banco de dados: {e}")
+                return None
+            self._local.holder = holder
+            with self._lock:
+                self._thread_connections.add(holder)
+        return holder.connection
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Abre uma nova conexão e aplica os PRAGMAs de desempenho."""
+        # Cada conexão é usada por uma única thread; check_same_thread=False
+        # só permite que close() as feche a partir da thread principal
+        connection = sqlite3.connect(
+            self.db_path,
+            timeout=self.BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False
+        )
+        connection.row_factory = sqlite3.Row  # Permite acessar colunas por nome
+        
+        # WAL: leitores não bloqueiam o escritor (e vice-versa); com WAL,
+        # synchronous=NORMAL continua seguro contra corrupção
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute(f"PRAGMA busy_timeout = {int(self.BUSY_TIMEOUT_MS)}")
+        # Valor negativo de cache_size é em KiB
+        connection.execute(f"PRAGMA cache_size = -{int(self.CACHE_SIZE_KIB)}")
+        connection.execute(f"PRAGMA mmap_size = {int(self.MMAP_SIZE_BYTES)}")
+        return connection
     
     def connect(self) -> bool:
         """
-        Cria a conexão com o banco de dados.
+        Conecta ao banco de dados e garante que o esquema esteja atualizado.
         
         Returns:
             True se a conexão foi bem-sucedida, False caso contrário
         """
-        try:
-            # check_same_thread=False permite uso da conexão em múltiplas threads
-            # Isso é seguro para nossa aplicação read-only
-            self.connection = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False
-            )
-            self.connection.row_factory = sqlite3.Row  # Permite acessar colunas por nome
-            return True
-        except Exception as e:
-            print(f"Erro ao conectar ao banco de dados: {e}")
+        with self._lock:
+            self._generation += 1
+            self._is_connected = True
+        
+        # Abre a conexão da thread atual para validar o arquivo do banco
+        if self.connection is None:
+            self._is_connected = False
             return False
+        
+        # Garante que o esquema exista e atualiza bancos antigos no próprio arquivo
+        return self.create_tables()
     
     def create_tables(self) -> bool:
         """
@@ -87,10 +198,59 @@ class DatabaseManager:
             """)
             
             self.connection.commit()
-            return True
         except Exception as e:
             print(f"Erro ao criar tabelas: {e}")
             return False
+        
+        return self.migrate()
+    
+    def get_schema_version(self) -> int:
+        """
+        Retorna a versão atual do esquema (PRAGMA user_version).
+        
+        Returns:
+            Versão do esquema, 0 para bancos sem migrações aplicadas
+        """
+        if not self.connection:
+            return 0
+        cursor = self.connection.cursor()
+        cursor.execute("PRAGMA user_version")
+        return cursor.fetchone()[0]
+    
+    def migrate(self) -> bool:
+        """
+        Aplica as migrações de esquema pendentes, em ordem.
+        Cada migração roda em sua própria transação junto com a
+        atualização do PRAGMA user_version.
+        
+        Returns:
+            True se o esquema está na versão mais recente, False caso contrário
+        """
+        if not self.connection:
+            return False
+        try:
+            current_version = self.get_schema_version()
+            
+            for version, description, apply_migration in MIGRATIONS:
+                if version <= current_version:
+                    continue
+                
+                print(f"    - Aplicando migração {version}: {description}...")
+                cursor = self.connection.cursor()
+                cursor.execute("BEGIN")
+                try:
+                    apply_migration(cursor)
+                    # PRAGMA não aceita parâmetros; a versão é sempre um inteiro
+                    cursor.execute(f"PRAGMA user_version = {int(version)}")
+                    self.connection.commit()
+                except Exception:
+                    self.connection.rollback()
+                    raise
+            
+            return True
+        except Exception as e:
+            print(f"Erro ao aplicar migrações: {e}")
+            return False
     
     def recreate_tables(self) -> bool:
         """
@@ -107,10 +267,16 @@ class DatabaseManager:
             
             print("    - Apagando tabela 'frequencia' (se existir)...")
             cursor.execute("DROP TABLE IF EXISTS frequencia")
+            cursor.execute("DROP TABLE IF EXISTS checkin_daily_stats")
+            cursor.execute("DROP TABLE IF EXISTS sincronizacao_abas")
             
             print("    - Apagando tabela 'membros' (se existir)...")
+            cursor.execute("DROP TABLE IF EXISTS membros_fts")
             cursor.execute("DROP TABLE IF EXISTS membros")
             
+            # Os índices e triggers foram apagados junto com as tabelas
+            cursor.execute("PRAGMA user_version = 0")
+            
             self.connection.commit()
             
             # Agora, chama o método existente para criar as tabelas limpas
@@ -121,6 +287,14 @@ class DatabaseManager:
             return False
 
     
+    def _member_from_row(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Converte uma linha de membros em dicionário, com as datas em DD/MM/AAAA."""
+        member = dict(row)
+        for column in self.MEMBER_DATE_COLUMNS:
+            if column in member:
+                member[column] = format_date_br(member[column])
+        return member
+    
     def add_member(self, pessoa_obj: Pessoa) -> Optional[int]:
         """
         Adiciona um novo membro ao banco de dados.
@@ -144,9 +318,9 @@ class DatabaseManager:
             """, (
                 pessoa_obj.nome,
                 pessoa_obj.plano,
-                pessoa_obj.vencimento_plano,
+                to_iso_date(pessoa_obj.vencimento_plano),
                 pessoa_obj.estado_plano,
-                pessoa_obj.data_nascimento.strftime('%d/%m/%Y') if pessoa_obj.data_nascimento else None,
+                pessoa_obj.data_nascimento.strftime('%Y-%m-%d') if pessoa_obj.data_nascimento else None,
                 pessoa_obj.whatsapp,
                 pessoa_obj.genero,
                 pessoa_obj.frequencia,
@@ -176,6 +350,11 @@ class DatabaseManager:
         # Define o estado do plano como 'ATIVO' por padrão para novos membros
         if 'estado_plano' not in member_data:
             member_data['estado_plano'] = 'ATIVO'
+        
+        # Datas são armazenadas em ISO
+        for column in self.MEMBER_DATE_COLUMNS:
+            if column in member_data:
+                member_data[column] = to_iso_date(member_data[column])
 
         # Prepara a query de inserção
         columns = ', '.join(member_data.keys())
@@ -202,6 +381,188 @@ class DatabaseManager:
             if cursor:
                 cursor.close()
 
+    def bulk_add_members(
+        self,
+        members: Iterable[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        raise_errors: bool = False
+    ) -> Dict[str, int]:
+        """
+        Adiciona vários membros com executemany, em transações de até
+        `chunk_size` linhas (um commit por lote em vez de um por membro).
+        
+        Args:
+            members: Iterável de dicionários com os dados dos membros
+            chunk_size: Linhas por transação (padrão: BULK_CHUNK_SIZE)
+            raise_errors: Se True, um erro do banco é repassado em vez de
+                retornar o resultado parcial
+            
+        Returns:
+            Dicionário nome -> ID dos membros inseridos. Em caso de erro,
+            contém apenas os lotes já gravados.
+        """
+        id_map: Dict[str, int] = {}
+        if not self.connection:
+            print("Erro: Conexão com o banco de dados não estabelecida.")
+            return id_map
+        
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        placeholders = ', '.join('?' for _ in self.MEMBER_COLUMNS)
+        query = f"INSERT INTO membros ({', '.join(self.MEMBER_COLUMNS)}) VALUES ({placeholders})"
+        
+        members = iter(members)
+        cursor = self.connection.cursor()
+        try:
+            while True:
+                chunk = list(islice(members, chunk_size))
+                if not chunk:
+                    break
+                
+                rows = [self._member_values(member) for member in chunk]
+                
+                # BEGIN IMMEDIATE reserva a escrita: nenhum outro processo
+                # insere no meio do lote, então os IDs são consecutivos
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    first_id = self._next_member_id(cursor)
+                    cursor.executemany(query, rows)
+                    if self._next_member_id(cursor) != first_id + len(rows):
+                        raise sqlite3.DatabaseError("IDs gerados fora de sequência")
+                    self.connection.commit()
+                except Exception:
+                    self.connection.rollback()
+                    raise
+                
+                for offset, row in enumerate(rows):
+                    id_map[row[0]] = first_id + offset
+            
+            return id_map
+        except sqlite3.Error as e:
+            if raise_errors:
+                raise
+            print(f"Erro ao adicionar membros em lote: {e}")
+            return id_map
+        finally:
+            cursor.close()
+    
+    def upsert_members(
+        self,
+        members: Iterable[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        raise_errors: bool = False
+    ) -> Dict[str, int]:
+        """
+        Sincroniza membros identificados pelo nome: insere os novos e atualiza
+        apenas os existentes cujos dados mudaram. Campos ausentes (ou vazios)
+        no dicionário mantêm o valor atual do banco.
+        
+        Args:
+            members: Iterável de dicionários com os dados dos membros
+            chunk_size: Linhas por transação nas inserções (padrão: BULK_CHUNK_SIZE)
+            raise_errors: Se True, um erro do banco é repassado em vez de
+                retornar o resultado parcial
+            
+        Returns:
+            Dicionário nome -> ID dos membros recebidos (em caso de erro,
+            apenas os já gravados)
+        """
+        id_map: Dict[str, int] = {}
+        if not self.connection:
+            print("Erro: Conexão com o banco de dados não estabelecida.")
+            return id_map
+        
+        cursor = self.connection.cursor()
+        try:
+            # Dados atuais por nome (o membro mais antigo, em caso de nomes repetidos)
+            cursor.execute(f"SELECT id, {', '.join(self.MEMBER_COLUMNS)} FROM membros ORDER BY id DESC")
+            existing = {row['nome']: (row[0], tuple(row)[1:]) for row in cursor.fetchall()}
+            
+            new_members = []
+            updates = []
+            for member in members:
+                current = existing.get(member.get('nome'))
+                if current is None:
+                    new_members.append(member)
+                    continue
+                
+                member_id, current_values = current
+                id_map[member['nome']] = member_id
+                values = self._member_values(member, default_estado=False, blank_as_none=True)
+                if any(value is not None and value != old for value, old in zip(values, current_values)):
+                    updates.append(values + (member_id,))
+            
+            if updates:
+                assignments = ', '.join(f"{column} = COALESCE(?, {column})" for column in self.MEMBER_COLUMNS)
+                cursor.execute("BEGIN")
+                try:
+                    cursor.executemany(
+                        f"UPDATE membros SET {assignments}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                        updates
+                    )
+                    self.connection.commit()
+                except Exception:
+                    self.connection.rollback()
+                    raise
+        except sqlite3.Error as e:
+            if raise_errors:
+                raise
+            print(f"Erro ao sincronizar membros: {e}")
+            return id_map
+        finally:
+            cursor.close()
+        
+        id_map.update(self.bulk_add_members(new_members, chunk_size, raise_errors))
+        print(f"Membros sincronizados: {len(new_members)} novo(s), {len(updates)} atualizado(s).")
+        return id_map
+    
+    def get_member_ids_by_name(self) -> Dict[str, int]:
+        """
+        Retorna o ID de cada nome de membro (o mais antigo, em caso de nomes repetidos).
+        
+        Returns:
+            Dicionário nome -> ID
+        """
+        if not self.connection:
+            return {}
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT id, nome FROM membros ORDER BY id DESC")
+            return {row['nome']: row['id'] for row in cursor.fetchall()}
+        except Exception as e:
+            print(f"Erro ao buscar IDs dos membros: {e}")
+            return {}
+    
+    def _member_values(
+        self,
+        member_data: Dict[str, Any],
+        default_estado: bool = True,
+        blank_as_none: bool = False
+    ) -> Tuple[Any, ...]:
+        """
+        Valores de MEMBER_COLUMNS para gravação, com as mesmas regras de
+        add_member (datas em ISO e, opcionalmente, estado 'ATIVO' por padrão).
+        Com blank_as_none, textos vazios viram None (no upsert, None mantém
+        o valor atual do banco).
+        """
+        values = []
+        for column in self.MEMBER_COLUMNS:
+            value = member_data.get(column)
+            if blank_as_none and isinstance(value, str) and not value.strip():
+                value = None
+            if column == 'estado_plano' and column not in member_data and default_estado:
+                value = 'ATIVO'
+            elif column in self.MEMBER_DATE_COLUMNS:
+                value = to_iso_date(value)
+            values.append(value)
+        return tuple(values)
+    
+    @staticmethod
+    def _next_member_id(cursor: sqlite3.Cursor) -> int:
+        """Próximo ID que o AUTOINCREMENT de membros vai gerar."""
+        cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'membros'")
+        row = cursor.fetchone()
+        return (row[0] if row else 0) + 1
+    
     def get_member_by_id(self, member_id: int) -> Optional[Dict[str, Any]]:
         """
         Busca um membro pelo seu ID.
@@ -220,15 +581,35 @@ class DatabaseManager:
             row = cursor.fetchone()
             
             if row:
-                return dict(row)
+                return self._member_from_row(row)
             return None
         except Exception as e:
             print(f"Erro ao buscar membro por ID: {e}")
             return None
     
+    @staticmethod
+    def _build_fts_query(name_query: str) -> str:
+        """
+        Monta a expressão MATCH do FTS5: cada palavra digitada vira um prefixo
+        entre aspas e todas precisam estar presentes no nome.
+        
+        Args:
+            name_query: Texto digitado pelo usuário (ex: 'joao sil')
+            
+        Returns:
+            Expressão FTS5 (ex: '"joao"* "sil"*') ou string vazia
+        """
+        terms = []
+        for word in name_query.split():
+            # Aspas duplas dentro do termo são escapadas duplicando-as
+            terms.append('"' + word.replace('"', '""') + '"*')
+        return ' '.join(terms)
+    
     def find_members_by_name(self, name_query: str) -> List[Dict[str, Any]]:
         """
-        Busca membros por nome (busca parcial).
+        Busca membros por nome (busca parcial, sem diferenciar acentos).
+        Usa o índice FTS5 com prefixos de palavras, ordenado por relevância (bm25).
+        Se nenhuma palavra casar, recorre à busca por trecho do nome (LIKE).
         
         Args:
             name_query: Nome ou parte do nome a buscar
@@ -240,13 +621,27 @@ class DatabaseManager:
             return []
         try:
             cursor = self.connection.cursor()
-            cursor.execute(
-                "SELECT * FROM membros WHERE nome LIKE ? ORDER BY nome",
-                (f"%{name_query}%",)
-            )
-            rows = cursor.fetchall()
+            rows = []
+            
+            fts_query = self._build_fts_query(name_query)
+            if fts_query:
+                cursor.execute("""
+                    SELECT m.*
+                    FROM membros_fts
+                    JOIN membros m ON m.id = membros_fts.rowid
+                    WHERE membros_fts MATCH ?
+                    ORDER BY bm25(membros_fts), m.nome COLLATE NOCASE
+                """, (fts_query,))
+                rows = cursor.fetchall()
+            
+            if not rows:
+                cursor.execute(
+                    "SELECT * FROM membros WHERE nome LIKE ? ORDER BY nome COLLATE NOCASE",
+                    (f"%{name_query}%",)
+                )
+                rows = cursor.fetchall()
             
-            return [dict(row) for row in rows]
+            return [self._member_from_row(row) for row in rows]
         except Exception as e:
             print(f"Erro ao buscar membros por nome: {e}")
             return []
@@ -262,10 +657,10 @@ class DatabaseManager:
             return []
         try:
             cursor = self.connection.cursor()
-            cursor.execute("SELECT * FROM membros ORDER BY nome")
+            cursor.execute("SELECT * FROM membros ORDER BY nome COLLATE NOCASE")
             rows = cursor.fetchall()
             
-            return [dict(row) for row in rows]
+            return [self._member_from_row(row) for row in rows]
         except Exception as e:
             print(f"Erro ao buscar todos os membros: {e}")
             return []
@@ -289,7 +684,7 @@ class DatabaseManager:
             cursor.execute("""
                 INSERT INTO frequencia (member_id, checkin_datetime)
                 VALUES (?, ?)
-            """, (member_id, checkin_datetime.strftime('%Y-%m-%d %H:%M:%S')))
+            """, (member_id, checkin_datetime.strftime(self.DATETIME_FORMAT)))
             
             self.connection.commit()
             return cursor.lastrowid
@@ -297,6 +692,124 @@ class DatabaseManager:
             print(f"Erro ao adicionar check-in: {e}")
             return None
     
+    def bulk_add_checkins(
+        self,
+        checkins: Iterable[Tuple[int, datetime]],
+        chunk_size: Optional[int] = None,
+        skip_existing: bool = False,
+        raise_errors: bool = False
+    ) -> int:
+        """
+        Adiciona vários check-ins com executemany, em transações de até
+        `chunk_size` linhas.
+        
+        Args:
+            checkins: Iterável de tuplas (member_id, checkin_datetime)
+            chunk_size: Linhas por transação (padrão: BULK_CHUNK_SIZE)
+            skip_existing: Se True, ignora check-ins que já existem para o
+                mesmo membro e horário (usa idx_frequencia_member_datetime)
+            raise_errors: Se True, um erro é repassado em vez de retornar o
+                resultado parcial
+            
+        Returns:
+            Número de check-ins gravados (em caso de erro, apenas os dos
+            lotes já gravados)
+        """
+        if not self.connection:
+            return 0
+        
+        if skip_existing:
+            query = """
+                INSERT INTO frequencia (member_id, checkin_datetime)
+                SELECT :member_id, :checkin_datetime
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM frequencia
+                    WHERE member_id = :member_id AND checkin_datetime = :checkin_datetime
+                )
+            """
+        else:
+            query = """
+                INSERT INTO frequencia (member_id, checkin_datetime)
+                VALUES (:member_id, :checkin_datetime)
+            """
+        
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        checkins = iter(checkins)
+        total = 0
+        cursor = self.connection.cursor()
+        try:
+            while True:
+                chunk = [
+                    {'member_id': member_id, 'checkin_datetime': checkin_datetime.strftime(self.DATETIME_FORMAT)}
+                    for member_id, checkin_datetime in islice(checkins, chunk_size)
+                ]
+                if not chunk:
+                    break
+                
+                cursor.execute("BEGIN")
+                try:
+                    cursor.executemany(query, chunk)
+                    # rowcount soma as linhas inseridas por todas as execuções
+                    inserted = cursor.rowcount
+                    self.connection.commit()
+                except Exception:
+                    self.connection.rollback()
+                    raise
+                total += inserted
+            
+            return total
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"Erro ao adicionar check-ins em lote: {e}")
+            return total
+        finally:
+            cursor.close()
+    
+    def get_sync_state(self) -> Dict[str, str]:
+        """
+        Retorna o hash do conteúdo de cada aba na última sincronização.
+        
+        Returns:
+            Dicionário aba -> hash
+        """
+        if not self.connection:
+            return {}
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT aba, hash_conteudo FROM sincronizacao_abas")
+            return {row['aba']: row['hash_conteudo'] for row in cursor.fetchall()}
+        except Exception as e:
+            print(f"Erro ao ler estado da sincronização: {e}")
+            return {}
+    
+    def save_sync_state(self, sheet_hashes: Dict[str, str]) -> bool:
+        """
+        Registra o hash do conteúdo das abas sincronizadas.
+        
+        Args:
+            sheet_hashes: Dicionário aba -> hash
+            
+        Returns:
+            True se o estado foi salvo, False caso contrário
+        """
+        if not self.connection:
+            return False
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany("""
+                INSERT INTO sincronizacao_abas (aba, hash_conteudo, sincronizado_em)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT (aba) DO UPDATE SET
+                    hash_conteudo = excluded.hash_conteudo,
+                    sincronizado_em = excluded.sincronizado_em
+            """, list(sheet_hashes.items()))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar estado da sincronização: {e}")
+            return False
+    
     def delete_checkin(self, checkin_id: int) -> bool:
         """
         Remove um registro de check-in da tabela de frequência.
@@ -323,6 +836,33 @@ class DatabaseManager:
             print(f"Erro ao deletar check-in: {e}")
             return False
     
+    def get_checkin_by_id(self, checkin_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Busca um registro de check-in pelo ID.
+        
+        Args:
+            checkin_id: ID do check-in
+            
+        Returns:
+            Dicionário com id, member_id, checkin_datetime e created_at,
+            ou None se não existir
+        """
+        if not self.connection:
+            return None
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT id, member_id, checkin_datetime, created_at
+                FROM frequencia
+                WHERE id = ?
+            """, (checkin_id,))
+            
+            row = cursor.fetchone()
+            return dict(row) if row else None
+        except Exception as e:
+            print(f"Erro ao buscar check-in: {e}")
+            return None
+    
     def get_members_by_birthday_month(self, month: int) -> List[Dict[str, Any]]:
         """
         Busca membros que fazem aniversário em um mês específico.
@@ -339,23 +879,16 @@ class DatabaseManager:
         try:
             cursor = self.connection.cursor()
             
-            # Query SQL que extrai o mês da data de nascimento
-            # Suporta diferentes formatos de data: DD/MM/YYYY, DD-MM-YYYY, YYYY-MM-DD
+            # nascimento_mes e nascimento_dia são colunas geradas a partir da
+            # data ISO e indexadas, então a busca é uma varredura de intervalo
             cursor.execute("""
                 SELECT * FROM membros
-                WHERE 
-                    -- Formato DD/MM/YYYY ou DD-MM-YYYY
-                    (CAST(SUBSTR(data_nascimento, 4, 2) AS INTEGER) = ?)
-                    OR
-                    -- Formato YYYY-MM-DD
-                    (CAST(SUBSTR(data_nascimento, 6, 2) AS INTEGER) = ?)
-                ORDER BY 
-                    -- Ordena pelo dia do mês
-                    CAST(SUBSTR(data_nascimento, 1, 2) AS INTEGER)
-            """, (month, month))
+                WHERE nascimento_mes = ?
+                ORDER BY nascimento_dia
+            """, (month,))
             
             rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            return [self._member_from_row(row) for row in rows]
         except Exception as e:
             print(f"Erro ao buscar aniversariantes do mês: {e}")
             return []
@@ -411,7 +944,7 @@ class DatabaseManager:
             
             if vencimento_plano is not None:
                 updates.append("vencimento_plano = ?")
-                values.append(vencimento_plano)
+                values.append(to_iso_date(vencimento_plano))
             
             if whatsapp is not None:
                 updates.append("whatsapp = ?")
@@ -483,6 +1016,8 @@ class DatabaseManager:
                 if field_key in member_data:
                     value = member_data[field_key]
                     # Permitir None ou string vazia para limpar campos
+                    if column_name in self.MEMBER_DATE_COLUMNS:
+                        value = to_iso_date(value)
                     updates.append(f"{column_name} = ?")
                     values.append(value if value else None)
             
@@ -508,12 +1043,24 @@ class DatabaseManager:
             traceback.print_exc()
             return False
     
-    def get_member_checkin_history(self, member_id: int) -> List[Dict[str, Any]]:
+    def get_member_checkin_history(
+        self,
+        member_id: int,
+        before: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Busca todo o histórico de check-ins de um membro.
+        Busca o histórico de check-ins de um membro, inteiro ou por páginas.
+        
+        A paginação é por chave (checkin_datetime, id), e não por OFFSET:
+        cada página é uma busca no índice idx_frequencia_member_datetime,
+        com o mesmo custo no começo e no fim de um histórico longo.
         
         Args:
             member_id: ID do membro
+            before: (checkin_datetime, id) do último check-in da página
+                anterior; só check-ins mais antigos que ele são retornados
+            limit: Máximo de check-ins retornados (None: todos)
             
         Returns:
             Lista de dicionários com os dados dos check-ins, ordenados do mais recente ao mais antigo.
@@ -524,7 +1071,7 @@ class DatabaseManager:
         try:
             cursor = self.connection.cursor()
             
-            cursor.execute("""
+            query = """
                 SELECT 
                     id,
                     member_id,
@@ -532,8 +1079,17 @@ class DatabaseManager:
                     created_at
                 FROM frequencia
                 WHERE member_id = ?
-                ORDER BY checkin_datetime DESC
-            """, (member_id,))
+            """
+            params: List[Any] = [member_id]
+            if before is not None:
+                query += " AND (checkin_datetime, id) < (?, ?)"
+                params.extend(before)
+            query += " ORDER BY checkin_datetime DESC, id DESC"
+            if limit is not None:
+                query += " LIMIT ?"
+                params.append(limit)
+            
+            cursor.execute(query, params)
             
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
@@ -541,65 +1097,257 @@ class DatabaseManager:
             print(f"Erro ao buscar histórico de check-ins: {e}")
             return []
 
-    def get_checkins_today(self) -> int:
+    def get_member_checkin_count(self, member_id: int) -> int:
         """
-        Conta o número de check-ins realizados hoje.
+        Conta os check-ins de um membro (pelo índice, sem ler as linhas).
         
+        Args:
+            member_id: ID do membro
+            
         Returns:
-            Número de check-ins de hoje.
+            Número de check-ins do membro
         """
         if not self.connection:
             return 0
         try:
             cursor = self.connection.cursor()
+            cursor.execute("SELECT COUNT(*) FROM frequencia WHERE member_id = ?", (member_id,))
+            return cursor.fetchone()[0]
+        except Exception as e:
+            print(f"Erro ao contar check-ins do membro: {e}")
+            return 0
+
+    @staticmethod
+    def day_range(day: Optional[date] = None) -> Tuple[datetime, datetime]:
+        """
+        Retorna o intervalo semiaberto [início, fim) que cobre um dia inteiro.
+        
+        Args:
+            day: Dia desejado (padrão: hoje)
             
-            today_str = datetime.now().strftime('%Y-%m-%d')
+        Returns:
+            Tupla (meia-noite do dia, meia-noite do dia seguinte)
+        """
+        if day is None:
+            day = date.today()
+        start = datetime.combine(day, time.min)
+        return start, start + timedelta(days=1)
+    
+    def _range_params(self, start: datetime, end: datetime) -> Tuple[str, str]:
+        """Converte os limites de um intervalo para o formato armazenado no banco."""
+        return start.strftime(self.DATETIME_FORMAT), end.strftime(self.DATETIME_FORMAT)
+    
+    def count_checkins_between(self, start: datetime, end: datetime) -> int:
+        """
+        Conta os check-ins no intervalo semiaberto [start, end).
+        A comparação direta com a coluna permite o uso do índice de checkin_datetime.
+        
+        Args:
+            start: Início do intervalo (inclusivo)
+            end: Fim do intervalo (exclusivo)
+            
+        Returns:
+            Número de check-ins no intervalo
+        """
+        if not self.connection:
+            return 0
+        try:
+            cursor = self.connection.cursor()
             
             cursor.execute("""
                 SELECT COUNT(*)
                 FROM frequencia
-                WHERE DATE(checkin_datetime) = ?
-            """, (today_str,))
+                WHERE checkin_datetime >= ? AND checkin_datetime < ?
+            """, self._range_params(start, end))
             
-            count = cursor.fetchone()[0]
-            return count
+            return cursor.fetchone()[0]
         except Exception as e:
-            print(f"Erro ao contar check-ins de hoje: {e}")
+            print(f"Erro ao contar check-ins do período: {e}")
             return 0
-
-    def get_checkins_today_details(self) -> List[Dict[str, Any]]:
+    
+    def get_checkins_between(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
         """
-        Busca os detalhes de todos os check-ins realizados hoje.
+        Busca os check-ins no intervalo semiaberto [start, end), do mais recente ao mais antigo.
         
+        Args:
+            start: Início do intervalo (inclusivo)
+            end: Fim do intervalo (exclusivo)
+            
         Returns:
-            Lista de dicionários com dados dos check-ins de hoje (nome, plano, data).
+            Lista de dicionários com id, member_id, nome, plano e checkin_datetime
         """
+        if not self.connection:
+            print("Erro: Conexão com o banco de dados não estabelecida.")
+            return []
         try:
-            if not self.connection:
-                print("Erro: Conexão com o banco de dados não estabelecida.")
-                return []
-                
             cursor = self.connection.cursor()
             
-            today_str = datetime.now().strftime('%Y-%m-%d')
-            
             cursor.execute("""
                 SELECT 
+                    f.id,
+                    f.member_id,
                     m.nome,
                     m.plano,
                     f.checkin_datetime
                 FROM frequencia f
                 JOIN membros m ON f.member_id = m.id
-                WHERE DATE(f.checkin_datetime) = ?
+                WHERE f.checkin_datetime >= ? AND f.checkin_datetime < ?
                 ORDER BY f.checkin_datetime DESC
-            """, (today_str,))
+            """, self._range_params(start, end))
             
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
         except Exception as e:
-            print(f"Erro ao buscar detalhes dos check-ins de hoje: {e}")
+            print(f"Erro ao buscar check-ins do período: {e}")
             return []
 
+    def get_checkin_stats(
+        self,
+        start_day: date,
+        end_day: date,
+        group_by: Tuple[str, ...] = ('dia',)
+    ) -> List[Dict[str, Any]]:
+        """
+        Totais de check-ins por dia, hora e/ou plano no intervalo de dias
+        [start_day, end_day), lidos de checkin_daily_stats (O(dias) linhas,
+        sem percorrer a tabela de frequência).
+        
+        Args:
+            start_day: Primeiro dia (inclusivo)
+            end_day: Último dia (exclusivo)
+            group_by: Colunas de agrupamento, entre 'dia', 'hora' e 'plano'
+            
+        Returns:
+            Lista de dicionários com as colunas de group_by e 'total',
+            ordenada pelas colunas de group_by
+        """
+        invalid = [column for column in group_by if column not in self.CHECKIN_STATS_COLUMNS]
+        if invalid or not group_by:
+            print(f"Erro ao buscar estatísticas de check-ins: agrupamento inválido {group_by!r}.")
+            return []
+        if not self.connection:
+            print("Erro: Conexão com o banco de dados não estabelecida.")
+            return []
+        try:
+            cursor = self.connection.cursor()
+            
+            # As colunas vêm de CHECKIN_STATS_COLUMNS, então podem ir direto na consulta
+            columns = ", ".join(group_by)
+            cursor.execute(f"""
+                SELECT {columns}, SUM(total) AS total
+                FROM checkin_daily_stats
+                WHERE dia >= ? AND dia < ?
+                GROUP BY {columns}
+                ORDER BY {columns}
+            """, (start_day.isoformat(), end_day.isoformat()))
+            
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            print(f"Erro ao buscar estatísticas de check-ins: {e}")
+            return []
+    
+    def get_hourly_checkin_counts(self, start_day: date, end_day: date) -> Tuple[array, array]:
+        """
+        Totais de check-ins por hora no intervalo de dias [start_day, end_day),
+        como duas colunas (sem criar um dicionário por linha), prontas para a
+        agregação vetorizada de src.data.checkin_aggregation.
+        
+        Args:
+            start_day: Primeiro dia (inclusivo)
+            end_day: Último dia (exclusivo)
+            
+        Returns:
+            Tupla (horas desde 1970-01-01 00:00, totais), em ordem cronológica;
+            arrays vazios se houver erro
+        """
+        hours, totals = array('q'), array('q')
+        if not self.connection:
+            print("Erro: Conexão com o banco de dados não estabelecida.")
+            return hours, totals
+        try:
+            cursor = self.connection.cursor()
+            # Tuplas simples em vez de sqlite3.Row: só há duas colunas posicionais
+            cursor.row_factory = None
+            
+            cursor.execute("""
+                SELECT CAST(strftime('%s', dia) AS INTEGER) / 3600 + hora, SUM(total)
+                FROM checkin_daily_stats
+                WHERE dia >= ? AND dia < ?
+                GROUP BY dia, hora
+                ORDER BY dia, hora
+            """, (start_day.isoformat(), end_day.isoformat()))
+            
+            for hour, total in cursor:
+                hours.append(hour)
+                totals.append(total)
+            return hours, totals
+        except Exception as e:
+            print(f"Erro ao buscar totais de check-ins por hora: {e}")
+            return array('q'), array('q')
+    
+    def rebuild_checkin_stats(self) -> int:
+        """
+        Recalcula checkin_daily_stats a partir de todos os check-ins (ex: após
+        alterar a tabela de frequência por fora do aplicativo).
+        
+        Returns:
+            Número de linhas da tabela de totais, ou -1 se houver erro
+        """
+        if not self.connection:
+            print("Erro: Conexão com o banco de dados não estabelecida.")
+            return -1
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("BEGIN")
+            try:
+                for statement in REBUILD_CHECKIN_STATS_SQL:
+                    cursor.execute(statement)
+                self.connection.commit()
+            except Exception:
+                self.connection.rollback()
+                raise
+            
+            cursor.execute("SELECT COUNT(*) FROM checkin_daily_stats")
+            return cursor.fetchone()[0]
+        except Exception as e:
+            print(f"Erro ao recalcular estatísticas de check-ins: {e}")
+            return -1
+        finally:
+            cursor.close()
+
+    def get_checkins_today(self) -> int:
+        """
+        Conta o número de check-ins realizados hoje.
+        
+        Returns:
+            Número de check-ins de hoje.
+        """
+        if not self.connection:
+            return 0
+        try:
+            cursor = self.connection.cursor()
+            
+            # Soma os totais por hora/plano de hoje (no máximo algumas dezenas de linhas)
+            cursor.execute("""
+                SELECT COALESCE(SUM(total), 0)
+                FROM checkin_daily_stats
+                WHERE dia = ?
+            """, (date.today().isoformat(),))
+            
+            return cursor.fetchone()[0]
+        except Exception as e:
+            print(f"Erro ao contar check-ins de hoje: {e}")
+            return 0
+
+    def get_checkins_today_details(self) -> List[Dict[str, Any]]:
+        """
+        Busca os detalhes de todos os check-ins realizados hoje.
+        
+        Returns:
+            Lista de dicionários com dados dos check-ins de hoje (nome, plano, data).
+        """
+        return self.get_checkins_between(*self.day_range())
+
     def get_last_checkins(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Busca os últimos check-ins realizados.
@@ -608,7 +1356,7 @@ class DatabaseManager:
             limit: Número máximo de check-ins a retornar
             
         Returns:
-            Lista de dicionários com dados dos últimos check-ins (membro e data)
+            Lista de dicionários com dados dos últimos check-ins (id, membro e data)
         """
         try:
             if not self.connection:
@@ -619,6 +1367,7 @@ class DatabaseManager:
             
             cursor.execute("""
                 SELECT 
+                    f.id,
                     m.nome,
                     f.checkin_datetime
                 FROM frequencia f
@@ -634,10 +1383,15 @@ class DatabaseManager:
             return []
     
     def close(self):
-        """Fecha a conexão com o banco de dados."""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Fecha as conexões de todas as threads."""
+        with self._lock:
+            self._is_connected = False
+            self._generation += 1
+            holders = list(self._thread_connections)
+            self._thread_connections.clear()
+        
+        for holder in holders:
+            holder.close()
 
     def update_expired_plans(self):
         """
@@ -652,18 +1406,16 @@ class DatabaseManager:
         try:
             cursor = self.connection.cursor()
             
-            # A data no banco está como 'DD/MM/AAAA', precisamos converter para 'AAAA-MM-DD' para comparar
-            # Usamos substr para reordenar a data para o formato YYYY-MM-DD
-            # A data de hoje já está em 'YYYY-MM-DD'
-            today_str = datetime.now().strftime('%Y-%m-%d')
+            # vencimento_plano é armazenado em ISO, então a comparação de strings
+            # é cronológica e usa o índice (estado_plano, vencimento_plano)
+            today_str = date.today().isoformat()
             
             query = """
                 UPDATE membros
                 SET estado_plano = 'INATIVO'
-                WHERE vencimento_plano IS NOT NULL 
-                  AND vencimento_plano != ''
-                  AND substr(vencimento_plano, 7, 4) || '-' || substr(vencimento_plano, 4, 2) || '-' || substr(vencimento_plano, 1, 2) < ?
-                  AND estado_plano = 'ATIVO';
+                WHERE estado_plano = 'ATIVO'
+                  AND vencimento_plano > ''
+                  AND vencimento_plano < ?;
             """
             
             cursor.execute(query, (today_str,))
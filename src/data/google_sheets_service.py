@@ -1,45 +1,164 @@
 """
 Serviço para interação com Google Sheets API.
+
+As bibliotecas do Google (google-auth, googleapiclient, httplib2) são
+importadas apenas quando usadas: no modo SQLite elas nem são carregadas,
+e no modo Google Sheets o cliente da API só é montado na primeira leitura.
 """
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.config import (
+    SHEETS_READ_REQUESTS_PER_MINUTE, SHEETS_MAX_RETRIES, SHEETS_MAX_CONCURRENT_REQUESTS
+)
+from src.data.sheet_snapshots import SheetSnapshotStore
+from src.data.sheets_requests import (
+    RequestMetrics, SheetsRequestError, TokenBucket, execute_with_retry
+)
+from src.utils.utils import column_letter
 
 
 class GoogleSheetsService:
-    """Gerencia a autenticação e acesso ao Google Sheets."""
+    """
+    Gerencia a autenticação e acesso ao Google Sheets.
+    
+    Todas as requisições passam por _execute(): respeitam o limite de
+    leituras por minuto e falhas temporárias (429, 5xx, rede) são repetidas
+    com espera exponencial. Se a falha persistir, os métodos de leitura
+    levantam SheetsRequestError em vez de retornar dados vazios, para que
+    uma aba indisponível não seja confundida com uma aba vazia.
+    """
+    
+    # Escopos de permissão (metadados do Drive para consultar a versão da planilha)
+    SCOPES = [
+        'https://www.googleapis.com/auth/spreadsheets.readonly',
+        'https://www.googleapis.com/auth/drive.metadata.readonly',
+    ]
     
-    # Escopos de permissão
-    SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+    # Máximo de abas lidas por chamada de batchGet
+    BATCH_GET_MAX_RANGES = 20
     
-    def __init__(self, credentials_path: str):
+    # Em read_columns, colunas separadas por até esta quantidade de colunas
+    # não usadas são lidas em um mesmo range
+    COLUMN_GAP_TOLERANCE = 2
+    
+    def __init__(
+        self,
+        credentials_path: str,
+        requests_per_minute: int = SHEETS_READ_REQUESTS_PER_MINUTE,
+        max_retries: int = SHEETS_MAX_RETRIES,
+        snapshot_store: Optional[SheetSnapshotStore] = None,
+        api_endpoint: Optional[str] = None
+    ):
         """
         Inicializa o serviço.
         
         Args:
             credentials_path: Caminho para o arquivo de credenciais JSON
+            requests_per_minute: Cota de leituras por minuto respeitada pelo limitador
+            max_retries: Número máximo de novas tentativas em falhas temporárias
+            snapshot_store: Se informado, cada aba lida é gravada como
+                snapshot local (ver load_snapshot())
+            api_endpoint: URL base alternativa da API do Sheets (ex: um
+                servidor HTTP local de testes); se None, usa a do Google
         """
         self.credentials_path = credentials_path
-        self.service = None
+        self.credentials = None
+        self._service = None
+        self.drive_service = None
+        self.max_retries = max_retries
+        self.rate_limiter = TokenBucket(requests_per_minute)
+        self.metrics = RequestMetrics()
+        self.snapshot_store = snapshot_store
+        # Última revisão consultada de cada planilha, gravada nos snapshots
+        self._revisions: Dict[str, str] = {}
+        self.api_endpoint = api_endpoint
+        # Conexão HTTP de cada thread (httplib2 não é seguro entre threads)
+        self._local = threading.local()
     
-    def authenticate(self) -> bool:
+    def authenticate(self, credentials=None) -> bool:
         """
-        Autentica com a API do Google Sheets.
+        Autentica com a API do Google Sheets (carrega as credenciais; o
+        cliente da API é montado na primeira leitura).
+        
+        Args:
+            credentials: Credenciais já criadas (ex: AnonymousCredentials,
+                para um servidor local de testes); se None, lê o arquivo
+                credentials_path
         
         Returns:
             True se a autenticação foi bem-sucedida, False caso contrário
         """
         try:
-            creds = Credentials.from_service_account_file(
-                self.credentials_path, 
-                scopes=self.SCOPES
-            )
-            self.service = build('sheets', 'v4', credentials=creds)
+            if credentials is None:
+                from google.oauth2.service_account import Credentials
+                credentials = Credentials.from_service_account_file(
+                    self.credentials_path, 
+                    scopes=self.SCOPES
+                )
+            self.credentials = credentials
+            # O cliente da API é montado na primeira leitura (ver service)
+            self._service = None
+            self.drive_service = None
+            self._local = threading.local()
             return True
         except Exception as e:
             print(f"Erro na autenticação: {e}")
             return False
     
+    @property
+    def service(self):
+        """
+        Cliente da API do Sheets, montado no primeiro acesso a partir das
+        credenciais (None se authenticate() ainda não foi chamado).
+        """
+        if self._service is None and self.credentials is not None:
+            from googleapiclient.discovery import build
+            client_options = {'api_endpoint': self.api_endpoint} if self.api_endpoint else None
+            self._service = build('sheets', 'v4', credentials=self.credentials, client_options=client_options)
+        return self._service
+    
+    @service.setter
+    def service(self, value):
+        self._service = value
+    
+    def _execute(self, request):
+        """
+        Executa uma requisição da API com limite de taxa e novas tentativas.
+        
+        Args:
+            request: Requisição montada (ex: sheet.values().get(...))
+            
+        Returns:
+            Resposta da API
+            
+        Raises:
+            SheetsRequestError: Erro definitivo ou falha temporária persistente
+        """
+        http = self._thread_http()
+        return execute_with_retry(
+            lambda: request.execute(http=http) if http is not None else request.execute(),
+            limiter=self.rate_limiter,
+            metrics=self.metrics,
+            max_retries=self.max_retries
+        )
+    
+    def _thread_http(self):
+        """
+        Retorna a conexão HTTP autenticada da thread atual, criando-a na
+        primeira chamada. Os objetos de requisição da API podem ser montados
+        em qualquer thread, mas cada thread precisa da sua conexão.
+        """
+        if self.credentials is None:
+            return None
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+            http = self._local.http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+        return http
+    
     def read_spreadsheet(
         self, 
         spreadsheet_id: str, 
@@ -55,7 +174,11 @@ class GoogleSheetsService:
             sheet_name: Nome da aba (se None, usa apenas o range)
             
         Returns:
-            Lista de listas com os valores da planilha
+            Lista de listas com os valores da planilha ([] em erros
+            definitivos, como aba inexistente)
+            
+        Raises:
+            SheetsRequestError: Falha temporária que persistiu após as novas tentativas
         """
         try:
             if not self.service:
@@ -68,12 +191,272 @@ class GoogleSheetsService:
                 full_range = range_name
             
             sheet = self.service.spreadsheets()
-            result = sheet.values().get(
+            result = self._execute(sheet.values().get(
                 spreadsheetId=spreadsheet_id,
                 range=full_range
-            ).execute()
+            ))
             
-            return result.get('values', [])
+            values = result.get('values', [])
+            self._save_snapshot(spreadsheet_id, sheet_name, range_name, values)
+            return values
+        except SheetsRequestError as e:
+            if e.retryable:
+                raise
+            print(f"Erro ao ler planilha: {e}")
+            return []
         except Exception as e:
             print(f"Erro ao ler planilha: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def read_columns(
+        self,
+        spreadsheet_id: str,
+        columns: Iterable[int],
+        sheet_name: Optional[str] = None
+    ) -> List[list]:
+        """
+        Lê apenas as colunas indicadas, com uma única chamada de batchGet
+        sobre os ranges de colunas necessários, e remonta as linhas.
+        
+        Args:
+            spreadsheet_id: ID da planilha
+            columns: Índices das colunas (zero-based, como config.COL_*)
+            sheet_name: Nome da aba (se None, usa a primeira aba)
+            
+        Returns:
+            Lista de linhas no mesmo formato de read_spreadsheet: cada valor
+            fica no índice original da sua coluna e as colunas não lidas
+            ficam vazias ('')
+        """
+        try:
+            if not self.service:
+                raise Exception("Serviço não autenticado. Chame authenticate() primeiro.")
+            
+            columns = list(columns)
+            spans = self._column_spans(columns)
+            if not spans:
+                return []
+            
+            prefix = f"'{sheet_name}'!" if sheet_name else ''
+            result = self._execute(self.service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=[f"{prefix}{column_letter(first)}:{column_letter(last)}" for first, last in spans]
+            ))
+            
+            # Cada range pode ter um número diferente de linhas (a API omite
+            # linhas vazias no final); as linhas são alinhadas pelo índice
+            range_values = [value_range.get('values', []) for value_range in result.get('valueRanges', [])]
+            row_count = max((len(values) for values in range_values), default=0)
+            width = spans[-1][1] + 1
+            
+            rows = [[''] * width for _ in range(row_count)]
+            for (first, _), values in zip(spans, range_values):
+                for row, row_values in zip(rows, values):
+                    row[first:first + len(row_values)] = row_values
+            self._save_snapshot(spreadsheet_id, sheet_name, self._columns_key(columns), rows)
+            return rows
+        except SheetsRequestError as e:
+            if e.retryable:
+                raise
+            print(f"Erro ao ler colunas da planilha: {e}")
+            return []
+        except Exception as e:
+            print(f"Erro ao ler colunas da planilha: {e}")
+            return []
+    
+    @classmethod
+    def _column_spans(cls, columns: Iterable[int]) -> List[Tuple[int, int]]:
+        """Agrupa índices de colunas em intervalos contíguos (primeira, última)."""
+        spans: List[Tuple[int, int]] = []
+        for col_index in sorted(set(columns)):
+            if spans and col_index - spans[-1][1] <= cls.COLUMN_GAP_TOLERANCE + 1:
+                spans[-1] = (spans[-1][0], col_index)
+            else:
+                spans.append((col_index, col_index))
+        return spans
+    
+    def read_sheets(
+        self,
+        spreadsheet_id: str,
+        sheet_names: List[str],
+        range_name: str = 'A:BT'
+    ) -> Dict[str, List[list]]:
+        """
+        Lê várias abas da planilha com values().batchGet, fazendo uma única
+        requisição para cada BATCH_GET_MAX_RANGES abas.
+        
+        Se um grupo falhar com erro definitivo (a API recusa o batchGet
+        inteiro quando uma das abas não existe), as abas do grupo são lidas
+        uma a uma.
+        
+        Args:
+            spreadsheet_id: ID da planilha
+            sheet_names: Nomes das abas
+            range_name: Range lido em cada aba (padrão: 'A:BT')
+            
+        Returns:
+            Dicionário aba -> lista de listas com os valores. Abas que não
+            existem ou não puderam ser lidas ficam de fora.
+            
+        Raises:
+            SheetsRequestError: Falha temporária que persistiu após as novas tentativas
+        """
+        sheets_data: Dict[str, List[list]] = {}
+        try:
+            if not self.service:
+                raise Exception("Serviço não autenticado. Chame authenticate() primeiro.")
+            
+            sheet = self.service.spreadsheets()
+            for start in range(0, len(sheet_names), self.BATCH_GET_MAX_RANGES):
+                batch = sheet_names[start:start + self.BATCH_GET_MAX_RANGES]
+                try:
+                    result = self._execute(sheet.values().batchGet(
+                        spreadsheetId=spreadsheet_id,
+                        ranges=[f"'{sheet_name}'!{range_name}" for sheet_name in batch]
+                    ))
+                except SheetsRequestError as e:
+                    if e.retryable:
+                        raise
+                    print(f"Erro ao ler abas em lote ({e}); lendo uma a uma")
+                    batch_data = self.read_sheets_concurrently(spreadsheet_id, batch, range_name)
+                    sheets_data.update((name, values) for name, values in batch_data.items() if values)
+                    continue
+                
+                # Os valueRanges vêm na mesma ordem dos ranges pedidos
+                for sheet_name, value_range in zip(batch, result.get('valueRanges', [])):
+                    sheets_data[sheet_name] = value_range.get('values', [])
+                    self._save_snapshot(spreadsheet_id, sheet_name, range_name, sheets_data[sheet_name])
+            
+            return sheets_data
+        except SheetsRequestError:
+            raise
+        except Exception as e:
+            print(f"Erro ao ler abas da planilha: {e}")
+            return sheets_data
+    
+    def read_sheets_concurrently(
+        self,
+        spreadsheet_id: str,
+        sheet_names: List[str],
+        range_name: str = 'A:BT',
+        max_workers: int = SHEETS_MAX_CONCURRENT_REQUESTS
+    ) -> Dict[str, List[list]]:
+        """
+        Lê várias abas em paralelo, uma requisição por aba, com no máximo
+        `max_workers` requisições simultâneas (todas ainda sujeitas ao
+        limite de leituras por minuto).
+        
+        Prefira read_sheets() para abas da mesma planilha (uma requisição
+        para até BATCH_GET_MAX_RANGES abas); este método serve para quando
+        as abas precisam ser lidas separadamente, como quando uma delas
+        pode não existir.
+        
+        Args:
+            spreadsheet_id: ID da planilha
+            sheet_names: Nomes das abas
+            range_name: Range lido em cada aba (padrão: 'A:BT')
+            max_workers: Máximo de requisições simultâneas
+            
+        Returns:
+            Dicionário aba -> resultado de read_spreadsheet() para a aba
+            ([] em erros definitivos), na ordem de sheet_names
+            
+        Raises:
+            SheetsRequestError: Falha temporária que persistiu após as novas tentativas
+        """
+        if not sheet_names:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sheet_names)))) as executor:
+            futures = [
+                executor.submit(self.read_spreadsheet, spreadsheet_id, range_name, sheet_name)
+                for sheet_name in sheet_names
+            ]
+            try:
+                return {sheet_name: future.result() for sheet_name, future in zip(sheet_names, futures)}
+            except SheetsRequestError:
+                # Não espera pelas abas restantes se uma delas falhou
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    def get_spreadsheet_revision(self, spreadsheet_id: str) -> Optional[str]:
+        """
+        Consulta a versão atual da planilha (campo 'version' da Drive API),
+        que muda a cada edição. É uma chamada de metadados, bem mais leve
+        que ler os valores.
+        
+        Args:
+            spreadsheet_id: ID da planilha
+            
+        Returns:
+            Versão da planilha ou None se não for possível consultá-la
+        """
+        try:
+            if not self.credentials:
+                raise Exception("Serviço não autenticado. Chame authenticate() primeiro.")
+            
+            if self.drive_service is None:
+                from googleapiclient.discovery import build
+                self.drive_service = build('drive', 'v3', credentials=self.credentials)
+            
+            result = self._execute(self.drive_service.files().get(
+                fileId=spreadsheet_id,
+                fields='version'
+            ))
+            revision = result.get('version')
+            if revision is not None:
+                self._revisions[spreadsheet_id] = revision
+            return revision
+        except Exception as e:
+            print(f"Erro ao consultar a versão da planilha: {e}")
+            return None
+    
+    def load_snapshot(
+        self,
+        spreadsheet_id: str,
+        sheet_name: Optional[str] = None,
+        range_name: str = 'A:BT',
+        columns: Optional[Iterable[int]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Lê o snapshot local de uma aba, sem acessar a rede.
+        
+        Args:
+            spreadsheet_id: ID da planilha
+            sheet_name: Nome da aba
+            range_name: Range lido (snapshot de read_spreadsheet/read_sheets)
+            columns: Colunas lidas (snapshot de read_columns); tem prioridade
+                sobre range_name
+            
+        Returns:
+            Dicionário com 'values', 'revision' e 'saved_at' ou None se não
+            houver snapshot (ou se o serviço não usa snapshots)
+        """
+        if self.snapshot_store is None:
+            return None
+        range_key = self._columns_key(columns) if columns is not None else range_name
+        return self.snapshot_store.load(spreadsheet_id, sheet_name or '', range_key)
+    
+    def _save_snapshot(
+        self,
+        spreadsheet_id: str,
+        sheet_name: Optional[str],
+        range_key: str,
+        values: List[list]
+    ):
+        """Grava o snapshot de uma aba recém-lida, se houver armazenamento configurado."""
+        if self.snapshot_store is None or not values:
+            return
+        self.snapshot_store.save(
+            spreadsheet_id,
+            sheet_name or '',
+            range_key,
+            values,
+            self._revisions.get(spreadsheet_id)
+        )
+    
+    @staticmethod
+    def _columns_key(columns: Iterable[int]) -> str:
+        """Identificação do conjunto de colunas lido por read_columns (ex: 'cols:0,1,2')."""
+        return 'cols:' + ','.join(str(col_index) for col_index in sorted(set(columns)))
@@ -0,0 +1,240 @@
+"""
+Migrações de esquema do banco de dados SQLite.
+A versão atual do esquema fica registrada em PRAGMA user_version.
+"""
+import sqlite3
+from typing import Callable, List, Tuple
+
+from src.utils.utils import to_iso_date
+
+# Quantidade de linhas reescritas por lote nas migrações de dados
+CONVERSION_BATCH_SIZE = 1000
+
+
+def _migration_001_indices(cursor: sqlite3.Cursor):
+    """Cria os índices usados pelas consultas de histórico, check-ins e busca por nome."""
+    # Histórico de um membro: WHERE member_id = ? ORDER BY checkin_datetime
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_frequencia_member_datetime
+        ON frequencia (member_id, checkin_datetime)
+    """)
+
+    # Últimos check-ins e consultas por período: ORDER BY / WHERE checkin_datetime
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_frequencia_datetime
+        ON frequencia (checkin_datetime)
+    """)
+
+    # Ordenação e busca por prefixo de nome sem diferenciar maiúsculas/minúsculas
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_membros_nome_nocase
+        ON membros (nome COLLATE NOCASE)
+    """)
+
+    # Atualiza as estatísticas para que o planejador passe a usar os índices
+    cursor.execute("ANALYZE")
+
+
+def _migration_002_datas_iso(cursor: sqlite3.Cursor):
+    """
+    Converte data_nascimento e vencimento_plano de DD/MM/AAAA para ISO (AAAA-MM-DD)
+    e cria colunas geradas e índices para as buscas de aniversário e vencimento.
+    """
+    # Reescreve as datas em lotes, percorrendo a tabela pelo id
+    last_id = 0
+    while True:
+        cursor.execute("""
+            SELECT id, data_nascimento, vencimento_plano
+            FROM membros
+            WHERE id > ?
+            ORDER BY id
+            LIMIT ?
+        """, (last_id, CONVERSION_BATCH_SIZE))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+
+        cursor.executemany(
+            "UPDATE membros SET data_nascimento = ?, vencimento_plano = ? WHERE id = ?",
+            [(to_iso_date(row[1]), to_iso_date(row[2]), row[0]) for row in rows]
+        )
+        last_id = rows[-1][0]
+
+    # Mês e dia do aniversário, calculados apenas para datas ISO válidas
+    for column, offset in (("nascimento_mes", 6), ("nascimento_dia", 9)):
+        cursor.execute(f"""
+            ALTER TABLE membros ADD COLUMN {column} INTEGER
+            GENERATED ALWAYS AS (
+                CASE WHEN data_nascimento GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'
+                     THEN CAST(substr(data_nascimento, {offset}, 2) AS INTEGER)
+                END
+            ) VIRTUAL
+        """)
+
+    # Aniversariantes do mês: WHERE nascimento_mes = ? ORDER BY nascimento_dia
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_membros_aniversario
+        ON membros (nascimento_mes, nascimento_dia)
+    """)
+
+    # Planos expirados: WHERE estado_plano = 'ATIVO' AND vencimento_plano < ?
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_membros_estado_vencimento
+        ON membros (estado_plano, vencimento_plano)
+    """)
+
+    cursor.execute("ANALYZE")
+
+
+def _migration_003_busca_nome_fts(cursor: sqlite3.Cursor):
+    """
+    Cria o índice de texto completo (FTS5) sobre membros.nome, sem diferenciar
+    acentos, mantido em sincronia com a tabela por triggers.
+    """
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS membros_fts USING fts5(
+            nome,
+            content='membros',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS membros_fts_ai AFTER INSERT ON membros BEGIN
+            INSERT INTO membros_fts (rowid, nome) VALUES (new.id, new.nome);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS membros_fts_ad AFTER DELETE ON membros BEGIN
+            INSERT INTO membros_fts (membros_fts, rowid, nome) VALUES ('delete', old.id, old.nome);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS membros_fts_au AFTER UPDATE OF nome ON membros BEGIN
+            INSERT INTO membros_fts (membros_fts, rowid, nome) VALUES ('delete', old.id, old.nome);
+            INSERT INTO membros_fts (rowid, nome) VALUES (new.id, new.nome);
+        END
+    """)
+
+    # Indexa os membros já existentes
+    cursor.execute("INSERT INTO membros_fts (membros_fts) VALUES ('rebuild')")
+
+
+def _migration_004_sincronizacao_abas(cursor: sqlite3.Cursor):
+    """
+    Cria a tabela com a impressão digital (hash do conteúdo) de cada aba do
+    Google Sheets já importada, usada pela sincronização incremental.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sincronizacao_abas (
+            aba TEXT PRIMARY KEY,
+            hash_conteudo TEXT NOT NULL,
+            sincronizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+# Reconstrói checkin_daily_stats a partir de todos os check-ins. O plano
+# contado é o atual do membro, como em get_checkins_between
+REBUILD_CHECKIN_STATS_SQL = (
+    "DELETE FROM checkin_daily_stats",
+    """
+    INSERT INTO checkin_daily_stats (dia, hora, plano, total)
+    SELECT
+        substr(f.checkin_datetime, 1, 10),
+        CAST(substr(f.checkin_datetime, 12, 2) AS INTEGER),
+        COALESCE(m.plano, ''),
+        COUNT(*)
+    FROM frequencia f
+    LEFT JOIN membros m ON m.id = f.member_id
+    GROUP BY 1, 2, 3
+    """,
+)
+
+
+def _migration_005_estatisticas_checkins(cursor: sqlite3.Cursor):
+    """
+    Cria checkin_daily_stats, com o total de check-ins por dia, hora e plano,
+    mantida por triggers a cada check-in inserido ou removido e a cada
+    mudança de plano de um membro. O dashboard e os relatórios leem O(dias)
+    linhas em vez de percorrer todos os check-ins.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS checkin_daily_stats (
+            dia TEXT NOT NULL,
+            hora INTEGER NOT NULL,
+            plano TEXT NOT NULL,
+            total INTEGER NOT NULL,
+            PRIMARY KEY (dia, hora, plano)
+        ) WITHOUT ROWID
+    """)
+
+    # checkin_datetime é 'AAAA-MM-DD HH:MM:SS': dia = [1, 10], hora = [12, 13]
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS checkin_stats_ai AFTER INSERT ON frequencia BEGIN
+            INSERT INTO checkin_daily_stats (dia, hora, plano, total)
+            SELECT
+                substr(new.checkin_datetime, 1, 10),
+                CAST(substr(new.checkin_datetime, 12, 2) AS INTEGER),
+                COALESCE((SELECT plano FROM membros WHERE id = new.member_id), ''),
+                1
+            WHERE true
+            ON CONFLICT (dia, hora, plano) DO UPDATE SET total = total + 1;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS checkin_stats_ad AFTER DELETE ON frequencia BEGIN
+            UPDATE checkin_daily_stats SET total = total - 1
+            WHERE dia = substr(old.checkin_datetime, 1, 10)
+              AND hora = CAST(substr(old.checkin_datetime, 12, 2) AS INTEGER)
+              AND plano = COALESCE((SELECT plano FROM membros WHERE id = old.member_id), '');
+            DELETE FROM checkin_daily_stats
+            WHERE dia = substr(old.checkin_datetime, 1, 10) AND total <= 0;
+        END
+    """)
+
+    # Mudança de plano: move os check-ins do membro do plano antigo para o novo
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS checkin_stats_plano_au AFTER UPDATE OF plano ON membros
+        WHEN old.plano IS NOT new.plano BEGIN
+            UPDATE checkin_daily_stats SET total = total - (
+                SELECT COUNT(*) FROM frequencia f
+                WHERE f.member_id = new.id
+                  AND substr(f.checkin_datetime, 1, 10) = checkin_daily_stats.dia
+                  AND CAST(substr(f.checkin_datetime, 12, 2) AS INTEGER) = checkin_daily_stats.hora
+            )
+            WHERE plano = COALESCE(old.plano, '')
+              AND dia IN (SELECT substr(checkin_datetime, 1, 10) FROM frequencia WHERE member_id = new.id);
+            DELETE FROM checkin_daily_stats
+            WHERE total <= 0
+              AND dia IN (SELECT substr(checkin_datetime, 1, 10) FROM frequencia WHERE member_id = new.id);
+            INSERT INTO checkin_daily_stats (dia, hora, plano, total)
+            SELECT
+                substr(checkin_datetime, 1, 10),
+                CAST(substr(checkin_datetime, 12, 2) AS INTEGER),
+                COALESCE(new.plano, ''),
+                COUNT(*)
+            FROM frequencia
+            WHERE member_id = new.id
+            GROUP BY 1, 2
+            ON CONFLICT (dia, hora, plano) DO UPDATE SET total = total + excluded.total;
+        END
+    """)
+
+    # Contabiliza os check-ins já existentes
+    for statement in REBUILD_CHECKIN_STATS_SQL:
+        cursor.execute(statement)
+
+
+# Lista ordenada de migrações: (versão, descrição, função que aplica a migração)
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]] = [
+    (1, "Índices de frequência e nome", _migration_001_indices),
+    (2, "Datas em formato ISO e índices de aniversário/vencimento", _migration_002_datas_iso),
+    (3, "Busca de nomes por texto completo (FTS5)", _migration_003_busca_nome_fts),
+    (4, "Estado da sincronização incremental das abas", _migration_004_sincronizacao_abas),
+    (5, "Totais diários de check-ins (dia, hora e plano)", _migration_005_estatisticas_checkins),
+]
+
+# Versão mais recente do esquema
+LATEST_VERSION = MIGRATIONS[-1][0]
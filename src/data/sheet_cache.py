@@ -0,0 +1,186 @@
+"""
+Cache read-through com validade (TTL) para dados lidos do Google Sheets.
+Evita baixar a aba inteira a cada busca ou clique em um resultado.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class SheetCache:
+    """
+    Guarda valores por chave (ex: nome da aba) por até `ttl_seconds`.
+
+    Quando a validade expira e há uma função de revisão, a revisão atual
+    da planilha é consultada (uma chamada de metadados, bem mais leve que
+    baixar a aba): se não mudou, o valor em cache é renovado sem novo
+    download. Valores vazios (None, lista vazia) não são guardados, para
+    que uma falha de leitura não fique em cache; se já havia um valor, ele
+    continua sendo servido (útil sem rede) e a leitura é tentada de novo
+    após mais `ttl_seconds`.
+
+    Sempre que um valor novo é baixado da fonte (por get() ou refresh()),
+    `on_change` é chamado com a chave e o valor, fora do lock.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        on_change: Optional[Callable[[Hashable, Any], None]] = None
+    ):
+        """
+        Inicializa o cache.
+
+        Args:
+            ttl_seconds: Tempo de validade de cada valor, em segundos
+            clock: Função que retorna o tempo atual (monotônico)
+            on_change: Função chamada com (chave, valor) quando um valor
+                novo é baixado da fonte
+        """
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._on_change = on_change
+        self._entries: Dict[Hashable, Dict[str, Any]] = {}
+        # Um único lock evita que várias threads baixem a mesma aba ao mesmo tempo
+        self._lock = threading.Lock()
+
+        # Estatísticas de uso
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        revision: Optional[Callable[[], Optional[str]]] = None
+    ) -> Any:
+        """
+        Retorna o valor da chave, carregando-o com `load` se necessário.
+
+        Args:
+            key: Chave do valor (ex: nome da aba)
+            load: Função que carrega o valor da fonte
+            revision: Função opcional que retorna a revisão atual da fonte
+                (ou None se não for possível consultá-la)
+
+        Returns:
+            Valor em cache ou recém-carregado
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self._clock()
+
+            if entry is not None and now - entry['loaded_at'] < self.ttl_seconds:
+                self.hits += 1
+                return entry['value']
+
+            current_revision = revision() if revision else None
+            if (entry is not None and current_revision is not None
+                    and current_revision == entry['revision']):
+                # Fonte não mudou: renova a validade sem baixar de novo
+                entry['loaded_at'] = now
+                self.revalidations += 1
+                return entry['value']
+
+            self.misses += 1
+            value = load()
+            if value:
+                self._entries[key] = {
+                    'value': value,
+                    'revision': current_revision,
+                    'loaded_at': now,
+                }
+            elif entry is not None:
+                # Falha na leitura: mantém o valor anterior por mais um período
+                entry['loaded_at'] = now
+                return entry['value']
+            else:
+                return value
+
+        # Fora do lock: quem é avisado pode consultar o cache de novo
+        self._notify_change(key, value)
+        return value
+
+    def put(self, key: Hashable, value: Any, revision: Optional[str] = None):
+        """
+        Guarda um valor já carregado (ex: lido de um snapshot local).
+
+        Args:
+            key: Chave do valor
+            value: Valor a guardar (valores vazios são ignorados)
+            revision: Revisão da fonte à qual o valor corresponde
+        """
+        if not value:
+            return
+        with self._lock:
+            self._entries[key] = {
+                'value': value,
+                'revision': revision,
+                'loaded_at': self._clock(),
+            }
+
+    def refresh(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        revision: Optional[Callable[[], Optional[str]]] = None
+    ) -> bool:
+        """
+        Atualiza o valor da chave a partir da fonte, independentemente da
+        validade. Ao contrário de get(), o download é feito fora do lock:
+        quem consultar o cache enquanto isso recebe o valor atual sem esperar.
+
+        Args:
+            key: Chave do valor
+            load: Função que carrega o valor da fonte
+            revision: Função opcional que retorna a revisão atual da fonte
+
+        Returns:
+            True se o valor está atualizado (revisão igual ou recarregado),
+            False se a fonte não pôde ser lida
+        """
+        current_revision = revision() if revision else None
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is not None and current_revision is not None
+                    and current_revision == entry['revision']):
+                entry['loaded_at'] = self._clock()
+                self.revalidations += 1
+                return True
+
+        value = load()
+        if not value:
+            return False
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = {
+                'value': value,
+                'revision': current_revision,
+                'loaded_at': self._clock(),
+            }
+        self._notify_change(key, value)
+        return True
+
+    def _notify_change(self, key: Hashable, value: Any):
+        """Avisa on_change de um valor novo (um erro no aviso não afeta o cache)."""
+        if self._on_change is None:
+            return
+        try:
+            self._on_change(key, value)
+        except Exception as e:
+            print(f"Erro ao avisar a atualização do cache: {e}")
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """
+        Descarta valores do cache.
+
+        Args:
+            key: Chave a descartar; se None, descarta todas
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
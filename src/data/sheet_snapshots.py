@@ -0,0 +1,124 @@
+"""
+Cópias locais (snapshots) das abas lidas do Google Sheets.
+Permitem abrir o aplicativo sem esperar o download da aba e continuar
+consultando os dados quando a rede cai.
+"""
+import json
+import os
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from typing import Any, Dict, List, Optional
+
+
+class SheetSnapshotStore:
+    """
+    Guarda o conteúdo de cada aba em um arquivo SQLite, como JSON
+    comprimido (zlib), junto com a revisão da planilha em que foi lido.
+
+    A chave é (ID da planilha, aba, intervalo lido): leituras de intervalos
+    diferentes da mesma aba (ex: todas as colunas ou apenas as de membros)
+    têm snapshots separados. Cada chave guarda apenas o snapshot mais recente.
+    """
+
+    def __init__(self, path: str):
+        """
+        Inicializa o armazenamento, criando o arquivo se necessário.
+
+        Args:
+            path: Caminho do arquivo SQLite dos snapshots
+        """
+        self.path = path
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS snapshots (
+                        planilha TEXT NOT NULL,
+                        aba TEXT NOT NULL,
+                        intervalo TEXT NOT NULL,
+                        revisao TEXT,
+                        dados BLOB NOT NULL,
+                        salvo_em REAL NOT NULL,
+                        PRIMARY KEY (planilha, aba, intervalo)
+                    )
+                """)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Erro ao abrir snapshots em {path}: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        # Uma conexão por operação: o armazenamento é usado por mais de uma
+        # thread (leitura na inicialização, gravação na atualização em segundo plano)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return sqlite3.connect(self.path, timeout=5)
+
+    def save(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        range_key: str,
+        values: List[list],
+        revision: Optional[str] = None
+    ) -> bool:
+        """
+        Grava (ou substitui) o snapshot de uma aba.
+
+        Args:
+            spreadsheet_id: ID da planilha
+            sheet_name: Nome da aba
+            range_key: Identificação do intervalo lido (ex: 'A:BT')
+            values: Linhas lidas da aba
+            revision: Revisão da planilha em que as linhas foram lidas
+
+        Returns:
+            True se o snapshot foi gravado, False caso contrário
+        """
+        try:
+            payload = zlib.compress(json.dumps(values, separators=(',', ':')).encode('utf-8'))
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO snapshots "
+                    "(planilha, aba, intervalo, revisao, dados, salvo_em) VALUES (?, ?, ?, ?, ?, ?)",
+                    (spreadsheet_id, sheet_name, range_key, revision, payload, time.time())
+                )
+            return True
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            print(f"Erro ao gravar snapshot da aba {sheet_name}: {e}")
+            return False
+
+    def load(self, spreadsheet_id: str, sheet_name: str, range_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Lê o snapshot de uma aba.
+
+        Args:
+            spreadsheet_id: ID da planilha
+            sheet_name: Nome da aba
+            range_key: Identificação do intervalo lido
+
+        Returns:
+            Dicionário com 'values' (linhas), 'revision' e 'saved_at'
+            (timestamp Unix) ou None se não houver snapshot válido
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT revisao, dados, salvo_em FROM snapshots "
+                    "WHERE planilha = ? AND aba = ? AND intervalo = ?",
+                    (spreadsheet_id, sheet_name, range_key)
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Erro ao ler snapshot da aba {sheet_name}: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        revision, payload, saved_at = row
+        try:
+            values = json.loads(zlib.decompress(payload).decode('utf-8'))
+        except (zlib.error, ValueError) as e:
+            print(f"Snapshot da aba {sheet_name} corrompido, ignorando: {e}")
+            return None
+        return {'values': values, 'revision': revision, 'saved_at': saved_at}
@@ -0,0 +1,213 @@
+"""
+Camada de requisições à API do Google Sheets: classificação de erros,
+novas tentativas com espera exponencial (com jitter) e limite de taxa
+(token bucket) compatível com a cota de leituras por minuto.
+"""
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Códigos HTTP de falhas temporárias, que valem uma nova tentativa
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class SheetsRequestError(Exception):
+    """
+    Falha de uma requisição ao Google Sheets.
+
+    Atributos:
+        status (int | None): Código HTTP, se houver
+        retryable (bool): True para falhas temporárias (cota, instabilidade,
+            rede) que persistiram após todas as tentativas
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None, retryable: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+
+
+def get_http_status(error: Exception) -> Optional[int]:
+    """Extrai o código HTTP de um erro da API (googleapiclient.errors.HttpError)."""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        resp = getattr(error, 'resp', None)
+        status = getattr(resp, 'status', None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Classifica um erro: True para falhas temporárias (HTTP 408/429/5xx,
+    timeouts e erros de conexão), False para erros definitivos (range
+    inválido, permissão negada...).
+    """
+    status = get_http_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    # Erros de rede (timeouts, conexão recusada/reiniciada, SSL) herdam de OSError
+    return isinstance(error, OSError) or type(error).__name__ == 'ServerNotFoundError'
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Tempo de espera sugerido pelo servidor (cabeçalho Retry-After), em segundos."""
+    resp = getattr(error, 'resp', None)
+    value = resp.get('retry-after') if hasattr(resp, 'get') else None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Limitador de taxa token bucket, seguro entre threads.
+
+    Com capacidade C e reposição de (cota - C) fichas por período, nenhuma
+    janela de `period` segundos ultrapassa a cota.
+    """
+
+    def __init__(
+        self,
+        requests_per_period: int,
+        period: float = 60.0,
+        burst: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Inicializa o limitador.
+
+        Args:
+            requests_per_period: Cota de requisições por período
+            period: Duração do período da cota, em segundos
+            burst: Requisições permitidas de imediato (capacidade do balde)
+            clock: Função que retorna o tempo atual (monotônico)
+            sleep: Função usada para esperar
+        """
+        self.capacity = max(1, min(burst, requests_per_period))
+        self.rate = max(1, requests_per_period - self.capacity) / period
+        self._tokens = float(self.capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Consome uma ficha, esperando se necessário.
+
+        Returns:
+            Tempo esperado, em segundos (0 se havia ficha disponível)
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            # Reserva a ficha agora; quem chegar depois espera a seguinte
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class RequestMetrics:
+    """Contadores de uso da API, seguros entre threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.failures = 0
+        self.throttled = 0
+        self.throttle_seconds = 0.0
+        self.backoff_seconds = 0.0
+
+    def add(self, **counters: float):
+        """Incrementa os contadores informados (ex: add(retries=1))."""
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Retorna uma cópia dos contadores."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'retries': self.retries,
+                'rate_limited': self.rate_limited,
+                'failures': self.failures,
+                'throttled': self.throttled,
+                'throttle_seconds': round(self.throttle_seconds, 3),
+                'backoff_seconds': round(self.backoff_seconds, 3),
+            }
+
+
+def execute_with_retry(
+    request: Callable[[], Any],
+    limiter: Optional[TokenBucket] = None,
+    metrics: Optional[RequestMetrics] = None,
+    max_retries: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 32.0,
+    sleep: Callable[[float], None] = time.sleep
+) -> Any:
+    """
+    Executa uma requisição respeitando o limite de taxa e repetindo falhas
+    temporárias com espera exponencial e jitter ("full jitter").
+
+    Args:
+        request: Função sem argumentos que faz a chamada (ex: lambda: req.execute())
+        limiter: Limitador de taxa consultado antes de cada tentativa
+        metrics: Contadores a atualizar
+        max_retries: Número máximo de novas tentativas
+        base_delay: Espera base, em segundos, dobrada a cada tentativa
+        max_delay: Espera máxima entre tentativas, em segundos
+        sleep: Função usada para esperar
+
+    Returns:
+        Resultado da requisição
+
+    Raises:
+        SheetsRequestError: Erro definitivo ou falha temporária que persistiu
+            após todas as tentativas
+    """
+    metrics = metrics or RequestMetrics()
+    attempt = 0
+    while True:
+        if limiter is not None:
+            waited = limiter.acquire()
+            if waited > 0:
+                metrics.add(throttled=1, throttle_seconds=waited)
+
+        metrics.add(requests=1)
+        try:
+            return request()
+        except Exception as e:
+            status = get_http_status(e)
+            retryable = is_retryable(e)
+            if status == 429:
+                metrics.add(rate_limited=1)
+
+            if not retryable or attempt >= max_retries:
+                metrics.add(failures=1)
+                raise SheetsRequestError(str(e), status=status, retryable=retryable) from e
+
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            retry_after = get_retry_after(e)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, max_delay))
+
+            attempt += 1
+            metrics.add(retries=1, backoff_seconds=delay)
+            print(f"Falha temporária no Google Sheets ({status or type(e).__name__}); "
+                  f"nova tentativa {attempt}/{max_retries} em {delay:.1f} s")
+            sleep(delay)
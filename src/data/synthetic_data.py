@@ -0,0 +1,180 @@
+"""
+Gerador de dados sintéticos (membros e check-ins) para benchmarks, testes
+de carga e para exercitar a interface sem dados reais.
+
+Os dados seguem o formato gravado pelo aplicativo: datas em DD/MM/AAAA,
+planos de config.PLANOS (com vencimento apenas nos de
+config.PLANOS_COM_VENCIMENTO) e nomes únicos, como na planilha.
+"""
+import random
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src import config
+from src.data.backends.memory_backend import InMemoryBackend
+
+FIRST_NAMES = (
+    "Ana", "Antônio", "Beatriz", "Bruno", "Camila", "Carlos", "Carolina", "Daniel",
+    "Eduarda", "Eduardo", "Fernanda", "Felipe", "Gabriel", "Gabriela", "Gustavo",
+    "Helena", "Igor", "Isabela", "João", "Júlia", "Larissa", "Leonardo", "Letícia",
+    "Lucas", "Luana", "Luiz", "Marcelo", "Maria", "Mariana", "Mateus", "Natália",
+    "Otávio", "Patrícia", "Paulo", "Pedro", "Rafael", "Rafaela", "Renata", "Ricardo",
+    "Rodrigo", "Sabrina", "Samuel", "Sofia", "Tatiane", "Thiago", "Valéria", "Vinícius",
+    "Vitória", "Yasmin", "Zélia",
+)
+
+SURNAMES = (
+    "Almeida", "Alves", "Araújo", "Barbosa", "Barros", "Batista", "Cardoso", "Carvalho",
+    "Castro", "Cavalcanti", "Costa", "Cunha", "Dias", "Duarte", "Fernandes", "Ferreira",
+    "Freitas", "Gomes", "Gonçalves", "Lima", "Lopes", "Machado", "Martins", "Melo",
+    "Mendes", "Monteiro", "Moraes", "Moreira", "Nascimento", "Nogueira", "Oliveira",
+    "Pereira", "Pinto", "Ramos", "Reis", "Ribeiro", "Rocha", "Rodrigues", "Santos",
+    "Silva", "Soares", "Souza", "Teixeira", "Vieira",
+)
+
+# Peso relativo de cada plano (planos de config.PLANOS fora daqui têm peso 1)
+PLAN_WEIGHTS = {
+    "Mensal": 35,
+    "Mens. c/ Treino": 10,
+    "Trimestral": 12,
+    "Semestral": 8,
+    "Anual": 8,
+    "Diária": 4,
+    "Gympass": 12,
+    "Totalpass": 8,
+    "Cortesia": 3,
+}
+
+# Duração (dias) dos planos com vencimento
+PLAN_DURATION_DAYS = {
+    "Mensal": 30,
+    "Mens. c/ Treino": 30,
+    "Trimestral": 90,
+    "Semestral": 180,
+    "Anual": 365,
+}
+
+# Horários de check-in: picos no início da manhã e no fim da tarde
+CHECKIN_HOURS = (6, 7, 8, 9, 10, 11, 12, 14, 15, 16, 17, 18, 19, 20, 21)
+CHECKIN_HOUR_WEIGHTS = (8, 10, 8, 5, 3, 2, 3, 2, 2, 4, 9, 12, 11, 8, 4)
+
+
+def _unique_names(count: int, rng: random.Random) -> List[str]:
+    """Gera `count` nomes distintos (nome + dois sobrenomes, com sufixo numérico se faltarem combinações)."""
+    surname_pairs = len(SURNAMES) * len(SURNAMES)
+    combinations = len(FIRST_NAMES) * surname_pairs
+    picks = rng.sample(range(combinations), min(count, combinations))
+
+    names = []
+    for pick in picks:
+        first, rest = divmod(pick, surname_pairs)
+        middle, last = divmod(rest, len(SURNAMES))
+        names.append(f"{FIRST_NAMES[first]} {SURNAMES[middle]} {SURNAMES[last]}")
+    for i in range(count - len(names)):
+        names.append(f"{names[i % combinations]} {i // combinations + 2}")
+    return names
+
+
+def generate_members(
+    count: int,
+    rng: Optional[random.Random] = None,
+    today: Optional[date] = None
+) -> List[Dict[str, Any]]:
+    """
+    Gera membros sintéticos.
+
+    Args:
+        count: Número de membros
+        rng: Gerador de números aleatórios (para resultados reproduzíveis)
+        today: Data de referência para vencimentos e idades (padrão: hoje)
+
+    Returns:
+        Lista de dicionários no formato de add_member
+    """
+    rng = rng or random.Random()
+    today = today or date.today()
+    plans = list(config.PLANOS)
+    weights = [PLAN_WEIGHTS.get(plan, 1) for plan in plans]
+
+    members = []
+    for nome in _unique_names(count, rng):
+        plano = rng.choices(plans, weights)[0]
+
+        vencimento = None
+        estado = 'ATIVO'
+        if plano in config.PLANOS_COM_VENCIMENTO:
+            # Parte dos planos já venceu (membros que não renovaram)
+            duration = PLAN_DURATION_DAYS.get(plano, 30)
+            expires = today + timedelta(days=rng.randint(-60, duration))
+            vencimento = expires.strftime('%d/%m/%Y')
+            estado = 'ATIVO' if expires >= today else 'INATIVO'
+
+        # Idades concentradas entre 20 e 40 anos; aniversários espalhados pelo ano
+        age = int(rng.triangular(14, 75, 27))
+        birth = date(today.year - age, 1, 1) + timedelta(days=rng.randrange(365))
+
+        members.append({
+            'nome': nome,
+            'plano': plano,
+            'vencimento_plano': vencimento,
+            'estado_plano': estado,
+            'data_nascimento': birth.strftime('%d/%m/%Y'),
+            'whatsapp': f"119{rng.randint(10000000, 99999999)}",
+            'genero': rng.choice(("M", "F")),
+            'frequencia': rng.choice(("2x", "3x", "3x", "5x")),
+            'calcado': str(rng.randint(34, 45)),
+        })
+    return members
+
+
+def generate_checkins(
+    member_ids: Sequence[int],
+    per_member: int,
+    rng: Optional[random.Random] = None,
+    days: int = 365,
+    today: Optional[date] = None
+) -> Iterator[Tuple[int, datetime]]:
+    """
+    Gera check-ins sintéticos nos últimos `days` dias (incluindo hoje).
+
+    Args:
+        member_ids: IDs dos membros
+        per_member: Média de check-ins por membro (cada membro tem entre 0 e
+            o dobro da média, como alunos mais e menos assíduos)
+        rng: Gerador de números aleatórios
+        days: Período coberto, em dias
+        today: Último dia do período (padrão: hoje)
+
+    Returns:
+        Iterador de (id do membro, data e hora do check-in)
+    """
+    rng = rng or random.Random()
+    today = today or date.today()
+    for member_id in member_ids:
+        for _ in range(rng.randint(0, 2 * per_member)):
+            day = today - timedelta(days=rng.randrange(days))
+            hour = rng.choices(CHECKIN_HOURS, CHECKIN_HOUR_WEIGHTS)[0]
+            yield member_id, datetime.combine(day, time(hour, rng.randrange(60), rng.randrange(60)))
+
+
+def build_memory_backend(
+    members: int,
+    checkins_per_member: int = 10,
+    seed: Optional[int] = None
+) -> InMemoryBackend:
+    """
+    Cria um backend em memória com dados sintéticos.
+
+    Args:
+        members: Número de membros
+        checkins_per_member: Média de check-ins por membro
+        seed: Semente do gerador (mesma semente, mesmos dados)
+
+    Returns:
+        InMemoryBackend preenchido
+    """
+    rng = random.Random(seed)
+    member_data = generate_members(members, rng)
+    # O InMemoryBackend numera os membros a partir de 1, na ordem recebida
+    checkins = generate_checkins(range(1, len(member_data) + 1), checkins_per_member, rng)
+    return InMemoryBackend(member_data, checkins)
@@ -0,0 +1,33 @@
+"""Entrega dos eventos de src.core.events na thread da interface."""
+
+from typing import Iterable, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from src.core.events import EventBus, get_event_bus
+
+
+class EventBridge(QObject):
+    """
+    Assina eventos do barramento e os reemite como sinal Qt.
+    Os eventos podem ser publicados em qualquer thread (ex: um worker que
+    registra check-ins); como o objeto vive na thread da interface, o Qt
+    enfileira a entrega e os slots conectados rodam sempre nela.
+    """
+    
+    event_received = pyqtSignal(str, dict)
+    
+    def __init__(self, event_types: Iterable[str], event_bus: Optional[EventBus] = None, parent=None):
+        super().__init__(parent)
+        bus = event_bus or get_event_bus()
+        self._unsubscribers = [bus.subscribe(event_type, self._forward) for event_type in event_types]
+    
+    def _forward(self, event_type: str, payload: dict):
+        # Copia os dados: quem publicou pode continuar alterando o dicionário
+        self.event_received.emit(event_type, dict(payload))
+    
+    def close(self):
+        """Cancela as assinaturas (chamar antes de destruir o objeto)."""
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
@@ -5,18 +5,23 @@ import sys
 from PyQt6.QtWidgets import (
     QMainWindow, QStackedWidget, QMessageBox, QDialog
 )
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QAction
 
 from src.core.aniversariantes_manager import AniversariantesManager
 from src.ui.html_formatter import HTMLFormatter
 from src.core.member_search_service import MemberSearchService
 from src.ui.styles import STYLESHEET
+from src.config import SEARCH_DEBOUNCE_MS, MIN_LIVE_SEARCH_LENGTH, DASHBOARD_RECONCILE_SECONDS
+from src.core.events import CHECKIN_ADDED, CHECKIN_DELETED
+from src.ui.event_bridge import EventBridge
 
 from src.ui.workers import (
     DataFetchWorker,
     DatabaseConnectionWorker,
     MemberSearchWorker,
-    DashboardWorker
+    DashboardWorker,
+    TaskRunner
 )
 from src.ui.screens import (
     HomeScreen,
@@ -42,12 +47,33 @@ class MainWindow(QMainWindow):
         self.worker = None
         self.is_connected = False
         
+        # Worker único de busca por nome, compartilhado pelas telas; cada
+        # tela tem seu contador de geração para descartar respostas antigas
+        self.search_worker = MemberSearchWorker(self.search_service)
+        self.search_worker.search_completed.connect(self._on_search_completed)
+        self.search_generations = {'membros': 0, 'checkin': 0}
+        
+        # Consultas e escritas pontuais (detalhes, histórico, check-in...)
+        # rodam no pool do TaskRunner, fora da thread da GUI
+        self.task_runner = TaskRunner(parent=self)
+        self.task_runner.busy_changed.connect(self._on_busy_changed)
+        
         self._setup_ui()
+        
+        # O dashboard é atualizado pelos eventos de check-in e reconciliado
+        # com o banco periodicamente (escritas de outros processos, virada do dia)
+        self.event_bridge = EventBridge((CHECKIN_ADDED, CHECKIN_DELETED), parent=self)
+        self.event_bridge.event_received.connect(self.dashboard_screen.apply_event)
+        self.dashboard_reconcile_timer = QTimer(self)
+        self.dashboard_reconcile_timer.setInterval(DASHBOARD_RECONCILE_SECONDS * 1000)
+        self.dashboard_reconcile_timer.timeout.connect(self._reconcile_dashboard)
+        self.dashboard_reconcile_timer.start()
+        
         self._auto_connect()
 
     def _auto_connect(self):
         """Inicia a conexão com o banco de dados automaticamente."""
-        self.worker = DatabaseConnectionWorker()
+        self.worker = DatabaseConnectionWorker(self.search_service)
         self.worker.status_updated.connect(self._on_connection_status_updated)
         self.worker.connection_completed.connect(self._on_connection_completed)
         self.worker.start()
@@ -125,8 +151,9 @@ class MainWindow(QMainWindow):
         """Conecta sinais das telas."""
         # Dashboard
         self.dashboard_screen.view_checkins_button.clicked.connect(
-            self.dashboard_screen.show_checkins_details
+            self._on_view_checkins_clicked
         )
+        self.dashboard_screen.chart_options_changed.connect(self._update_dashboard)
         
         # Aniversariantes
         self.aniversariantes_screen.search_button.clicked.connect(
@@ -134,6 +161,8 @@ class MainWindow(QMainWindow):
         )
         
         # Busca de Membros
+        self.member_search_timer = self._create_debounce_timer(self._on_member_live_search)
+        self.member_search_screen.name_input.textChanged.connect(self.member_search_timer.start)
         self.member_search_screen.name_input.returnPressed.connect(
             self._on_member_search_by_name
         )
@@ -148,8 +177,13 @@ class MainWindow(QMainWindow):
         )
         # Substituir o método request_delete_checkin por nossa implementação
         self.member_search_screen.request_delete_checkin = self._on_delete_checkin_requested
+        self.member_search_screen.history_model.fetch_requested.connect(
+            self._on_history_page_requested
+        )
         
         # Check-in
+        self.checkin_search_timer = self._create_debounce_timer(self._on_checkin_live_search)
+        self.checkin_screen.name_input.textChanged.connect(self.checkin_search_timer.start)
         self.checkin_screen.name_input.returnPressed.connect(
             self._on_checkin_search_by_name
         )
@@ -163,12 +197,31 @@ class MainWindow(QMainWindow):
             self._on_confirm_checkin_clicked
         )
     
+    def _create_debounce_timer(self, callback) -> QTimer:
+        """
+        Cria um timer de disparo único para a busca enquanto o usuário digita.
+        Cada tecla reinicia o timer; a busca só acontece após a pausa.
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(SEARCH_DEBOUNCE_MS)
+        timer.timeout.connect(callback)
+        return timer
+    
+    def _on_busy_changed(self, busy: bool):
+        """Mostra o cursor de espera enquanto há tarefas em segundo plano."""
+        if busy:
+            self.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.unsetCursor()
+    
     # === Navegação entre telas ===
     
     def _show_dashboard(self):
-        """Mostra a tela do dashboard."""
+        """Mostra a tela do dashboard (consulta o banco só se os dados estiverem desatualizados)."""
         self.stacked_widget.setCurrentIndex(1)
-        self._update_dashboard()
+        if self.dashboard_screen.needs_reload:
+            self._update_dashboard()
 
     def _show_aniversariantes(self):
         """Mostra a tela de aniversariantes."""
@@ -198,6 +251,7 @@ class MainWindow(QMainWindow):
         """Manipula a conclusão da conexão."""
         if success:
             self.is_connected = True
+            self.search_worker.start()
             if hasattr(self, 'gestao_menu') and self.gestao_menu:
                 self.gestao_menu.setEnabled(True)
             if hasattr(self, 'atividade_menu') and self.atividade_menu:
@@ -214,11 +268,43 @@ class MainWindow(QMainWindow):
         if not self.is_connected:
             return
         
-        self.dashboard_worker = DashboardWorker(self.manager)
+        # Trocas rápidas de período/agrupamento: a busca anterior termina em
+        # segundo plano (a janela é dona da thread) e o resultado é descartado
+        previous = getattr(self, 'dashboard_worker', None)
+        if previous is not None and previous.isRunning():
+            previous.dashboard_updated.disconnect()
+            previous.setParent(self)
+            previous.finished.connect(previous.deleteLater)
+        
+        self.dashboard_worker = DashboardWorker(
+            self.manager,
+            chart_days=self.dashboard_screen.chart_days,
+            chart_granularity=self.dashboard_screen.chart_granularity
+        )
         self.dashboard_worker.dashboard_updated.connect(self.dashboard_screen.update_dashboard)
         self.dashboard_worker.error_occurred.connect(self.dashboard_screen.show_error)
+        self.dashboard_screen.begin_reload()
         self.dashboard_worker.start()
     
+    def _reconcile_dashboard(self):
+        """Reconciliação periódica do dashboard com o banco."""
+        self.dashboard_screen.mark_stale()
+        if self.stacked_widget.currentWidget() is self.dashboard_screen:
+            self._update_dashboard()
+    
+    def _on_view_checkins_clicked(self):
+        """Busca os check-ins de hoje em segundo plano e mostra os detalhes."""
+        from src.data.data_provider import get_checkins_today_details
+        
+        self.task_runner.run(
+            get_checkins_today_details,
+            key='checkins_today',
+            on_success=self.dashboard_screen.show_checkins_details,
+            on_error=lambda message: QMessageBox.critical(
+                self, "Erro", f"Erro ao buscar detalhes dos check-ins: {message}"
+            )
+        )
+    
     # === Aniversariantes ===
     
     def _on_aniversariantes_search_clicked(self):
@@ -246,19 +332,62 @@ class MainWindow(QMainWindow):
     
     # === Busca de Membros ===
     
+    def _request_search(self, channel: str, search_term: str) -> bool:
+        """
+        Envia uma busca ao worker, invalidando as buscas anteriores da tela.
+        
+        Args:
+            channel: Tela que pediu a busca ('membros' ou 'checkin')
+            search_term: Termo de busca (vazio apenas invalida as anteriores)
+            
+        Returns:
+            True se a busca foi enviada, False caso contrário
+        """
+        self.search_generations[channel] += 1
+        if not search_term or not self.search_worker.isRunning():
+            return False
+        
+        self.search_worker.request_search(channel, self.search_generations[channel], search_term)
+        return True
+    
+    def _on_search_completed(self, channel: str, generation: int, results: list):
+        """Entrega o resultado à tela que pediu, se ainda for a busca mais recente."""
+        if generation != self.search_generations.get(channel):
+            return
+        
+        if channel == 'membros':
+            self._on_member_search_completed(results)
+        elif channel == 'checkin':
+            self._on_checkin_search_completed(results)
+    
     def _on_member_search_by_name(self):
-        """Manipula a busca por nome."""
+        """Manipula a busca por nome (Enter ou botão Buscar)."""
+        self.member_search_timer.stop()
         search_term = self.member_search_screen.name_input.text().strip()
         
         if not search_term:
+            self._request_search('membros', '')
+            self.member_search_screen.set_ready_state()
             self.member_search_screen.show_empty_search_warning()
             return
         
         self.member_search_screen.set_searching_state()
+        if not self._request_search('membros', search_term):
+            self.member_search_screen.set_ready_state()
+    
+    def _on_member_live_search(self):
+        """Busca enquanto o usuário digita, após a pausa do debounce."""
+        search_term = self.member_search_screen.name_input.text().strip()
         
-        self.worker = MemberSearchWorker(self.search_service, search_term)
-        self.worker.search_completed.connect(self._on_member_search_completed)
-        self.worker.start()
+        if len(search_term) < MIN_LIVE_SEARCH_LENGTH:
+            # Invalida buscas em andamento (cujo resultado não chegará mais
+            # para liberar o botão) e limpa a lista
+            self._request_search('membros', '')
+            self.member_search_screen.set_ready_state()
+            self.member_search_screen.results_list.clear()
+            return
+        
+        self._request_search('membros', search_term)
     
     def _on_member_search_completed(self, results):
         """Manipula a conclusão da busca por nome."""
@@ -271,33 +400,48 @@ class MainWindow(QMainWindow):
     
     def _on_member_result_clicked(self, item):
         """Manipula o clique em um resultado da lista."""
-        from PyQt6.QtCore import Qt
-        
         member_id = item.data(Qt.ItemDataRole.UserRole)
-        member_data = self.search_service.get_member_by_id(member_id)
         
-        if member_data:
-            self.member_search_screen.display_member_data(member_data)
-            self._load_member_history(member_id, member_data.get('nome', 'Membro'))
-        else:
-            self.member_search_screen.show_error()
+        def on_success(member_data):
+            if member_data:
+                self.member_search_screen.display_member_data(member_data)
+                self._load_member_history(member_id, member_data.get('nome', 'Membro'))
+            else:
+                self.member_search_screen.show_error()
+        
+        # Cliques seguidos: vale só o último membro clicado
+        self.task_runner.run(
+            self.search_service.get_member_by_id, member_id,
+            key='member_details',
+            on_success=on_success,
+            on_error=lambda message: self.member_search_screen.show_error()
+        )
     
     def _load_member_history(self, member_id: int, member_name: str):
-        """Carrega e exibe o histórico de check-ins do membro."""
-        try:
-            from src.data.data_provider import get_member_checkin_history
-            
-            history = get_member_checkin_history(member_id)
-            self.member_search_screen.display_member_history(member_id, member_name, history)
-            
-        except Exception as e:
-            print(f"Erro ao carregar histórico: {e}")
-            self.member_search_screen.member_history_browser.setHtml(f"""
-                <div style="text-align: center; padding: 20px;">
-                    <h3 style="color: #FF6B6B;">Erro ao carregar histórico</h3>
-                    <p style="color: #888;">{str(e)}</p>
-                </div>
-            """)
+        """Exibe o histórico de check-ins do membro (as páginas são buscadas em segundo plano)."""
+        from src.data.data_provider import get_member_checkin_count
+        
+        self.member_search_screen.display_member_history(member_id, member_name)
+        self.task_runner.run(
+            get_member_checkin_count, member_id,
+            key='member_history_total',
+            on_success=lambda total: self.member_search_screen.set_history_total(member_id, total),
+            on_error=self.member_search_screen.show_history_error
+        )
+    
+    def _on_history_page_requested(self, member_id: int, before):
+        """Busca a próxima página do histórico pedida pela lista (ao rolar até o fim)."""
+        from src.data.data_provider import get_member_checkin_history
+        
+        model = self.member_search_screen.history_model
+        self.task_runner.run(
+            get_member_checkin_history, member_id,
+            before=before,
+            limit=model.page_size,
+            key='member_history',
+            on_success=lambda rows: model.append_page(member_id, rows),
+            on_error=self.member_search_screen.show_history_error
+        )
     
     def _on_edit_member_clicked(self):
         """Abre o diálogo de edição do membro atual."""
@@ -312,12 +456,17 @@ class MainWindow(QMainWindow):
     
     def _on_member_updated(self, updated_data: dict):
         """Manipula a atualização de um membro."""
-        try:
-            from src.data.data_provider import update_member
-            
-            success = update_member(updated_data)
-            
+        def update_and_reload():
+            # Só a gravação roda em segundo plano; o índice de nomes é
+            # atualizado em on_success, na thread da GUI
+            if not self.search_service.data_provider.update_member(updated_data):
+                return False, None
+            return True, self.search_service.get_member_by_id(updated_data['id'])
+        
+        def on_success(result):
+            success, updated_member = result
             if success:
+                self.search_service.update_index(updated_data)
                 QMessageBox.information(
                     self,
                     "Sucesso",
@@ -325,9 +474,6 @@ class MainWindow(QMainWindow):
                 )
                 
                 # Atualiza a exibição com os novos dados
-                member_id = updated_data['id']
-                updated_member = self.search_service.get_member_by_id(member_id)
-                
                 if updated_member:
                     self.member_search_screen.display_member_data(updated_member)
             else:
@@ -336,12 +482,16 @@ class MainWindow(QMainWindow):
                     "Erro",
                     "Não foi possível atualizar o membro. Verifique o console."
                 )
-        except Exception as e:
-            QMessageBox.critical(
+        
+        self.task_runner.run(
+            update_and_reload,
+            on_success=on_success,
+            on_error=lambda message: QMessageBox.critical(
                 self,
                 "Erro Crítico",
-                f"Ocorreu um erro inesperado: {e}"
+                f"Ocorreu um erro inesperado: {message}"
             )
+        )
     
     def _on_delete_checkin_requested(self, checkin_id: int):
         """Manipula a solicitação de exclusão de um check-in."""
@@ -354,50 +504,62 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.No
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                from src.data.data_provider import delete_checkin
-                
-                success = delete_checkin(checkin_id)
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        from src.data.data_provider import delete_checkin
+        
+        def on_success(success):
+            if success:
+                QMessageBox.information(
+                    self,
+                    "Sucesso",
+                    "Check-in deletado com sucesso!"
+                )
                 
-                if success:
-                    QMessageBox.information(
-                        self,
-                        "Sucesso",
-                        "Check-in deletado com sucesso!"
-                    )
-                    
-                    # Recarrega o histórico do membro atual
-                    if self.member_search_screen.current_member_data:
-                        member_id = self.member_search_screen.current_member_data['id']
-                        member_name = self.member_search_screen.current_member_data['nome']
-                        self._load_member_history(member_id, member_name)
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Erro",
-                        "Não foi possível deletar o check-in. Verifique o console."
-                    )
-            except Exception as e:
-                QMessageBox.critical(
+                # Retira o check-in da lista, sem recarregar o histórico
+                self.member_search_screen.remove_checkin_from_history(checkin_id)
+            else:
+                QMessageBox.warning(
                     self,
-                    "Erro Crítico",
-                    f"Ocorreu um erro inesperado: {e}"
+                    "Erro",
+                    "Não foi possível deletar o check-in. Verifique o console."
                 )
+        
+        self.task_runner.run(
+            delete_checkin, checkin_id,
+            on_success=on_success,
+            on_error=lambda message: QMessageBox.critical(
+                self,
+                "Erro Crítico",
+                f"Ocorreu um erro inesperado: {message}"
+            )
+        )
     
     # === Check-in ===
     
     def _on_checkin_search_by_name(self):
-        """Manipula a busca por nome na tela de check-in."""
+        """Manipula a busca por nome na tela de check-in (Enter ou botão Buscar)."""
+        self.checkin_search_timer.stop()
         search_term = self.checkin_screen.name_input.text().strip()
         if not search_term:
             return
 
         self.checkin_screen.set_searching_state()
+        if not self._request_search('checkin', search_term):
+            self.checkin_screen.set_ready_state()
 
-        self.worker = MemberSearchWorker(self.search_service, search_term)
-        self.worker.search_completed.connect(self._on_checkin_search_completed)
-        self.worker.start()
+    def _on_checkin_live_search(self):
+        """Busca enquanto o usuário digita na tela de check-in."""
+        search_term = self.checkin_screen.name_input.text().strip()
+
+        if len(search_term) < MIN_LIVE_SEARCH_LENGTH:
+            self._request_search('checkin', '')
+            self.checkin_screen.set_ready_state()
+            self.checkin_screen.results_list.clear()
+            return
+
+        self._request_search('checkin', search_term)
 
     def _on_checkin_search_completed(self, results):
         """Manipula a conclusão da busca na tela de check-in."""
@@ -406,15 +568,20 @@ class MainWindow(QMainWindow):
 
     def _on_checkin_result_clicked(self, item):
         """Manipula o clique em um resultado na lista de check-in."""
-        from PyQt6.QtCore import Qt
-        
         member_id = item.data(Qt.ItemDataRole.UserRole)
-        member_data = self.search_service.get_member_by_id(member_id)
 
-        if member_data:
-            self.checkin_screen.display_member_for_checkin(member_id, member_data)
-        else:
-            self.checkin_screen.show_error()
+        def on_success(member_data):
+            if member_data:
+                self.checkin_screen.display_member_for_checkin(member_id, member_data)
+            else:
+                self.checkin_screen.show_error()
+
+        self.task_runner.run(
+            self.search_service.get_member_by_id, member_id,
+            key='checkin_member',
+            on_success=on_success,
+            on_error=lambda message: self.checkin_screen.show_error()
+        )
 
     def _on_confirm_checkin_clicked(self):
         """Confirma e registra o check-in do membro."""
@@ -424,15 +591,40 @@ class MainWindow(QMainWindow):
         from src.data.data_provider import add_checkin
         from datetime import datetime
 
-        try:
-            checkin_id = add_checkin(self.checkin_screen.current_member_id, datetime.now())
+        def on_success(checkin_id):
             if checkin_id:
                 QMessageBox.information(self, "Check-in Realizado", "Check-in confirmado com sucesso!")
                 self.checkin_screen.clear_after_checkin()
             else:
                 QMessageBox.warning(self, "Erro", "Não foi possível registrar o check-in.")
-        except Exception as e:
-            QMessageBox.critical(self, "Erro Crítico", f"Ocorreu um erro inesperado: {e}")
+
+        # Desabilitado até a resposta, para não registrar o check-in duas vezes
+        self.checkin_screen.confirm_button.setEnabled(False)
+        self.task_runner.run(
+            add_checkin, self.checkin_screen.current_member_id, datetime.now(),
+            on_success=on_success,
+            on_error=lambda message: QMessageBox.critical(
+                self, "Erro Crítico", f"Ocorreu um erro inesperado: {message}"
+            ),
+            on_finished=self._on_checkin_task_finished
+        )
+
+    def _on_checkin_task_finished(self):
+        """Reabilita a confirmação se ainda há um membro selecionado."""
+        self.checkin_screen.confirm_button.setEnabled(
+            self.checkin_screen.current_member_id is not None
+        )
+    
+    # === Encerramento ===
+    
+    def closeEvent(self, event):
+        """Encerra o worker de busca antes de fechar a janela."""
+        self.dashboard_reconcile_timer.stop()
+        self.event_bridge.close()
+        self.search_worker.stop()
+        self.search_worker.wait()
+        self.task_runner.wait_for_done()
+        super().closeEvent(event)
     
     # === Adicionar Membro ===
     
@@ -454,19 +646,23 @@ class MainWindow(QMainWindow):
                                        f"O campo '{field.replace('_', ' ').title()}' é obrigatório.")
                     return
 
-            try:
-                from src.data.data_provider import add_member
-                
-                new_id = add_member(member_data)
+            def on_success(new_id):
                 if new_id:
                     QMessageBox.information(self, "Sucesso", 
                                           f"Membro '{member_data['nome']}' adicionado com sucesso!")
                 else:
                     QMessageBox.critical(self, "Erro", 
                                         "Não foi possível adicionar o membro. Verifique o console.")
-            except Exception as e:
-                QMessageBox.critical(self, "Erro Crítico", 
-                                    f"Ocorreu um erro inesperado ao salvar o membro: {e}")
+
+            # O evento MEMBER_ADDED inclui o membro no índice de nomes na
+            # thread da tarefa (o NameIndex é protegido por lock)
+            self.task_runner.run(
+                self.search_service.add_member, member_data,
+                on_success=on_success,
+                on_error=lambda message: QMessageBox.critical(
+                    self, "Erro Crítico", f"Ocorreu um erro inesperado ao salvar o membro: {message}"
+                )
+            )
 
 
 def main():
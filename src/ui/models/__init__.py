@@ -0,0 +1,5 @@
+"""Modelos de dados (Qt model/view) usados pelas telas."""
+
+from .checkin_history_model import CheckinHistoryModel
+
+__all__ = ['CheckinHistoryModel']
@@ -0,0 +1,160 @@
+"""Modelo do histórico de check-ins de um membro, carregado por páginas."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+from src.config import HISTORY_PAGE_SIZE
+
+
+MONTHS_PT = (
+    'Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho',
+    'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro'
+)
+
+WEEKDAYS_PT = (
+    'Segunda-feira', 'Terça-feira', 'Quarta-feira', 'Quinta-feira',
+    'Sexta-feira', 'Sábado', 'Domingo'
+)
+
+
+class CheckinHistoryModel(QAbstractTableModel):
+    """
+    Check-ins de um membro, do mais recente ao mais antigo.
+
+    O modelo não acessa os dados: quando a view chega ao fim da rolagem
+    (canFetchMore/fetchMore), ele emite fetch_requested com o cursor da
+    próxima página, e quem busca a página (a MainWindow, em segundo plano)
+    a entrega em append_page. Só as linhas visíveis são formatadas.
+    """
+
+    COLUMNS = ('Mês', 'Data', 'Dia da semana', 'Horário')
+
+    # (id do membro, (checkin_datetime, id) do último check-in carregado ou None)
+    fetch_requested = pyqtSignal(int, object)
+
+    def __init__(self, page_size: int = HISTORY_PAGE_SIZE, parent=None):
+        super().__init__(parent)
+        self.page_size = page_size
+        self.member_id: Optional[int] = None
+        self._rows: List[Dict[str, Any]] = []
+        self._exhausted = True
+        self._loading = False
+
+    # === Carregamento por páginas ===
+
+    def set_member(self, member_id: Optional[int]):
+        """
+        Troca o membro exibido, descartando as linhas carregadas.
+
+        Args:
+            member_id: ID do membro (None: lista vazia)
+        """
+        self.beginResetModel()
+        self.member_id = member_id
+        self._rows = []
+        self._exhausted = member_id is None
+        self._loading = False
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._loading = True
+        self.fetch_requested.emit(self.member_id, self.next_cursor())
+
+    def next_cursor(self) -> Optional[Tuple[str, int]]:
+        """Chave (checkin_datetime, id) do último check-in carregado, ou None."""
+        if not self._rows:
+            return None
+        last = self._rows[-1]
+        return last['checkin_datetime'], last['id']
+
+    def append_page(self, member_id: int, rows: List[Dict[str, Any]]):
+        """
+        Acrescenta uma página buscada após fetch_requested.
+
+        Args:
+            member_id: Membro da página (páginas de outro membro são ignoradas)
+            rows: Check-ins da página, do mais recente ao mais antigo
+        """
+        if member_id != self.member_id:
+            return
+        self._loading = False
+        # Página incompleta: não há check-ins mais antigos
+        self._exhausted = len(rows) < self.page_size
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+    def fetch_failed(self, member_id: int):
+        """Interrompe o carregamento após um erro (sem repetir a busca a cada rolagem)."""
+        if member_id == self.member_id:
+            self._loading = False
+            self._exhausted = True
+
+    def remove_checkin(self, checkin_id: int) -> bool:
+        """
+        Remove da lista um check-in já excluído da fonte de dados.
+
+        Args:
+            checkin_id: ID do check-in
+
+        Returns:
+            True se o check-in estava carregado
+        """
+        for row, checkin in enumerate(self._rows):
+            if checkin['id'] == checkin_id:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+                return True
+        return False
+
+    def checkin_at(self, row: int) -> Optional[Dict[str, Any]]:
+        """Retorna o check-in da linha (ou None)."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    # === Interface do QAbstractTableModel ===
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        checkin = self._rows[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            dt = datetime.fromisoformat(checkin['checkin_datetime'])
+            column = index.column()
+            if column == 0:
+                return f"{MONTHS_PT[dt.month - 1]} de {dt.year}"
+            if column == 1:
+                return dt.strftime('%d/%m/%Y')
+            if column == 2:
+                return WEEKDAYS_PT[dt.weekday()]
+            return dt.strftime('%H:%M')
+        if role == Qt.ItemDataRole.UserRole:
+            return checkin['id']
+        return None
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+            and 0 <= section < len(self.COLUMNS)
+        ):
+            return self.COLUMNS[section]
+        return None
@@ -1,20 +1,52 @@
 """Tela do dashboard de atividade."""
 
-from datetime import datetime
+from collections import deque
+from datetime import date, datetime
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QTextBrowser, QDialog, QTableWidget,
-    QTableWidgetItem, QHeaderView, QMessageBox
+    QTableWidgetItem, QHeaderView, QMessageBox, QComboBox
+)
+from PyQt6.QtCore import Qt, pyqtSignal
+
+from src.config import DASHBOARD_LAST_CHECKINS, DASHBOARD_STATS_DAYS
+from src.core.events import CHECKIN_ADDED, CHECKIN_DELETED
+from src.ui.widgets import FrequencyChart
+
+# Opções do gráfico de frequência: (valor, texto exibido)
+CHART_GRANULARITIES = (
+    ('dia', "Por dia"),
+    ('semana', "Por semana"),
+    ('hora', "Por hora do dia"),
+)
+CHART_WINDOWS = (
+    (7, "Últimos 7 dias"),
+    (30, "Últimos 30 dias"),
+    (90, "Últimos 90 dias"),
+    (365, "Último ano"),
+    (3 * 365, "Últimos 3 anos"),
 )
-from PyQt6.QtCore import Qt
 
 
 class DashboardScreen(QWidget):
     """Tela do dashboard de atividade."""
     
+    # Emitido quando o período ou o agrupamento do gráfico muda
+    chart_options_changed = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
+        # Estado exibido: carregado do banco por update_dashboard() e mantido
+        # em dia pelos eventos de check-in (apply_event) entre as recargas
+        self._checkins_today = 0
+        self._period_total = 0
+        self._last_checkins = deque(maxlen=DASHBOARD_LAST_CHECKINS)
+        self._chart_granularity = None
+        self._loaded_day = None
+        self._stale = True
+        self._reloading = False
+        self._events_during_reload = False
         self._setup_ui()
     
     def _setup_ui(self):
@@ -57,6 +89,12 @@ class DashboardScreen(QWidget):
             card_layout.addWidget(self.view_checkins_button)
 
         stats_layout.addWidget(checkins_today_card)
+
+        # Card para o total do período
+        checkins_period_card = self._create_stat_card(f"Check-ins ({DASHBOARD_STATS_DAYS} dias)", "0")
+        self.checkins_period_label = checkins_period_card.findChild(QLabel, "stat_value")
+        stats_layout.addWidget(checkins_period_card)
+
         layout.addLayout(stats_layout)
 
         # Lista de Últimos Check-ins
@@ -68,12 +106,30 @@ class DashboardScreen(QWidget):
         self.last_checkins_browser.setMinimumHeight(150)
         layout.addWidget(self.last_checkins_browser)
 
-        # Placeholder para o gráfico
-        graph_label = QLabel("Gráfico de Frequência (Em breve)")
-        graph_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        graph_label.setStyleSheet("font-size: 16px; color: #888;")
-        layout.addWidget(graph_label)
-        layout.addStretch()
+        # Gráfico de frequência, com seletores de agrupamento e período
+        chart_header = QHBoxLayout()
+        chart_label = QLabel("Frequência de Check-ins")
+        chart_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
+        chart_header.addWidget(chart_label)
+        chart_header.addStretch()
+
+        self.granularity_combo = QComboBox()
+        for value, text in CHART_GRANULARITIES:
+            self.granularity_combo.addItem(text, value)
+        chart_header.addWidget(self.granularity_combo)
+
+        self.window_combo = QComboBox()
+        for days, text in CHART_WINDOWS:
+            self.window_combo.addItem(text, days)
+        self.window_combo.setCurrentIndex(1)
+        chart_header.addWidget(self.window_combo)
+
+        self.granularity_combo.currentIndexChanged.connect(lambda _: self.chart_options_changed.emit())
+        self.window_combo.currentIndexChanged.connect(lambda _: self.chart_options_changed.emit())
+        layout.addLayout(chart_header)
+
+        self.frequency_chart = FrequencyChart()
+        layout.addWidget(self.frequency_chart, 1)
 
     def _create_stat_card(self, title: str, initial_value: str) -> QWidget:
         """Cria um card de estatística para o dashboard."""
@@ -102,17 +158,132 @@ class DashboardScreen(QWidget):
         
         return card
 
+    @property
+    def chart_granularity(self) -> str:
+        """Agrupamento selecionado para o gráfico ('dia', 'semana' ou 'hora')."""
+        return self.granularity_combo.currentData()
+
+    @property
+    def chart_days(self) -> int:
+        """Período selecionado para o gráfico, em dias (incluindo hoje)."""
+        return self.window_combo.currentData()
+
+    @property
+    def needs_reload(self) -> bool:
+        """True se os dados exibidos precisam ser buscados de novo no banco."""
+        return self._stale or self._loaded_day != date.today()
+
+    def mark_stale(self):
+        """Marca os dados exibidos como desatualizados (ex: reconciliação periódica)."""
+        self._stale = True
+
+    def begin_reload(self):
+        """
+        Avisa que uma busca completa dos dados começou. Eventos recebidos
+        até o fim dela podem ou não estar no resultado, então são
+        descartados e o dashboard fica marcado para a próxima recarga.
+        """
+        self._reloading = True
+        self._events_during_reload = False
+
     def update_dashboard(self, data: dict):
         """Atualiza a UI do dashboard com novos dados."""
-        self.checkins_today_label.setText(str(data.get("checkins_today", 0)))
+        self._reloading = False
+        self._stale = self._events_during_reload
+        self._loaded_day = date.today()
+
+        self._checkins_today = data.get("checkins_today", 0)
+        daily_checkins = data.get("daily_checkins", [])
+        self._period_total = sum(day.get('total', 0) for day in daily_checkins)
+        self._last_checkins = deque(data.get("last_checkins", []), maxlen=DASHBOARD_LAST_CHECKINS)
+
+        chart = data.get("frequency_chart")
+        if chart is not None:
+            self._chart_granularity = chart.get("granularity")
+            self.frequency_chart.set_data(chart.get("labels", []), chart.get("totals", []))
+
+        self._render_counters()
+        self._render_last_checkins()
+
+    def apply_event(self, event_type: str, payload: dict):
+        """
+        Aplica um evento de src.core.events ao que já está exibido, sem
+        consultar o banco.
         
-        last_checkins = data.get("last_checkins", [])
+        Args:
+            event_type: CHECKIN_ADDED ou CHECKIN_DELETED
+            payload: Dados do evento
+        """
+        if self._loaded_day is None:
+            return  # Nada carregado ainda; a primeira busca trará o estado atual
+        if self._reloading:
+            self._events_during_reload = True
+            return
+        if self._loaded_day != date.today():
+            self._stale = True
+            return
+
+        if event_type == CHECKIN_ADDED:
+            self._apply_checkin_added(payload)
+        elif event_type == CHECKIN_DELETED:
+            self._apply_checkin_deleted(payload)
+
+    def _apply_checkin_added(self, checkin: dict):
+        checkin_datetime = datetime.fromisoformat(checkin['checkin_datetime'])
+        if checkin_datetime.date() != date.today():
+            # Check-in retroativo: totais e gráfico só na próxima recarga
+            self._stale = True
+        else:
+            self._change_today_totals(checkin_datetime, 1)
+
+        # Mantém a lista dos últimos check-ins em ordem, do mais recente ao mais antigo
+        entries = sorted(
+            list(self._last_checkins) + [checkin],
+            key=lambda entry: entry['checkin_datetime'],
+            reverse=True
+        )
+        self._last_checkins = deque(entries[:DASHBOARD_LAST_CHECKINS], maxlen=DASHBOARD_LAST_CHECKINS)
+        self._render_last_checkins()
+
+    def _apply_checkin_deleted(self, payload: dict):
+        entry = next((entry for entry in self._last_checkins if entry.get('id') == payload['id']), None)
+        if entry is not None:
+            self._last_checkins.remove(entry)
+            self._render_last_checkins()
+            # O check-in seguinte da lista só é conhecido consultando o banco
+            self._stale = True
+
+        timestamp = payload.get('checkin_datetime') or (entry or {}).get('checkin_datetime')
+        checkin_datetime = datetime.fromisoformat(timestamp) if timestamp else None
+        if checkin_datetime is not None and checkin_datetime.date() == date.today():
+            self._change_today_totals(checkin_datetime, -1)
+        else:
+            # Data desconhecida ou check-in de outro dia: totais e gráfico
+            # só na próxima recarga
+            self._stale = True
+
+    def _change_today_totals(self, checkin_datetime: datetime, delta: int):
+        """Soma `delta` aos contadores e à barra do gráfico que contém um check-in de hoje."""
+        self._checkins_today = max(self._checkins_today + delta, 0)
+        self._period_total = max(self._period_total + delta, 0)
+        if self._chart_granularity == 'hora':
+            self.frequency_chart.add_to_bar(checkin_datetime.hour, delta)
+        elif self._chart_granularity in ('dia', 'semana'):
+            # O período do gráfico termina hoje: a última barra é a de hoje (ou desta semana)
+            self.frequency_chart.add_to_bar(-1, delta)
+        self._render_counters()
+
+    def _render_counters(self):
+        self.checkins_today_label.setText(str(self._checkins_today))
+        self.checkins_period_label.setText(str(self._period_total))
+
+    def _render_last_checkins(self):
         html = ""
-        if not last_checkins:
+        if not self._last_checkins:
             html = "<p style='color: #888;'>Nenhum check-in recente.</p>"
         else:
             html = "<ul style='list-style-type: none; padding-left: 0;'>"
-            for checkin in last_checkins:
+            for checkin in self._last_checkins:
                 nome = checkin.get('nome')
                 dt_str = checkin.get('checkin_datetime')
                 dt_obj = datetime.fromisoformat(dt_str)
@@ -123,15 +294,18 @@ class DashboardScreen(QWidget):
 
     def show_error(self, error_message: str):
         """Exibe um erro no dashboard."""
+        self._reloading = False
+        self._stale = True
         self.last_checkins_browser.setHtml(f"<p style='color: #FF6B6B;'>{error_message}</p>")
 
-    def show_checkins_details(self):
-        """Mostra uma janela com os detalhes dos check-ins de hoje."""
+    def show_checkins_details(self, checkins: list):
+        """
+        Mostra uma janela com os detalhes dos check-ins de hoje.
+        
+        Args:
+            checkins: Check-ins de hoje (buscados fora da thread da GUI)
+        """
         try:
-            from src.data.data_provider import get_checkins_today_details
-
-            checkins = get_checkins_today_details()
-
             if not checkins:
                 QMessageBox.information(self, "Check-ins de Hoje", "Nenhum check-in registrado hoje.")
                 return
@@ -178,4 +352,4 @@ class DashboardScreen(QWidget):
             dialog.exec()
 
         except Exception as e:
-            QMessageBox.critical(self, "Erro", f"Erro ao buscar detalhes dos check-ins: {e}")
+            QMessageBox.critical(self, "Erro", f"Erro ao exibir detalhes dos check-ins: {e}")
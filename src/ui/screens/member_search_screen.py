@@ -1,15 +1,14 @@
 """Tela de busca de membros."""
 
-from datetime import datetime
-
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QPushButton, QListWidget, QListWidgetItem,
-    QTextBrowser, QTabWidget
+    QTextBrowser, QTabWidget, QTreeView, QAbstractItemView
 )
 from PyQt6.QtCore import Qt
 
 from src.config import PLANOS_COM_VENCIMENTO
+from src.ui.models import CheckinHistoryModel
 
 
 class MemberSearchScreen(QWidget):
@@ -18,6 +17,7 @@ class MemberSearchScreen(QWidget):
     def __init__(self):
         super().__init__()
         self.current_member_data = None  # Armazena os dados do membro atual
+        self.history_total = 0  # Total de check-ins do membro do histórico
         self._setup_ui()
     
     def _setup_ui(self):
@@ -162,12 +162,69 @@ class MemberSearchScreen(QWidget):
         
         self.member_tabs.addTab(info_tab_container, "Informações")
         
-        # Aba 2: Histórico de Frequência
-        self.member_history_browser = QTextBrowser()
-        self.member_history_browser.setOpenExternalLinks(False)
-        self.member_history_browser.setHtml("<p style='color: #888888;'>Selecione um membro para ver o histórico.</p>")
-        self.member_history_browser.anchorClicked.connect(self._on_history_link_clicked)
-        self.member_tabs.addTab(self.member_history_browser, "Histórico de Frequência")
+        # Aba 2: Histórico de Frequência (lista carregada por páginas ao rolar)
+        history_tab_container = QWidget()
+        history_tab_layout = QVBoxLayout(history_tab_container)
+        history_tab_layout.setContentsMargins(10, 10, 10, 10)
+        
+        self.history_title_label = QLabel("Selecione um membro para ver o histórico.")
+        self.history_title_label.setStyleSheet("color: #888888; font-size: 14px;")
+        history_tab_layout.addWidget(self.history_title_label)
+        
+        self.history_total_label = QLabel("")
+        self.history_total_label.setStyleSheet("color: #333333;")
+        history_tab_layout.addWidget(self.history_total_label)
+        
+        self.history_model = CheckinHistoryModel(parent=self)
+        self.history_view = QTreeView()
+        self.history_view.setModel(self.history_model)
+        self.history_view.setRootIsDecorated(False)
+        self.history_view.setUniformRowHeights(True)  # Só as linhas visíveis são medidas
+        self.history_view.setAlternatingRowColors(True)
+        self.history_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.history_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.history_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.history_view.setStyleSheet("""
+            QTreeView {
+                background-color: #FFFFFF;
+                alternate-background-color: #F0F0F0;
+                color: #333333;
+                border: 1px solid #CCCCCC;
+                font-size: 14px;
+            }
+            QTreeView::item:selected {
+                background-color: #007ACC;
+                color: white;
+            }
+        """)
+        self.history_view.selectionModel().selectionChanged.connect(
+            self._on_history_selection_changed
+        )
+        history_tab_layout.addWidget(self.history_view)
+        
+        delete_button_layout = QHBoxLayout()
+        delete_button_layout.addStretch()
+        self.delete_checkin_button = QPushButton("🗑️ Deletar check-in")
+        self.delete_checkin_button.setStyleSheet("""
+            QPushButton {
+                color: #FF6B6B;
+                font-weight: bold;
+                background: #FFE5E5;
+                border: none;
+                border-radius: 4px;
+                padding: 6px 12px;
+            }
+            QPushButton:disabled {
+                color: #BBBBBB;
+                background: #F0F0F0;
+            }
+        """)
+        self.delete_checkin_button.setEnabled(False)
+        self.delete_checkin_button.clicked.connect(self._on_delete_checkin_clicked)
+        delete_button_layout.addWidget(self.delete_checkin_button)
+        history_tab_layout.addLayout(delete_button_layout)
+        
+        self.member_tabs.addTab(history_tab_container, "Histórico de Frequência")
         
         right_layout.addWidget(self.member_tabs)
         
@@ -240,10 +297,45 @@ class MemberSearchScreen(QWidget):
         self.member_result_browser.setHtml(html)
         self.edit_button.setVisible(True)  # Mostra o botão de editar
     
-    def display_member_history(self, member_id: int, member_name: str, history: list):
-        """Exibe o histórico do membro."""
-        html = self._format_member_history(member_name, history)
-        self.member_history_browser.setHtml(html)
+    def display_member_history(self, member_id: int, member_name: str):
+        """
+        Passa a exibir o histórico do membro; a primeira página é pedida
+        pelo modelo (fetch_requested) e as seguintes, ao rolar a lista.
+        
+        Args:
+            member_id: ID do membro
+            member_name: Nome exibido no título
+        """
+        self.history_title_label.setText(f"Histórico de Frequência: {member_name}")
+        self.history_title_label.setStyleSheet("color: #007ACC; font-weight: bold; font-size: 14px;")
+        self.history_total_label.setText("Carregando...")
+        self.history_total_label.setStyleSheet("color: #333333;")
+        self.history_model.set_member(member_id)
+        self.history_model.fetchMore()
+    
+    def set_history_total(self, member_id: int, total: int):
+        """Exibe o total de check-ins do membro (se ainda for o membro exibido)."""
+        if member_id != self.history_model.member_id:
+            return
+        self.history_total = total
+        if total:
+            self.history_total_label.setText(f"Total de check-ins: {total}")
+        else:
+            self.history_total_label.setText("Nenhum check-in registrado ainda.")
+    
+    def remove_checkin_from_history(self, checkin_id: int):
+        """Retira da lista um check-in excluído, sem recarregar o histórico."""
+        if self.history_model.remove_checkin(checkin_id):
+            self.set_history_total(self.history_model.member_id, max(self.history_total - 1, 0))
+    
+    def show_history_error(self, message: str = ""):
+        """Mostra o erro ao carregar o histórico."""
+        self.history_model.fetch_failed(self.history_model.member_id)
+        text = "Erro ao carregar histórico"
+        if message:
+            text += f": {message}"
+        self.history_total_label.setText(text)
+        self.history_total_label.setStyleSheet("color: #FF6B6B;")
     
     def show_error(self):
         """Mostra mensagem de erro."""
@@ -252,11 +344,9 @@ class MemberSearchScreen(QWidget):
                 <h3 style="color: #FF6B6B;">Erro ao carregar dados</h3>
             </div>
         """)
-        self.member_history_browser.setHtml("""
-            <div style="text-align: center; padding: 20px;">
-                <h3 style="color: #FF6B6B;">Erro ao carregar histórico</h3>
-            </div>
-        """)
+        self.history_model.set_member(None)
+        self.history_total_label.setText("Erro ao carregar histórico")
+        self.history_total_label.setStyleSheet("color: #FF6B6B;")
         self.edit_button.setVisible(False)
     
     def open_edit_dialog(self):
@@ -273,18 +363,18 @@ class MemberSearchScreen(QWidget):
         
         dialog.exec()
     
-    def _on_history_link_clicked(self, url):
-        """Manipula cliques em links no histórico."""
-        from PyQt6.QtCore import QUrl
-        
-        url_str = url.toString() if isinstance(url, QUrl) else str(url)
-        
-        # Verifica se é um link de deletar
-        if url_str.startswith("delete:"):
-            checkin_id = int(url_str.split(":")[1])
-            # Emite um sinal ou chama diretamente o controller
-            # Por enquanto, vamos armazenar o ID para ser tratado externamente
-            self.request_delete_checkin(checkin_id)
+    def _on_history_selection_changed(self, *args):
+        """Habilita o botão de deletar quando há um check-in selecionado."""
+        self.delete_checkin_button.setEnabled(self.history_view.selectionModel().hasSelection())
+    
+    def _on_delete_checkin_clicked(self):
+        """Solicita a exclusão do check-in selecionado no histórico."""
+        rows = self.history_view.selectionModel().selectedRows()
+        if not rows:
+            return
+        checkin = self.history_model.checkin_at(rows[0].row())
+        if checkin:
+            self.request_delete_checkin(checkin['id'])
     
     def request_delete_checkin(self, checkin_id: int):
         """
@@ -370,89 +460,3 @@ class MemberSearchScreen(QWidget):
         """
         
         return html
-    
-    def _format_member_history(self, member_name: str, history: list) -> str:
-        """Formata o histórico do membro em HTML."""
-        if not history:
-            return f"""
-                <div style="padding: 20px;">
-                    <h3 style="color: #007ACC;">Histórico de {member_name}</h3>
-                    <p style="color: #888888; font-style: italic;">
-                        Nenhum check-in registrado ainda.
-                    </p>
-                </div>
-            """
-        
-        html = f"""
-            <div style="padding: 20px; font-family: 'Segoe UI', Arial, sans-serif;">
-                <h3 style="color: #007ACC; margin-bottom: 15px;">
-                    Histórico de Frequência: {member_name}
-                </h3>
-                <p style="color: #333333; margin-bottom: 20px;">
-                    Total de check-ins: <strong style="color: #007ACC;">{len(history)}</strong>
-                </p>
-                <div style="max-height: 500px; overflow-y: auto;">
-        """
-        
-        # Agrupar por mês/ano
-        months_pt = {
-            'January': 'Janeiro', 'February': 'Fevereiro', 'March': 'Março',
-            'April': 'Abril', 'May': 'Maio', 'June': 'Junho',
-            'July': 'Julho', 'August': 'Agosto', 'September': 'Setembro',
-            'October': 'Outubro', 'November': 'Novembro', 'December': 'Dezembro'
-        }
-        
-        days_pt = {
-            'Monday': 'Segunda-feira', 'Tuesday': 'Terça-feira',
-            'Wednesday': 'Quarta-feira', 'Thursday': 'Quinta-feira',
-            'Friday': 'Sexta-feira', 'Saturday': 'Sábado', 'Sunday': 'Domingo'
-        }
-        
-        grouped = {}
-        for checkin in history:
-            checkin_dt = datetime.fromisoformat(checkin['checkin_datetime'])
-            month_name = checkin_dt.strftime('%B')
-            month_pt = months_pt.get(month_name, month_name)
-            month_year = f"{month_pt} de {checkin_dt.year}"
-            
-            if month_year not in grouped:
-                grouped[month_year] = []
-            grouped[month_year].append(checkin)
-        
-        for month_year, checkins in grouped.items():
-            html += f"""
-                <div style="margin-bottom: 20px;">
-                    <h4 style="color: #007ACC; margin-bottom: 10px;">{month_year}</h4>
-                    <div style="margin-left: 15px;">
-            """
-            
-            for checkin_data in checkins:
-                dt = datetime.fromisoformat(checkin_data['checkin_datetime'])
-                checkin_id = checkin_data['id']
-                day_name = dt.strftime('%A')
-                date_str = dt.strftime('%d/%m/%Y')
-                time_str = dt.strftime('%H:%M')
-                day_name_pt = days_pt.get(day_name, day_name)
-                
-                html += f"""
-                    <div style="margin-bottom: 8px; padding: 8px; background: #F0F0F0; border-radius: 4px; display: flex; justify-content: space-between; align-items: center;">
-                        <div>
-                            <span style="color: #333333;">📅 {day_name_pt}</span>
-                            <span style="color: #555555; margin-left: 10px;">{date_str}</span>
-                            <span style="color: #007ACC; margin-left: 10px;">⏰ {time_str}</span>
-                        </div>
-                        <a href="delete:{checkin_id}" style="color: #FF6B6B; text-decoration: none; font-weight: bold; padding: 4px 8px; background: #FFE5E5; border-radius: 4px;">🗑️ Deletar</a>
-                    </div>
-                """
-            
-            html += """
-                    </div>
-                </div>
-            """
-        
-        html += """
-                </div>
-            </div>
-        """
-        
-        return html
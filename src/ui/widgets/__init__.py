@@ -0,0 +1,5 @@
+"""Componentes visuais reutilizáveis."""
+
+from .frequency_chart import FrequencyChart
+
+__all__ = ['FrequencyChart']
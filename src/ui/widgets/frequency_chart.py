@@ -0,0 +1,153 @@
+"""Gráfico de barras da frequência de check-ins."""
+
+from typing import List, Sequence
+
+from PyQt6.QtWidgets import QWidget, QToolTip
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPainter, QColor, QPen
+
+
+class FrequencyChart(QWidget):
+    """
+    Gráfico de barras desenhado com QPainter (sem dependências extras).
+    Os rótulos do eixo horizontal são espaçados para não se sobreporem, e
+    o total de cada barra aparece ao passar o mouse sobre ela.
+    """
+    
+    BAR_COLOR = QColor("#007ACC")
+    HOVER_COLOR = QColor("#005C99")
+    AXIS_COLOR = QColor("#BBBBBB")
+    TEXT_COLOR = QColor("#555555")
+    
+    # Margens (px) para os rótulos dos eixos
+    MARGIN_LEFT = 40
+    MARGIN_BOTTOM = 24
+    MARGIN_TOP = 10
+    MARGIN_RIGHT = 10
+    
+    # Espaço mínimo (px) entre rótulos do eixo horizontal
+    MIN_LABEL_SPACING = 48
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._labels: List[str] = []
+        self._totals: List[int] = []
+        self._hover_index = -1
+        self.setMinimumHeight(220)
+        self.setMouseTracking(True)
+    
+    def set_data(self, labels: Sequence[str], totals: Sequence[int]):
+        """
+        Define as barras do gráfico.
+        
+        Args:
+            labels: Rótulo de cada barra
+            totals: Valor de cada barra
+        """
+        self._labels = list(labels)
+        self._totals = [int(total) for total in totals]
+        self._hover_index = -1
+        self.update()
+    
+    def add_to_bar(self, index: int, delta: int):
+        """
+        Soma `delta` ao valor de uma barra (atualização incremental, ex: um
+        check-in registrado agora).
+        
+        Args:
+            index: Índice da barra (negativo conta a partir do fim)
+            delta: Valor a somar
+        """
+        if -len(self._totals) <= index < len(self._totals):
+            self._totals[index] = max(self._totals[index] + delta, 0)
+            self.update()
+    
+    def _plot_rect(self) -> QRectF:
+        """Área das barras, descontadas as margens dos eixos."""
+        return QRectF(
+            self.MARGIN_LEFT,
+            self.MARGIN_TOP,
+            max(self.width() - self.MARGIN_LEFT - self.MARGIN_RIGHT, 1),
+            max(self.height() - self.MARGIN_TOP - self.MARGIN_BOTTOM, 1)
+        )
+    
+    def _bar_index_at(self, x: float) -> int:
+        """Índice da barra na posição horizontal x (ou -1)."""
+        plot = self._plot_rect()
+        if not self._totals or not plot.left() <= x < plot.right():
+            return -1
+        return int((x - plot.left()) / plot.width() * len(self._totals))
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        plot = self._plot_rect()
+        
+        if not self._totals:
+            painter.setPen(self.TEXT_COLOR)
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Nenhum check-in no período.")
+            return
+        
+        peak = max(max(self._totals), 1)
+        bar_width = plot.width() / len(self._totals)
+        gap = min(bar_width * 0.2, 4)
+        
+        # Eixos e valor máximo
+        painter.setPen(QPen(self.AXIS_COLOR, 1))
+        painter.drawLine(plot.bottomLeft(), plot.bottomRight())
+        painter.drawLine(plot.bottomLeft(), plot.topLeft())
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(
+            QRectF(0, plot.top() - 6, self.MARGIN_LEFT - 6, 14),
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            str(peak)
+        )
+        painter.drawText(
+            QRectF(0, plot.bottom() - 8, self.MARGIN_LEFT - 6, 14),
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            "0"
+        )
+        
+        # Barras
+        painter.setPen(Qt.PenStyle.NoPen)
+        for index, total in enumerate(self._totals):
+            if total <= 0:
+                continue
+            height = plot.height() * total / peak
+            painter.setBrush(self.HOVER_COLOR if index == self._hover_index else self.BAR_COLOR)
+            painter.drawRect(QRectF(
+                plot.left() + index * bar_width + gap / 2,
+                plot.bottom() - height,
+                max(bar_width - gap, 1),
+                height
+            ))
+        
+        # Rótulos do eixo horizontal, a cada `step` barras
+        step = max(1, int(self.MIN_LABEL_SPACING / bar_width + 0.999))
+        painter.setPen(self.TEXT_COLOR)
+        for index in range(0, len(self._labels), step):
+            center = plot.left() + (index + 0.5) * bar_width
+            painter.drawText(
+                QRectF(center - self.MIN_LABEL_SPACING / 2, plot.bottom() + 4, self.MIN_LABEL_SPACING, 16),
+                Qt.AlignmentFlag.AlignCenter,
+                self._labels[index]
+            )
+    
+    def mouseMoveEvent(self, event):
+        index = self._bar_index_at(event.position().x())
+        if index != self._hover_index:
+            self._hover_index = index
+            self.update()
+        if index >= 0:
+            QToolTip.showText(
+                event.globalPosition().toPoint(),
+                f"{self._labels[index]}: {self._totals[index]} check-in(s)",
+                self
+            )
+        else:
+            QToolTip.hideText()
+    
+    def leaveEvent(self, event):
+        self._hover_index = -1
+        self.update()
+        super().leaveEvent(event)
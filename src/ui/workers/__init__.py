@@ -4,10 +4,12 @@ from .data_fetch_worker import DataFetchWorker
 from .database_connection_worker import DatabaseConnectionWorker
 from .member_search_worker import MemberSearchWorker
 from .dashboard_worker import DashboardWorker
+from .task_runner import TaskRunner
 
 __all__ = [
     'DataFetchWorker',
     'DatabaseConnectionWorker',
     'MemberSearchWorker',
-    'DashboardWorker'
+    'DashboardWorker',
+    'TaskRunner'
 ]
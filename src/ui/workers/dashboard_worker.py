@@ -1,7 +1,11 @@
 """Worker para dados do dashboard."""
 
+from datetime import date, timedelta
+
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from src.config import DASHBOARD_LAST_CHECKINS, DASHBOARD_STATS_DAYS
+
 
 class DashboardWorker(QThread):
     """Thread para buscar dados do dashboard."""
@@ -9,21 +13,42 @@ class DashboardWorker(QThread):
     dashboard_updated = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, manager):
+    def __init__(self, manager, chart_days: int = DASHBOARD_STATS_DAYS, chart_granularity: str = 'dia'):
         super().__init__()
         self.manager = manager
+        self.chart_days = chart_days
+        self.chart_granularity = chart_granularity
     
     def run(self):
         """Executa a busca de dados do dashboard."""
         try:
-            from src.data.data_provider import get_checkins_today, get_last_checkins
+            from src.data.data_provider import (
+                get_checkin_stats, get_checkins_today, get_hourly_checkin_counts, get_last_checkins
+            )
+            # NumPy só é carregado aqui, fora da inicialização do aplicativo
+            from src.data.checkin_aggregation import aggregate_checkins
             
             checkins_count = get_checkins_today()
-            last_checkins = get_last_checkins(5)
+            last_checkins = get_last_checkins(DASHBOARD_LAST_CHECKINS)
+            
+            # Totais por dia, lidos da tabela de totais diários (O(dias) linhas)
+            end_day = date.today() + timedelta(days=1)
+            daily_checkins = get_checkin_stats(end_day - timedelta(days=DASHBOARD_STATS_DAYS), end_day)
+            
+            # Gráfico: totais por hora (colunas) agrupados de forma vetorizada
+            chart_start = end_day - timedelta(days=self.chart_days)
+            hours, totals = get_hourly_checkin_counts(chart_start, end_day)
+            labels, counts = aggregate_checkins(hours, totals, self.chart_granularity, chart_start, end_day)
             
             dashboard_data = {
                 "checkins_today": checkins_count,
-                "last_checkins": last_checkins
+                "last_checkins": last_checkins,
+                "daily_checkins": daily_checkins,
+                "frequency_chart": {
+                    "labels": labels,
+                    "totals": counts.tolist(),
+                    "granularity": self.chart_granularity
+                }
             }
             self.dashboard_updated.emit(dashboard_data)
             
@@ -13,9 +13,16 @@ class DatabaseConnectionWorker(QThread):
     status_updated = pyqtSignal(str)
     connection_completed = pyqtSignal(bool)
     
-    def __init__(self):
-        """Inicializa o worker."""
+    def __init__(self, search_service=None):
+        """
+        Inicializa o worker.
+        
+        Args:
+            search_service: Instância do MemberSearchService cujo índice de
+                nomes será carregado após a conexão (opcional)
+        """
         super().__init__()
+        self.search_service = search_service
     
     def run(self):
         """Executa a conexão com a fonte de dados."""
@@ -38,13 +45,16 @@ class DatabaseConnectionWorker(QThread):
             # Tenta inicializar o provider
             provider = get_provider()
 
-            if USE_SQLITE:
+            if provider.backend.supports_writes:
                 self.status_updated.emit("Verificando e atualizando planos expirados...")
-                # A instância do provider é o DatabaseManager
                 updated_count = provider.update_expired_plans()
                 if updated_count > 0:
                     self.status_updated.emit(f"{updated_count} plano(s) atualizado(s) para INATIVO.")
             
+            if self.search_service:
+                self.status_updated.emit("Indexando nomes dos membros...")
+                self.search_service.build_index()
+            
             self.status_updated.emit("Conexão estabelecida com sucesso!")
             self.connection_completed.emit(True)
             
@@ -1,36 +1,93 @@
 """Worker para buscar membros."""
 
+import queue
+
 from PyQt6.QtCore import QThread, pyqtSignal
 
 
 class MemberSearchWorker(QThread):
-    """Thread para buscar membros sem travar a GUI."""
+    """
+    Thread de longa duração para buscar membros sem travar a GUI.
+    
+    As buscas são enfileiradas com request_search() e atendidas em ordem.
+    Cada pedido carrega um canal (a tela que pediu) e um número de geração:
+    pedidos antigos de um canal que já tem um pedido mais novo na fila são
+    descartados sem consultar os dados, e quem recebe o resultado compara a
+    geração com a última pedida para ignorar respostas atrasadas.
+    """
     
     # Sinais
     status_updated = pyqtSignal(str)
-    search_completed = pyqtSignal(list)  # Retorna lista de resultados
+    search_completed = pyqtSignal(str, int, list)  # canal, geração, resultados
     
-    def __init__(self, search_service, search_term):
+    def __init__(self, search_service):
         """
         Inicializa o worker.
         
         Args:
             search_service: Instância do MemberSearchService
-            search_term: Termo de busca
         """
         super().__init__()
         self.search_service = search_service
-        self.search_term = search_term
+        self._requests = queue.Queue()
     
-    def run(self):
-        """Executa a busca de membro por nome."""
-        self.status_updated.emit("Buscando...")
+    def request_search(self, channel: str, generation: int, search_term: str):
+        """
+        Enfileira uma busca (pode ser chamado da thread da GUI).
         
-        # Busca por nome retorna lista de resultados
-        results = self.search_service.search_by_name(self.search_term)
-        if results:
-            self.status_updated.emit(f"{len(results)} resultado(s) encontrado(s)!")
-            self.search_completed.emit(results)
-        else:
-            self.status_updated.emit("Nenhum membro encontrado.")
-            self.search_completed.emit([])
+        Args:
+            channel: Identificador de quem pediu a busca (ex: 'checkin')
+            generation: Número crescente do pedido dentro do canal
+            search_term: Termo de busca
+        """
+        self._requests.put((channel, generation, search_term))
+    
+    def stop(self):
+        """Pede o encerramento da thread após a busca em andamento."""
+        self._requests.put(None)
+    
+    def _next_requests(self):
+        """
+        Aguarda o próximo pedido e recolhe os que já estão na fila,
+        mantendo apenas o mais recente de cada canal.
+        
+        Returns:
+            Lista de pedidos (canal, geração, termo) ou None para encerrar
+        """
+        pending = [self._requests.get()]
+        while True:
+            try:
+                pending.append(self._requests.get_nowait())
+            except queue.Empty:
+                break
+        
+        if None in pending:
+            return None
+        
+        latest = {}
+        for channel, generation, search_term in pending:
+            latest[channel] = (channel, generation, search_term)
+        return list(latest.values())
+    
+    def run(self):
+        """Atende os pedidos de busca por nome até stop() ser chamado."""
+        while True:
+            requests = self._next_requests()
+            if requests is None:
+                break
+            
+            for channel, generation, search_term in requests:
+                self.status_updated.emit("Buscando...")
+                
+                # Busca por nome retorna lista de resultados
+                try:
+                    results = self.search_service.search_by_name(search_term)
+                except Exception as e:
+                    print(f"Erro na busca por '{search_term}': {e}")
+                    results = []
+                
+                if results:
+                    self.status_updated.emit(f"{len(results)} resultado(s) encontrado(s)!")
+                else:
+                    self.status_updated.emit("Nenhum membro encontrado.")
+                self.search_completed.emit(channel, generation, results)
@@ -0,0 +1,146 @@
+"""Executor de tarefas em segundo plano para a interface."""
+
+from typing import Any, Callable, Dict, Optional, Set
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class TaskSignals(QObject):
+    """Sinais de uma tarefa; emitidos na thread do pool e entregues na da GUI."""
+
+    succeeded = pyqtSignal(object)  # resultado da função
+    failed = pyqtSignal(str)        # mensagem do erro
+    finished = pyqtSignal()
+
+
+class Task(QRunnable):
+    """Chamada de função executada por um QThreadPool."""
+
+    def __init__(self, func: Callable[..., Any], args: tuple, kwargs: dict):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        # O TaskRunner guarda a referência até o fim; o pool não apaga a tarefa
+        self.setAutoDelete(False)
+        # Criado na thread da GUI, então os sinais são entregues nela
+        self.signals = TaskSignals()
+        self.cancelled = False
+
+    def run(self):
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            print(f"Erro na tarefa em segundo plano ({getattr(self.func, '__name__', self.func)}): {e}")
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.succeeded.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+class TaskRunner(QObject):
+    """
+    Executa chamadas ao provedor de dados fora da thread da GUI, em um
+    QThreadPool, e entrega o resultado (ou o erro) em callbacks que rodam
+    na thread da GUI.
+
+    Tarefas com a mesma `key` (ex: 'member_details') substituem as
+    anteriores: se o usuário clica em outro membro antes da resposta
+    chegar, o resultado antigo é descartado, como nas gerações da busca.
+
+    `busy` indica se há tarefas em andamento; busy_changed é emitido quando
+    esse estado muda (para o cursor de espera, botões desabilitados etc.).
+    """
+
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, max_threads: Optional[int] = None, parent=None):
+        """
+        Inicializa o executor.
+
+        Args:
+            max_threads: Máximo de tarefas simultâneas (padrão: o do QThreadPool)
+            parent: QObject pai
+        """
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        if max_threads:
+            self.pool.setMaxThreadCount(max_threads)
+        self._tasks: Set[Task] = set()
+        self._latest: Dict[str, Task] = {}
+
+    @property
+    def busy(self) -> bool:
+        """True se há tarefas em andamento."""
+        return bool(self._tasks)
+
+    def run(
+        self,
+        func: Callable[..., Any],
+        *args,
+        on_success: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+        on_finished: Optional[Callable[[], None]] = None,
+        key: Optional[str] = None,
+        **kwargs
+    ) -> Task:
+        """
+        Agenda func(*args, **kwargs) no pool.
+
+        Args:
+            func: Função a executar (não deve tocar em widgets)
+            on_success: Chamado na thread da GUI com o retorno de func
+            on_error: Chamado na thread da GUI com a mensagem de erro
+            on_finished: Chamado na thread da GUI ao fim da tarefa, mesmo
+                se o resultado foi descartado
+            key: Identificador da tarefa; uma nova tarefa com a mesma chave
+                descarta o resultado das anteriores
+
+        Returns:
+            A tarefa agendada
+        """
+        task = Task(func, args, kwargs)
+        if key is not None:
+            previous = self._latest.get(key)
+            if previous is not None:
+                previous.cancelled = True
+            self._latest[key] = task
+
+        if on_success is not None:
+            task.signals.succeeded.connect(
+                lambda result: None if task.cancelled else on_success(result)
+            )
+        if on_error is not None:
+            task.signals.failed.connect(
+                lambda message: None if task.cancelled else on_error(message)
+            )
+        if on_finished is not None:
+            task.signals.finished.connect(on_finished)
+        task.signals.finished.connect(lambda: self._on_finished(task, key))
+
+        was_busy = self.busy
+        self._tasks.add(task)
+        if not was_busy:
+            self.busy_changed.emit(True)
+        self.pool.start(task)
+        return task
+
+    def _on_finished(self, task: Task, key: Optional[str]):
+        self._tasks.discard(task)
+        if key is not None and self._latest.get(key) is task:
+            del self._latest[key]
+        if not self._tasks:
+            self.busy_changed.emit(False)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """
+        Aguarda o fim das tarefas em andamento (ex: ao fechar a janela).
+
+        Args:
+            msecs: Tempo máximo de espera em ms (-1: sem limite)
+
+        Returns:
+            True se todas as tarefas terminaram
+        """
+        return self.pool.waitForDone(msecs)
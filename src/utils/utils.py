@@ -1,6 +1,7 @@
 """
 Funções utilitárias para o sistema.
 """
+import unicodedata
 from datetime import datetime
 from typing import Optional, Tuple
 from dateutil.relativedelta import relativedelta
@@ -37,6 +38,64 @@ def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     return None
 
 
+def to_iso_date(date_str: Optional[str]) -> Optional[str]:
+    """
+    Normaliza uma data para o formato de armazenamento ISO (AAAA-MM-DD).
+
+    Args:
+        date_str: String com a data em qualquer formato aceito por parse_date
+
+    Returns:
+        Data no formato ISO, None para valores vazios ou o texto original
+        se não for possível interpretá-lo (para não perder dados)
+    """
+    if not date_str or not str(date_str).strip():
+        return None
+
+    date_str = str(date_str).strip()
+    date_obj = parse_date(date_str)
+    if not date_obj:
+        return date_str
+    return date_obj.strftime('%Y-%m-%d')
+
+
+def format_date_br(date_str: Optional[str]) -> Optional[str]:
+    """
+    Converte uma data armazenada em ISO (AAAA-MM-DD) para exibição (DD/MM/AAAA).
+
+    Args:
+        date_str: String com a data
+
+    Returns:
+        Data no formato brasileiro ou o valor original se não for uma data ISO
+    """
+    if not date_str:
+        return date_str
+
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d').strftime('%d/%m/%Y')
+    except ValueError:
+        return date_str
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """
+    Normaliza um texto para comparação: remove acentos e ignora maiúsculas/minúsculas.
+
+    Args:
+        text: Texto original (ex: 'João')
+
+    Returns:
+        Texto normalizado (ex: 'joao')
+    """
+    if not text:
+        return ""
+
+    decomposed = unicodedata.normalize('NFKD', text)
+    without_accents = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return without_accents.casefold()
+
+
 def get_current_month_name() -> str:
     """
     Retorna o nome do mês atual em português.
@@ -154,6 +213,24 @@ def get_current_sheet_name() -> str:
     return f"{mes_abrev}/{ano_abrev}"
 
 
+def column_letter(col_index: int) -> str:
+    """
+    Converte o índice de uma coluna (zero-based, como config.COL_*) para a letra da planilha.
+    
+    Args:
+        col_index: Índice da coluna (ex: 0, 25, 66)
+    
+    Returns:
+        Letra(s) da coluna (ex: 'A', 'Z', 'BO')
+    """
+    letters = ''
+    col_index += 1
+    while col_index > 0:
+        col_index, remainder = divmod(col_index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
 def get_sheet_range(sheet_name: str, columns: str = 'A:BT') -> str:
     """
     Cria o range completo incluindo o nome da aba.